@@ -3,85 +3,82 @@
 # Variables are used to store data values.
 # Variables are created when they are first assigned a value.
 
-# example
-name = "John"
-age = 30
-is_active = True
 
-print(name)
-print(age)
-print(is_active)
+def main():
+    """Create and print variables of every basic data type."""
+    # example
+    name = "John"
+    age = 30
+    is_active = True
 
-# datatypes 
-# int, float, str, bool, list, tuple, dict, set, None,
+    print(name)
+    print(age)
+    print(is_active)
 
-# int => Integer (Whole Number)
-age = 30
-price = 10
-distence = 100
+    # datatypes 
+    # int, float, str, bool, list, tuple, dict, set, None,
 
-# float => Floating Point (Decimal Number)
-height = 5.9
-weight = 70.5
+    # int => Integer (Whole Number)
+    age = 30
+    price = 10
+    distence = 100
 
+    # float => Floating Point (Decimal Number)
+    height = 5.9
+    weight = 70.5
 
-# str => String (Text)  
-name = "John"
-address = "123 Main St"
-phone = "123-456-7890"
 
+    # str => String (Text)  
+    name = "John"
+    address = "123 Main St"
+    phone = "123-456-7890"
 
-# bool => Boolean (True or False)
-is_active = True
-is_admin = False
-is_logged_in = True 
-is_active = None
 
-# list => List (Collection of Items in an ordered sequence )
-fruits = ["apple", "banana", "cherry"]
-numbers = [1, 2, 3, 4, 5]
-another_list = list()
+    # bool => Boolean (True or False)
+    is_active = True
+    is_admin = False
+    is_logged_in = True 
+    is_active = None
 
-print(fruits)
-print(numbers)
-print(another_list)
-print(is_active)
+    # list => List (Collection of Items in an ordered sequence )
+    fruits = ["apple", "banana", "cherry"]
+    numbers = [1, 2, 3, 4, 5]
+    another_list = list()
 
+    print(fruits)
+    print(numbers)
+    print(another_list)
+    print(is_active)
 
-# tuple => Tuple (Collection of Items in an ordered sequence ) and it is immutable (Cannot be changed) 
-fruits = ("apple", "banana", "cherry")
-numbers = (1, 2, 3, 4, 5)
-another_tuple = tuple()
-
-
-# dict => Dictionary (Collection of Key-Value Pairs) and it is mutable (Can be changed)  and it is ordered (Maintains the order of insertion)
-# key => unique identifier for a value
-# value => data associated with a key
-person = {"name": "John", "age": 30, "city": "New York"}
-another_dict = dict()   
-
-
-# set 
-# => Set (Collection of Items in an unordered sequence ) and it is mutable (Can be changed) and it is unordered (Does not maintain the order of insertion)
-# => Set is used to store unique items
-# => Set is faster than list
-# => Set is used to remove duplicates from a list
-fruits = {"apple", "banana", "cherry"}
-numbers = {1, 2, 3, 4, 5}
-another_set = set()
-
-
-# None => NoneType (Represents the absence of a value)
-# => None is used to represent the absence of a value
-
-none = None
 
+    # tuple => Tuple (Collection of Items in an ordered sequence ) and it is immutable (Cannot be changed) 
+    fruits = ("apple", "banana", "cherry")
+    numbers = (1, 2, 3, 4, 5)
+    another_tuple = tuple()
 
 
+    # dict => Dictionary (Collection of Key-Value Pairs) and it is mutable (Can be changed)  and it is ordered (Maintains the order of insertion)
+    # key => unique identifier for a value
+    # value => data associated with a key
+    person = {"name": "John", "age": 30, "city": "New York"}
+    another_dict = dict()   
 
 
+    # set 
+    # => Set (Collection of Items in an unordered sequence ) and it is mutable (Can be changed) and it is unordered (Does not maintain the order of insertion)
+    # => Set is used to store unique items
+    # => Set is faster than list
+    # => Set is used to remove duplicates from a list
+    fruits = {"apple", "banana", "cherry"}
+    numbers = {1, 2, 3, 4, 5}
+    another_set = set()
 
 
+    # None => NoneType (Represents the absence of a value)
+    # => None is used to represent the absence of a value
 
+    none = None
 
 
+if __name__ == "__main__":
+    main()
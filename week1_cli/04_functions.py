@@ -20,14 +20,36 @@ WHY FUNCTIONS MATTER:
 - Readability (self-documenting code)
 """
 
+import collections
+import csv
+import functools
+import heapq
+import itertools
+import json
+import sys
+import threading
+import time
+from array import array
+
+
+def _numpy():
+    """
+    Import NumPy on first use, or return None when it is not installed.
+
+    NumPy takes a noticeable fraction of a second to import, so it is
+    only loaded when calculate_bills actually needs it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
 
 # ==========================================
 # 1. BASIC FUNCTION DEFINITION & CALLING
 # ==========================================
 
-print("🍳 BASIC FUNCTIONS - Simple Recipes")
-print("=" * 40)
-
 # Function definition (for example its like a writing a recipe)
 
 def greet_customer():
@@ -40,17 +62,20 @@ def greet_customer():
     print("Welcome to Python Kitchen! 🏪")
     print("How can I help you today?")
 
-# Function call (like using the recipe to cook)
-greet_customer()
+
+def demo_basic_functions():
+    """Basic function definition and calling."""
+    print("🍳 BASIC FUNCTIONS - Simple Recipes")
+    print("=" * 40)
+
+    # Function call (like using the recipe to cook)
+    greet_customer()
 
 
 # ==========================================
 # 2. FUNCTIONS WITH PARAMETERS
 # ==========================================
 
-print("🍳 FUNCTIONS WITH PARAMETERS - Custom Recipes")
-print("=" * 40)
-
 # Function definition with parameters (like a recipe that takes ingredients)
 
 def greet_customer_name(name):
@@ -66,10 +91,6 @@ def greet_customer_name(name):
     print(f"Welcome to Python Kitchen, {name}! 🏪")
     print("How can I help you today?")
 
-print("👨‍🍳 Calling greet_customer_name('Alice'):")
-greet_customer_name("Alice")
-print()
-
 
 # Function with multiple parameters (optional quantity)
 
@@ -89,18 +110,25 @@ def prepare_order(customer_name, dish_name, quantity=1):
     print(f"   🍽️ {quantity}x {dish_name}")
     print("   ⏳ Preparing your order...")
 
-print("👨‍🍳 Calling prepare_order('Alice', 'Pizza', 2):")
-prepare_order("Alice", "Pizza", 2)
-print()
+
+def demo_parameters():
+    """Functions with parameters."""
+    print("🍳 FUNCTIONS WITH PARAMETERS - Custom Recipes")
+    print("=" * 40)
+
+    print("👨‍🍳 Calling greet_customer_name('Alice'):")
+    greet_customer_name("Alice")
+    print()
+
+    print("👨‍🍳 Calling prepare_order('Alice', 'Pizza', 2):")
+    prepare_order("Alice", "Pizza", 2)
+    print()
 
 
 # ==========================================
 # 3. FUNCTIONS WITH RETURN VALUES
 # ==========================================
 
-print("🍽️ FUNCTIONS WITH RETURN VALUES - Recipes That Produce Food")
-print("=" * 40)
-
 def calculate_bill(price_per_item, quantity, tax_rate=0.08):
     """
     Calculate the total bill including tax.
@@ -123,27 +151,124 @@ def calculate_bill(price_per_item, quantity, tax_rate=0.08):
     return total  # Give result back to caller
 
 
-# Using the return value
-print("🧾 Calculating bills:")
-bill1 = calculate_bill(1585.99, 2)  # Pizza
-bill2 = calculate_bill(850.50, 1, 0.10)  # With 10% tax
+def demo_return_values():
+    """Functions with return values."""
+    print("🍽️ FUNCTIONS WITH RETURN VALUES - Recipes That Produce Food")
+    print("=" * 40)
+
+    # Using the return value
+    print("🧾 Calculating bills:")
+    bill1 = calculate_bill(1585.99, 2)  # Pizza
+    bill2 = calculate_bill(850.50, 1, 0.10)  # With 10% tax
 
-print(f"🧾 Total for 2 pizzas: ${bill1:,.2f}") # Format the bill with 2 decimal places and a comma separator
-print(f"🧾 Total for 1 coffee with 10% tax: ${bill2:,.2f}") # Format the bill with 2 decimal places and a comma separator
-print()
+    print(f"🧾 Total for 2 pizzas: ${bill1:,.2f}") # Format the bill with 2 decimal places and a comma separator
+    print(f"🧾 Total for 1 coffee with 10% tax: ${bill2:,.2f}") # Format the bill with 2 decimal places and a comma separator
+    print()
 
 
 # ==========================================
 # 5. FUNCTION SCOPE (Local vs Global)
 # ==========================================
 
-print("🍳 FUNCTION SCOPE (Local vs Global) - Recipes That Produce Food")
-print("=" * 40)
+class OrderCounter:
+    """
+    A thread-safe order counter split into shards.
+
+    ANALOGY: Instead of every waiter queueing at one tally sheet,
+    each waiter gets their own sheet. The manager adds up all the
+    sheets when they want the total.
+
+    `counter += 1` on a plain global is read, add, write - two threads
+    can read the same old value and one order gets lost. Here each
+    thread is given its own shard (with its own lock) the first time it
+    counts, so threads rarely wait on each other. Reading the value
+    merges all shards.
+
+    Args:
+        shards (int): Number of separate tally sheets (default 16)
+    """
+
+    def __init__(self, shards=16):
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._counts = [0] * shards
+        self._next_shard = itertools.count()
+        self._local = threading.local()
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            # next() on itertools.count is atomic, so threads get distinct shards
+            shard = next(self._next_shard) % len(self._counts)
+            self._local.shard = shard
+            return shard
+
+    def increment(self, amount=1):
+        """Add amount to this thread's shard."""
+        shard = self._shard()
+        with self._locks[shard]:
+            self._counts[shard] += amount
+
+    @property
+    def approximate(self):
+        """
+        The total without taking any shard lock.
+
+        Cheap enough to read on every order. An increment running at the
+        same moment may not be counted yet - use value for the exact total.
+        """
+        return sum(self._counts)
+
+    @property
+    def value(self):
+        """The merged total of all shards."""
+        total = 0
+        for shard, lock in enumerate(self._locks):
+            with lock:
+                total += self._counts[shard]
+        return total
+
+    def reset(self):
+        """Set every shard back to zero (e.g. at the start of a new day)."""
+        for shard, lock in enumerate(self._locks):
+            with lock:
+                self._counts[shard] = 0
+
+
+class AsyncOrderCounter:
+    """
+    An order counter for asyncio code.
+
+    ANALOGY: The same shared tally sheet, but for waiters who
+    sometimes step away (await) in the middle of writing.
+
+    Inside one event loop `count += 1` is already safe, because
+    coroutines only switch at an await. increment() takes an
+    asyncio.Lock so it stays correct if counting ever needs to await
+    (e.g. saving the tally), without blocking the event loop.
+    """
+
+    def __init__(self):
+        import asyncio  # Only async code pays for importing asyncio
+
+        self._count = 0
+        self._lock = asyncio.Lock()
+
+    async def increment(self, amount=1):
+        """Add amount to the counter."""
+        async with self._lock:
+            self._count += amount
+
+    @property
+    def value(self):
+        """The current total."""
+        return self._count
+
 
 # global variable (it's like available in the entire program and it can be accessed by all the functions)
 
 kitchen_open = True
-total_orders_today = 0
+order_counter = OrderCounter()  # Shared by every thread that takes orders
 
 # function definition (it's like a recipe that takes an order and updates the global counter)
 def take_order(dish_name, price, quantity=1):
@@ -152,47 +277,81 @@ def take_order(dish_name, price, quantity=1):
 
     ANALOGY: Each station updates the shared order counter.
     Shows how functions can access and modify global variables.
+
+    Safe to call from many threads at once - the count lives in the
+    thread-safe order_counter instead of a bare `global` integer. The
+    running total printed here skips the shard locks, so busy stations
+    do not queue up just to print it; close_kitchen() reads the exact one.
     """
-    global total_orders_today  # Declare we want to modify global
-    
     # local variable (it's like a ingredient that is only available in the function)
     total_price = price * quantity
     print(f"📝 Order: {dish_name} - ${total_price}")
-    total_orders_today += 1
-    print(f"📊 Total orders today: {total_orders_today}")
+    order_counter.increment()
+    print(f"📊 Total orders today: {order_counter.approximate}")
     return total_price
 
-# function call (it's like using the recipe to cook)
-take_order("Pizza", 1585.99)
-print()
-
-# function call (it's like using the recipe to cook)
-take_order("Coffee", 850.50)
-print()
-
 
 def close_kitchen():
     """
     Close the kitchen and print the total orders.
     """
-    global kitchen_open
+    global kitchen_open  # Rebinding a global name is atomic, so this is thread-safe
     kitchen_open = False
+    total_orders_today = order_counter.value
     print("🔒 Kitchen is closed. Thank you for your visit!")
     print(f"📊 Total orders today: {total_orders_today}")
     return total_orders_today
 
-# function call (it's like using the recipe to cook)
-close_kitchen()
-print()
+
+def demo_scope():
+    """Local vs global scope with the shared order counter."""
+    print("🍳 FUNCTION SCOPE (Local vs Global) - Recipes That Produce Food")
+    print("=" * 40)
+
+    # function call (it's like using the recipe to cook)
+    take_order("Pizza", 1585.99)
+    print()
+
+    # function call (it's like using the recipe to cook)
+    take_order("Coffee", 850.50)
+    print()
+
+    # function call (it's like using the recipe to cook)
+    close_kitchen()
+    print()
 
 
 # ==========================================
 # 6. FUNCTIONS RETURNING MULTIPLE VALUES
 # ==========================================
 
+# Preparation times in minutes, loaded once for the whole module.
+# Keys are casefolded so "Pizza" and "pizza" find the same entry.
+PREP_TIMES = {"pizza": 20, "pasta": 15, "salad": 5}
+SIDE_PREP_TIMES = {}
+DEFAULT_PREP_TIME = 10  # Main dishes we have no time for
+DEFAULT_SIDE_PREP_TIME = 5  # Sides are quick
+
+def register_prep_times(mains=None, sides=None):
+    """
+    Add or change preparation times in the registry.
+
+    ANALOGY: Updating the kitchen's laminated timing chart
+    instead of every chef keeping their own notes.
 
-print("📦 FUNCTIONS RETURNING MULTIPLE VALUES - Complete Meal Prep")
-print("=" * 40)
+    Args:
+        mains (dict): Main dish name -> minutes (int or float)
+        sides (dict): Side dish name -> minutes (int or float)
+
+    Raises:
+        ValueError: If a time is not a number of minutes, or is negative
+    """
+    for registry, times in ((PREP_TIMES, mains), (SIDE_PREP_TIMES, sides)):
+        for dish, minutes in (times or {}).items():
+            if isinstance(minutes, bool) or not isinstance(minutes, (int, float)) or not minutes >= 0:
+                raise ValueError(f"Prep time for {dish!r} must be a number of minutes >= 0, "
+                                 f"got {minutes!r}")
+            registry[dish.casefold()] = minutes
 
 def prepare_meal(main_dish, side_dish, drink="Water"):
     """
@@ -213,10 +372,9 @@ def prepare_meal(main_dish, side_dish, drink="Water"):
         - The drink is the drink of the meal
     """
 
-    # Simulate preparation times
-    prep_times = {"pizza": 20, "pasta": 15, "salad": 5} # Dictionary of preparation times for different dishes
-    main_time = prep_times.get(main_dish, 10) # Get the preparation time for the main dish, if not found, use 10 minutes
-    side_time = 5  # Sides are quick
+    # Look up preparation times in the shared registry (default 10 minutes for unknown mains)
+    main_time = PREP_TIMES.get(main_dish.casefold(), DEFAULT_PREP_TIME)
+    side_time = SIDE_PREP_TIMES.get(side_dish.casefold(), DEFAULT_SIDE_PREP_TIME)
     total_time = main_time + side_time
 
     print(f"👨‍🍳 Preparing: {main_dish} + {side_dish} + {drink}")
@@ -224,33 +382,211 @@ def prepare_meal(main_dish, side_dish, drink="Water"):
 
     return main_dish,side_dish,drink,total_time
 
-# function call (it's like using the recipe to cook)
-result = prepare_meal("Pizza", "Salad", "Water")
+def prepare_meals(batch, stations=1, strategy="lpt"):
+    """
+    Work out prep times for many meals and share them between stations.
+
+    ANALOGY: The head chef reading the whole ticket rail at once and
+    handing each ticket to whichever station will be free first.
+
+    Strategies:
+        "lpt" - longest meals first; keeps the last station to finish
+                (the makespan) close to the best possible
+        "spt" - shortest meals first; gets the most meals out early
+
+    Args:
+        batch (iterable): (main_dish, side_dish[, drink]) per meal
+        stations (int): Number of kitchen stations (default 1)
+        strategy (str): "lpt" or "spt" (default "lpt")
+
+    Returns:
+        dict: "prep_times" (minutes per meal, in batch order),
+        "schedule" (meal indices per station, in cooking order),
+        "station_minutes" (busy minutes per station) and "makespan"
+
+    Raises:
+        ValueError: If strategy is unknown or stations is less than 1
+    """
+    if strategy not in ("lpt", "spt"):
+        raise ValueError(f"Unknown strategy {strategy!r}. Must be 'lpt' or 'spt'")
+    if stations < 1:
+        raise ValueError("Need at least one kitchen station")
+
+    mains, sides = PREP_TIMES.get, SIDE_PREP_TIMES.get
+    main_default, side_default = DEFAULT_PREP_TIME, DEFAULT_SIDE_PREP_TIME
+    prep_times = array("d", [  # Float minutes, so 7.5-minute dishes fit too
+        mains(meal[0].casefold(), main_default) + sides(meal[1].casefold(), side_default)
+        for meal in batch
+    ])
+
+    order = sorted(range(len(prep_times)), key=prep_times.__getitem__,
+                   reverse=strategy == "lpt")
+
+    # Heap of (busy minutes, station number): the top is the station free first
+    free_at = [(0, station) for station in range(stations)]
+    schedule = [[] for _ in range(stations)]
+    for meal in order:
+        minutes, station = free_at[0]
+        schedule[station].append(meal)
+        heapq.heapreplace(free_at, (minutes + prep_times[meal], station))
+
+    station_minutes = [0] * stations
+    for minutes, station in free_at:
+        station_minutes[station] = minutes
+    return {
+        "prep_times": prep_times,
+        "schedule": schedule,
+        "station_minutes": station_minutes,
+        "makespan": max(station_minutes),
+    }
+
+
+def demo_multiple_values():
+    """Functions returning multiple values."""
+    print("📦 FUNCTIONS RETURNING MULTIPLE VALUES - Complete Meal Prep")
+    print("=" * 40)
+
+    # function call (it's like using the recipe to cook)
+    result = prepare_meal("Pizza", "Salad", "Water")
 
-main_dish, side_dish, drink, total_time = result
-print(f"🍽️ Meal ready: {main_dish} + {side_dish} + {drink}")
-print(f"⏰ Total prep time: {total_time} minutes")
-print()
+    main_dish, side_dish, drink, total_time = result
+    print(f"🍽️ Meal ready: {main_dish} + {side_dish} + {drink}")
+    print(f"⏰ Total prep time: {total_time} minutes")
+    print()
+
+    # function call (it's like using the recipe to cook)
+    result = prepare_meal("Pasta", "Salad", "Water")
 
-# function call (it's like using the recipe to cook)
-result = prepare_meal("Pasta", "Salad", "Water")
+    main_dish, side_dish, drink, total_time = result
+    print(f"🍽️ Meal ready: {main_dish} + {side_dish} + {drink}")
+    print(f"⏰ Total prep time: {total_time} minutes")
+    print()
 
-main_dish, side_dish, drink, total_time = result
-print(f"🍽️ Meal ready: {main_dish} + {side_dish} + {drink}")
-print(f"⏰ Total prep time: {total_time} minutes")
-print()
+    # Plan a whole ticket rail across two stations
+    plan = prepare_meals([("Pizza", "Salad"), ("Pasta", "Salad"), ("Soup", "Bread"), ("Pizza", "Fries")],
+                         stations=2)
+    print(f"🗓️ Station schedule: {plan['schedule']}")
+    print(f"⏰ All meals ready after {plan['makespan']:g} minutes")
+    print()
 
 
 # ==========================================
 # 7. FUNCTION DOCUMENTATION (Docstrings)
 # ==========================================
 
+COOKING_METHODS = ("bake", "fry", "boil", "steam", "grill")
 
+# One validation problem: which recipe (by position), which field, and what is wrong
+RecipeError = collections.namedtuple("RecipeError", ["index", "field", "message"])
+
+class RecipeSchema:
+    """
+    Recipe validation rules, compiled once and reused for every recipe.
 
-print("📚 FUNCTION DOCUMENTATION - Recipe Instructions")
-print("=" * 40)
+    ANALOGY: The kitchen's house rules pinned to the wall. Nobody
+    rewrites them for each order - they just check against them.
+
+    Every range is (lowest, highest) inclusive; None switches a check off.
+
+    Args:
+        methods (iterable): Allowed cooking methods (default COOKING_METHODS)
+        temperature (tuple): Allowed temperature range in Fahrenheit
+        time_minutes (tuple): Allowed cooking time range in minutes
+        ingredients (iterable): Whitelist of allowed ingredients
+    """
 
-def complex_recipe(name, ingredients, cooking_method, temperature=350, time_minutes=30):
+    def __init__(self, methods=COOKING_METHODS, temperature=None, time_minutes=None,
+                 ingredients=None):
+        methods = tuple(methods)
+        self.methods = frozenset(methods)
+        self.temperature = temperature
+        self.time_minutes = time_minutes
+        self.ingredients = None if ingredients is None else frozenset(ingredients)
+        self._method_message = f"Invalid cooking method. Must be one of: {list(methods)}"
+
+    def check(self, cooking_method, ingredients, temperature=350, time_minutes=30):
+        """
+        Check one recipe's values.
+
+        A value of the wrong type is reported ("not a number", "not a
+        list") instead of raising TypeError.
+
+        Returns:
+            list: (field, message) pairs - empty when the recipe is valid
+        """
+        problems = []
+        if not isinstance(cooking_method, str) or cooking_method not in self.methods:
+            problems.append(("cooking_method", self._method_message))
+        for field, value, limits in (("temperature", temperature, self.temperature),
+                                     ("time_minutes", time_minutes, self.time_minutes)):
+            if limits is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                problems.append((field, "not a number"))
+            elif not limits[0] <= value <= limits[1]:
+                problems.append((field, f"{value} is outside {limits[0]}-{limits[1]}"))
+        if self.ingredients is not None:
+            if not isinstance(ingredients, (list, tuple, set, frozenset)):
+                problems.append(("ingredients", "not a list"))
+            else:
+                unknown = [item for item in ingredients
+                           if not isinstance(item, str) or item not in self.ingredients]
+                if unknown:
+                    problems.append(("ingredients", f"Not on the whitelist: {unknown}"))
+        return problems
+
+    def validate_many(self, recipes):
+        """
+        Validate a batch of recipe dicts without raising.
+
+        ANALOGY: An inspector walking down the whole line with a
+        clipboard, writing down every problem instead of stopping the
+        kitchen at the first one.
+
+        Each dict uses complex_recipe's argument names; temperature and
+        time_minutes fall back to its defaults. A recipe that is not a
+        mapping, or a field of the wrong type, is recorded like any other
+        problem ("not a mapping", "not a number", "not a list").
+
+        Args:
+            recipes (iterable): Recipe dicts
+
+        Returns:
+            list: RecipeError records, in recipe order (empty if all are valid)
+        """
+        methods, whitelist = self.methods, self.ingredients
+        low_temp, high_temp = self.temperature or (None, None)
+        low_time, high_time = self.time_minutes or (None, None)
+        errors = []
+        for index, recipe in enumerate(recipes):
+            try:
+                method = recipe["cooking_method"]
+                ingredients = recipe["ingredients"]
+            except KeyError as missing:
+                errors.append(RecipeError(index, missing.args[0], "missing"))
+                continue
+            except TypeError:  # A string, list or None cannot be looked up by field name
+                errors.append(RecipeError(index, None, "not a mapping"))
+                continue
+            temperature = recipe.get("temperature", 350)
+            time_minutes = recipe.get("time_minutes", 30)
+            # Fast path: most recipes are fine, so only build messages for bad ones
+            try:
+                if (method in methods
+                        and (low_temp is None or low_temp <= temperature <= high_temp)
+                        and (low_time is None or low_time <= time_minutes <= high_time)
+                        and (whitelist is None or whitelist.issuperset(ingredients))):
+                    continue
+            except TypeError:
+                pass  # A field of the wrong type; check() says which
+            for field, message in self.check(method, ingredients, temperature, time_minutes):
+                errors.append(RecipeError(index, field, message))
+        return errors
+
+DEFAULT_RECIPE_SCHEMA = RecipeSchema()
+
+def complex_recipe(name, ingredients, cooking_method, temperature=350, time_minutes=30,
+                   quiet=False, schema=DEFAULT_RECIPE_SCHEMA):
     """
     Prepare a complex recipe with detailed instructions.
 
@@ -263,12 +599,14 @@ def complex_recipe(name, ingredients, cooking_method, temperature=350, time_minu
         cooking_method (str): How to cook (bake, fry, boil, etc.)
         temperature (int): Cooking temperature in Fahrenheit (default 350)
         time_minutes (int): Cooking time in minutes (default 30)
+        quiet (bool): Skip the console output, e.g. in services (default False)
+        schema (RecipeSchema): Rules to validate against (default: cooking method only)
 
     Returns:
         dict: Recipe summary with all details
 
     Raises:
-        ValueError: If cooking method is invalid
+        ValueError: If cooking method (or any other schema rule) is invalid
 
     Example:
         >>> result = complex_recipe("chocolate cake",
@@ -278,17 +616,18 @@ def complex_recipe(name, ingredients, cooking_method, temperature=350, time_minu
         "Successfully prepared chocolate cake"
     """
     # Validate inputs
-    valid_methods = ["bake", "fry", "boil", "steam", "grill"]
-    if cooking_method not in valid_methods:
-        raise ValueError(f"Invalid cooking method. Must be one of: {valid_methods}")
+    problems = schema.check(cooking_method, ingredients, temperature, time_minutes)
+    if problems:
+        raise ValueError(problems[0][1])
 
     # Simulate cooking
-    print(f"👨‍🍳 Preparing {name} using {cooking_method} method")
-    print(f"🌡️ Temperature: {temperature}°F")
-    print(f"⏰ Time: {time_minutes} minutes")
-    print("🥕 Ingredients used:")
-    for ingredient in ingredients:
-        print(f"   • {ingredient}")
+    if not quiet:
+        print(f"👨‍🍳 Preparing {name} using {cooking_method} method")
+        print(f"🌡️ Temperature: {temperature}°F")
+        print(f"⏰ Time: {time_minutes} minutes")
+        print("🥕 Ingredients used:")
+        for ingredient in ingredients:
+            print(f"   • {ingredient}")
 
     # Return summary
     return {
@@ -300,36 +639,196 @@ def complex_recipe(name, ingredients, cooking_method, temperature=350, time_minu
         "status": f"Successfully prepared {name}"
     }
 
-print("📖 Using well-documented function:")
-try:
-    recipe_result = complex_recipe(
-        name="lasagna",
-        ingredients=["pasta", "ground beef", "cheese", "tomato sauce"],
-        cooking_method="bake",
-        temperature=375,
-        time_minutes=45
-    )
-    print(f"✅ {recipe_result['status']}")
-except ValueError as e:
-    print(f"❌ Error: {e}")
-print()
 
+def demo_docstrings():
+    """Well-documented functions and recipe validation."""
+    print("📚 FUNCTION DOCUMENTATION - Recipe Instructions")
+    print("=" * 40)
+
+    print("📖 Using well-documented function:")
+    try:
+        recipe_result = complex_recipe(
+            name="lasagna",
+            ingredients=["pasta", "ground beef", "cheese", "tomato sauce"],
+            cooking_method="bake",
+            temperature=375,
+            time_minutes=45
+        )
+        print(f"✅ {recipe_result['status']}")
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+    print()
+
+    print("📋 Validating a batch of recipes:")
+    strict_schema = RecipeSchema(temperature=(200, 500), time_minutes=(1, 240))
+    batch_errors = strict_schema.validate_many([
+        {"name": "soup", "ingredients": ["water"], "cooking_method": "boil"},
+        {"name": "toast", "ingredients": ["bread"], "cooking_method": "microwave"},
+        {"name": "roast", "ingredients": ["beef"], "cooking_method": "bake", "temperature": 900},
+    ])
+    for error in batch_errors:
+        print(f"   ❌ Recipe {error.index} {error.field}: {error.message}")
+    print()
 
 
 # ==========================================
 # 8. PRACTICAL FUNCTION EXAMPLES
 # ==========================================
 
-print("🏪 PRACTICAL EXAMPLES - Real Restaurant Functions")
-print("=" * 40)
+class MenuIndex:
+    """
+    A menu lookup index that is built once and reused for every check.
+
+    ANALOGY: Instead of reading the whole menu card for every order,
+    the waiter memorizes it once. Checking an order is then instant.
+
+    Names are stored casefolded in a dictionary (a hash set with counts),
+    so "Pizza" and "pizza" are the same dish and membership is O(1).
+    With prefixes=True a trie is also kept, so you can ask which dishes
+    start with "pa" without scanning the whole menu.
+
+    Args:
+        menu (iterable): Dish names to index (default empty)
+        prefixes (bool): Also build a prefix trie (default False)
+    """
+
+    _END = None  # Trie key that marks "a dish name ends here"
+
+    def __init__(self, menu=(), prefixes=False):
+        self._counts = {}
+        self._trie = {} if prefixes else None
+        for item in menu:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, item_name):
+        return self.contains(item_name)
+
+    def add(self, item_name):
+        """Add one dish to the index (duplicates are counted, not lost)."""
+        key = item_name.casefold()
+        self._counts[key] = self._counts.get(key, 0) + 1
+        if self._trie is not None:
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[self._END] = node.get(self._END, 0) + 1
+
+    def remove(self, item_name):
+        """
+        Remove one dish from the index.
+
+        Raises:
+            KeyError: If the dish is not on the menu
+        """
+        key = item_name.casefold()
+        count = self._counts[key]
+        if count == 1:
+            del self._counts[key]
+        else:
+            self._counts[key] = count - 1
+        if self._trie is not None:
+            self._trie_remove(key)
+
+    def _trie_remove(self, key):
+        # Walk down, remembering the path so empty branches can be pruned
+        path = []
+        node = self._trie
+        for char in key:
+            path.append((node, char))
+            node = node[char]
+        node[self._END] -= 1
+        if node[self._END]:
+            return
+        del node[self._END]
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def contains(self, item_name):
+        """Check if one dish is on the menu."""
+        return item_name.casefold() in self._counts
+
+    def contains_many(self, item_names):
+        """
+        Check a whole batch of orders at once.
+
+        Returns:
+            list: One True/False per item, in the same order
+        """
+        counts = self._counts
+        return [name.casefold() in counts for name in item_names]
+
+    def starts_with(self, prefix):
+        """
+        Find every dish whose name starts with prefix.
+
+        Returns:
+            list: Matching casefolded names, sorted
+
+        Raises:
+            ValueError: If the index was built without prefixes=True
+        """
+        if self._trie is None:
+            raise ValueError("MenuIndex was built without prefixes=True")
+        prefix = prefix.casefold()
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        matches = []
+        stack = [(node, prefix)]
+        while stack:
+            node, name = stack.pop()
+            for char, child in node.items():
+                if char is self._END:
+                    matches.append(name)
+                else:
+                    stack.append((child, name + char))
+        return sorted(matches)
+
+
+# (menu, copy of it, MenuIndex) from the last plain list or tuple validated
+_last_menu = (None, None, None)
+
+
+def _index_for(menu):
+    """
+    The MenuIndex for a plain menu, reusing the last one if nothing changed.
+
+    Checking the copy (a C-level == that stops at the first difference)
+    still reads the whole list, but it is far cheaper than lowercasing
+    and indexing every dish again.
+    """
+    global _last_menu  # Rebinding a global name is atomic, so this is thread-safe
+    cached_menu, copy, index = _last_menu
+    if cached_menu is menu and copy == menu:
+        return index
+    if type(menu) not in (list, tuple):
+        return MenuIndex(menu)  # Sets, generators, ...: no cheap way to spot changes
+    copy = menu[:]
+    index = MenuIndex(copy)
+    _last_menu = (menu, copy, index)
+    return index
+
 
 def validate_menu_item(item_name, menu):
     """
     Check if an item is on the menu.
 
     ANALOGY: Waiter checking if customer ordered something we serve.
+
+    The index for a plain list is kept and reused while the same list,
+    unchanged, is passed again. That check still looks at every dish, so
+    for O(1) lookups pass a MenuIndex built once with MenuIndex(menu).
     """
-    return item_name.lower() in [item.lower() for item in menu]
+    if not isinstance(menu, MenuIndex):
+        menu = _index_for(menu)
+    return menu.contains(item_name)
 
 def calculate_tip(bill_amount, tip_percentage=15):
     """
@@ -339,66 +838,297 @@ def calculate_tip(bill_amount, tip_percentage=15):
     """
     return bill_amount * (tip_percentage / 100)
 
-def format_receipt(customer_name, items, prices):
+def _to_column(values, size):
+    """Repeat a single number into a column, or pass a column through."""
+    if isinstance(values, (int, float)):
+        return [values] * size
+    if len(values) != size:
+        raise ValueError(f"Expected {size} values, got {len(values)}")
+    return values
+
+def bill_cents(subtotal_cents, tax_rate=0.08, tip_percentage=15):
     """
-    Format a restaurant receipt.
+    Tax, tip and total for one subtotal in cents - one row of calculate_bills().
 
-    ANALOGY: Cashier printing the final bill.
+    Rates are turned into integer millionths, and each amount is rounded
+    to a whole cent with halves going up, so the answer never depends on
+    how a float happened to round.
+
+    Example:
+        >>> bill_cents(1000)
+        (80, 150, 1230)
+
+    Args:
+        subtotal_cents (int): Price times quantity, in cents
+        tax_rate (float): Tax rate as decimal (default 8%)
+        tip_percentage (float): Tip percentage (default 15)
+
+    Returns:
+        tuple: (tax, tip, total) in cents
     """
-    print(f"\n🧾 RECEIPT FOR {customer_name.upper()}")
-    print("=" * 40)
+    rate = round(tax_rate * 1_000_000)
+    tip_rate = round(tip_percentage * 10_000)
+    return ((subtotal_cents * rate + 500_000) // 1_000_000,
+            (subtotal_cents * tip_rate + 500_000) // 1_000_000,
+            (subtotal_cents * (1_000_000 + rate + tip_rate) + 500_000) // 1_000_000)
+
+def calculate_bills(prices, quantities, tax_rates=0.08, tip_percentage=15):
+    """
+    Price a whole batch of line items in one pass.
+
+    ANALOGY: The night manager settling every table at once instead of
+    calling the cashier over for each bill.
+
+    All money is handled in integer cents, so there is no float drift.
+    Per row: subtotal and tax as in calculate_bill, tip as in
+    calculate_tip on the subtotal (like format_receipt), and the total of
+    all three. Half cents round up. Like format_receipt, the total is
+    rounded once, so it can be a cent away from tax + tip added up.
+    Uses NumPy when it is installed, otherwise the standard array module.
+
+    Args:
+        prices (sequence): Price of one item per row, in dollars
+        quantities (int or sequence): Number of items per row (whole numbers)
+        tax_rates (float or sequence): Tax rate per row (default 8%)
+        tip_percentage (float): Tip percentage for every row (default 15)
+
+    Returns:
+        dict: "subtotal", "tax", "tip" and "total" columns in cents
+
+    Raises:
+        ValueError: If the columns have different lengths
+        TypeError: If a quantity is not an int (NumPy would silently truncate 2.5 to 2)
+    """
+    size = len(prices)
+    try:
+        quantities = array("q", _to_column(quantities, size))
+    except TypeError:
+        raise TypeError("Quantities must be whole numbers (int)") from None
+    tax_rates = _to_column(tax_rates, size)
+    # Rates become integers in millionths, so tax is exact integer math
+    tip_millionths = round(tip_percentage * 10_000)
+
+    np = _numpy()
+    if np is not None:
+        price_cents = np.rint(np.asarray(prices, dtype=np.float64) * 100).astype(np.int64)
+        subtotal = price_cents * np.asarray(quantities, dtype=np.int64)
+        rate_millionths = np.rint(np.asarray(tax_rates, dtype=np.float64) * 1_000_000).astype(np.int64)
+        tax = (subtotal * rate_millionths + 500_000) // 1_000_000
+        tip = (subtotal * tip_millionths + 500_000) // 1_000_000
+        total = (subtotal * (1_000_000 + rate_millionths + tip_millionths) + 500_000) // 1_000_000
+        return {
+            "subtotal": array("q", subtotal.tobytes()),
+            "tax": array("q", tax.tobytes()),
+            "tip": array("q", tip.tobytes()),
+            "total": array("q", total.tobytes()),
+        }
+
+    # Most batches share a handful of tax rates, so convert each one once
+    rate_lookup = {}
+    rate_millionths = [
+        rate_lookup[rate] if rate in rate_lookup
+        else rate_lookup.setdefault(rate, round(rate * 1_000_000))
+        for rate in tax_rates
+    ]
+    subtotals = [round(price * 100) * quantity for price, quantity in zip(prices, quantities)]
+    return {
+        "subtotal": array("q", subtotals),
+        "tax": array("q", [
+            (subtotal * rate + 500_000) // 1_000_000
+            for subtotal, rate in zip(subtotals, rate_millionths)
+        ]),
+        "tip": array("q", [
+            (subtotal * tip_millionths + 500_000) // 1_000_000 for subtotal in subtotals
+        ]),
+        "total": array("q", [
+            (subtotal * (1_000_000 + rate + tip_millionths) + 500_000) // 1_000_000
+            for subtotal, rate in zip(subtotals, rate_millionths)
+        ]),
+    }
 
+class _BufferedWriter:
+    """
+    Collect text in memory and hand it to the stream in big pieces.
+
+    ANALOGY: Carrying plates to the table on a tray instead of
+    walking back to the kitchen for every single plate.
+    """
+
+    def __init__(self, stream, buffer_size):
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            self._stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+
+
+def _receipt_totals(prices):
+    """Subtotal, tip and total exactly as format_receipt adds them up."""
     subtotal = 0
-    for item, price in zip(items, prices):
-        print(f"   🍽️ {item} - ${price:,.2f}")
+    for price in prices:
         subtotal += price
-
     tip = calculate_tip(subtotal)
-    total = subtotal + tip
+    return subtotal, tip, subtotal + tip
+
+
+def _render_plain(out, customer_name, items, prices):
+    subtotal, tip, total = _receipt_totals(prices)
+    lines = [f"\n🧾 RECEIPT FOR {customer_name.upper()}", "=" * 40]
+    lines.extend(f"   🍽️ {item} - ${price:,.2f}" for item, price in zip(items, prices))
+    lines.append(f"   💰 Subtotal: ${subtotal:,.2f}")
+    lines.append(f"   💰 Tip: ${tip:,.2f}")
+    lines.append(f"   💰 Total: ${total:,.2f}")
+    lines.append("=" * 40)
+    out.write("\n".join(lines) + "\n")
+
+
+def _render_csv(customer_name, items, prices, writer):
+    subtotal, tip, total = _receipt_totals(prices)
+    writer.writerow([customer_name, "; ".join(items),
+                     f"{subtotal:.2f}", f"{tip:.2f}", f"{total:.2f}"])
+
+
+def _render_jsonl(out, customer_name, items, prices):
+    subtotal, tip, total = _receipt_totals(prices)
+    out.write(json.dumps({
+        "customer": customer_name,
+        "items": [{"item": item, "price": price} for item, price in zip(items, prices)],
+        "subtotal": round(subtotal, 2),
+        "tip": round(tip, 2),
+        "total": round(total, 2),
+    }, ensure_ascii=False) + "\n")
+
 
-    print(f"   💰 Subtotal: ${subtotal:,.2f}")
-    print(f"   💰 Tip: ${tip:,.2f}")
-    print(f"   💰 Total: ${total:,.2f}")
+RECEIPT_FORMATS = ("plain", "csv", "jsonl")
+
+def render_receipts(receipts, stream, fmt="plain", max_memory=False, buffer_size=65536):
+    """
+    Write many receipts to a text stream through one buffered writer.
+
+    ANALOGY: The cashier printing the whole day's receipts in one run
+    instead of feeding the printer one line at a time.
+
+    Args:
+        receipts (iterable): (customer_name, items, prices) per receipt,
+            e.g. a generator reading orders from a file
+        stream: Any text stream with a write() method (file, sys.stdout, StringIO)
+        fmt (str): "plain" (like format_receipt), "csv" or "jsonl"
+        max_memory (bool): Flush after every receipt so at most one
+            receipt is held in memory (default False)
+        buffer_size (int): Characters to collect before writing (default 64 KiB)
+
+    Returns:
+        int: Number of receipts written
+
+    Raises:
+        ValueError: If fmt is not one of RECEIPT_FORMATS
+    """
+    if fmt not in RECEIPT_FORMATS:
+        raise ValueError(f"Unknown receipt format {fmt!r}. Must be one of: {RECEIPT_FORMATS}")
+
+    out = _BufferedWriter(stream, buffer_size)
+    if fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(["customer", "items", "subtotal", "tip", "total"])
+    count = 0
+    for customer_name, items, prices in receipts:
+        # Items and prices may be generators - materialize this receipt only
+        items, prices = list(items), list(prices)
+        if fmt == "plain":
+            _render_plain(out, customer_name, items, prices)
+        elif fmt == "csv":
+            _render_csv(customer_name, items, prices, writer)
+        else:
+            _render_jsonl(out, customer_name, items, prices)
+        count += 1
+        if max_memory:
+            out.flush()
+    out.flush()
+    return count
+
+def format_receipt(customer_name, items, prices):
+    """
+    Format a restaurant receipt.
+
+    ANALOGY: Cashier printing the final bill.
+    """
+    render_receipts([(customer_name, items, prices)], sys.stdout)
+
+
+def demo_practical_examples():
+    """Practical restaurant functions."""
+    print("🏪 PRACTICAL EXAMPLES - Real Restaurant Functions")
     print("=" * 40)
 
-# Test the practical functions
-menu = ["pizza", "pasta", "salad", "dessert"]
-print("🔍 Menu validation:")
-print(f"Is 'pizza' on menu? {validate_menu_item('pizza', menu)}")
-print(f"Is 'burger' on menu? {validate_menu_item('burger', menu)}")
-print()
+    # Test the practical functions
+    menu = ["pizza", "pasta", "salad", "dessert"]
+    print("🔍 Menu validation:")
+    print(f"Is 'pizza' on menu? {validate_menu_item('pizza', menu)}")
+    print(f"Is 'burger' on menu? {validate_menu_item('burger', menu)}")
+
+    # Build the index once, then check a whole batch of orders
+    menu_index = MenuIndex(menu, prefixes=True)
+    print(f"Batch check: {menu_index.contains_many(['PIZZA', 'burger', 'Salad'])}")
+    print(f"Dishes starting with 'pa': {menu_index.starts_with('pa')}")
+    print()
+
+    print("🧮 Batch billing (amounts in cents):")
+    bills = calculate_bills([1585.99, 850.50], [2, 1], [0.08, 0.10])
+    for column, cents in bills.items():
+        print(f"   {column}: {[f'${c / 100:,.2f}' for c in cents]}")
+    print()
+
+    print("🧾 Receipt formatting:")
+    format_receipt(
+        "Alice Johnson",
+        ["Margherita Pizza", "Caesar Salad", "Tiramisu"],
+        [18.99, 8.50, 6.99]
+    )
+
+    print("🧾 Receipts as JSON lines:")
+    render_receipts(
+        ((name, ["Pizza", "Salad"], [18.99, 8.50]) for name in ("Bob", "Carol")),
+        sys.stdout,
+        fmt="jsonl",
+    )
+    print()
 
-print("🧾 Receipt formatting:")
-format_receipt(
-    "Alice Johnson",
-    ["Margherita Pizza", "Caesar Salad", "Tiramisu"],
-    [18.99, 8.50, 6.99]
-)
 
 # ==========================================
 # 9. FUNCTION COMPOSITION => Building Complex Recipes From Simple Ones (like a master chef coordinating multiple kitchen stations)
 # one function calls another function to build a more complex dish
 # ==========================================
 
-print("🔗 FUNCTION COMPOSITION - Building Complex Recipes")
-print("=" * 40)
-
-def chop_vegetables(vegetables):
+def chop_vegetables(vegetables, quiet=False):
     """Step 1: Chop vegetables."""
     chopped = [f"chopped_{veg}" for veg in vegetables]
-    print(f"🥕 Chopped: {chopped}")
+    if not quiet:
+        print(f"🥕 Chopped: {chopped}")
     return chopped
 
-def cook_sauce(base, spices):
+def cook_sauce(base, spices, quiet=False):
     """Step 2: Cook sauce."""
     sauce = f"{base}_sauce_with_{'_'.join(spices)}"
-    print(f"🍅 Cooked: {sauce}")
+    if not quiet:
+        print(f"🍅 Cooked: {sauce}")
     return sauce
 
-def assemble_pasta(pasta_type, sauce, vegetables):
+def assemble_pasta(pasta_type, sauce, vegetables, quiet=False):
     """Step 3: Assemble the final dish."""
     dish = f"{pasta_type}_with_{sauce}_and_{'_'.join(vegetables)}"
-    print(f"🍝 Assembled: {dish}")
+    if not quiet:
+        print(f"🍝 Assembled: {dish}")
     return dish
 
 def make_pasta_dish(pasta_type, vegetables, base_sauce, spices):
@@ -421,12 +1151,575 @@ def make_pasta_dish(pasta_type, vegetables, base_sauce, spices):
 
     return final_dish
 
-print("🔗 Function composition example:")
-result = make_pasta_dish(
-    pasta_type="spaghetti",
-    vegetables=["onions", "garlic", "mushrooms"],
-    base_sauce="tomato",
-    spices=["basil", "oregano"]
-)
-print(f"✅ Final dish: {result}")
-print()
+class StageTimer:
+    """
+    Thread-safe call counts and busy seconds for each pipeline stage.
+
+    ANALOGY: A stopwatch at every kitchen station. The station with
+    the most busy time is the one holding everybody else up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = collections.Counter()
+        self.seconds = collections.Counter()
+
+    def record(self, name, seconds):
+        """Add one timed call for the stage called name."""
+        with self._lock:
+            self.calls[name] += 1
+            self.seconds[name] += seconds
+
+    @property
+    def bottleneck(self):
+        """Name of the stage with the most busy time (None if nothing ran)."""
+        with self._lock:
+            return max(self.seconds, key=self.seconds.get, default=None)
+
+    def report(self):
+        """Print one line per stage, busiest first."""
+        with self._lock:
+            for name, seconds in self.seconds.most_common():
+                calls = self.calls[name]
+                print(f"   ⏱️ {name:<10} {calls:>9,} calls {seconds:8.3f}s "
+                      f"({seconds / calls * 1e6:.1f}µs each)")
+
+
+def _timed_call(func, args):
+    """Run func(*args) and return (result, seconds). Module level so process pools can pickle it."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def stage(func, name, timer=None):
+    """
+    Wrap func as a pipeline stage.
+
+    ANALOGY: A station on the line - tickets come in, plates go out.
+
+    The stage is a function that takes an iterable of argument tuples
+    and lazily yields func(*args) for each one, so nothing is built up
+    in lists between stations.
+
+    Args:
+        func (callable): The work done at this station
+        name (str): Stage name for the timer
+        timer (StageTimer): Where to record timings (optional)
+    """
+    def run(items):
+        for args in items:
+            result, seconds = _timed_call(func, args)
+            if timer is not None:
+                timer.record(name, seconds)
+            yield result
+    return run
+
+
+def concurrent_stage(func, name, executor, max_pending=64, timer=None):
+    """
+    Like stage(), but runs func on a thread or process pool.
+
+    Results come out in input order. At most max_pending calls are in
+    flight; the stage stops pulling new items until the oldest one is
+    done, so a slow station pushes back on the ones before it instead
+    of letting work pile up in memory.
+
+    Args:
+        func (callable): The work done at this station (must be picklable for process pools)
+        name (str): Stage name for the timer
+        executor: A concurrent.futures ThreadPoolExecutor or ProcessPoolExecutor
+        max_pending (int): Size of the bounded in-flight queue (default 64)
+        timer (StageTimer): Where to record timings (optional)
+    """
+    def finish(future):
+        result, seconds = future.result()
+        if timer is not None:
+            timer.record(name, seconds)
+        return result
+
+    def run(items):
+        pending = collections.deque()
+        for args in items:
+            if len(pending) >= max_pending:
+                yield finish(pending.popleft())
+            pending.append(executor.submit(_timed_call, func, args))
+        while pending:
+            yield finish(pending.popleft())
+    return run
+
+
+def pipeline(source, *stages):
+    """
+    Chain stages so each one lazily feeds the next.
+
+    Returns:
+        generator: Results of the last stage
+    """
+    for next_stage in stages:
+        source = next_stage(source)
+    return source
+
+
+def make_pasta_dishes(orders, executor=None, max_pending=64, timer=None):
+    """
+    Stream many pasta orders through the chop, sauce and assemble stations.
+
+    ANALOGY: A full kitchen line on a busy night. The vegetable and
+    sauce stations work at the same time on different tickets while
+    the assembly station plates whatever is ready.
+
+    Args:
+        orders (iterable): (pasta_type, vegetables, base_sauce, spices) per order
+        executor: Optional thread/process pool; when given, chopping and
+            sauce cooking run on it concurrently
+        max_pending (int): In-flight limit per concurrent station (default 64)
+        timer (StageTimer): Where to record per-station timings (optional)
+
+    Returns:
+        generator: Final dish names, in order
+    """
+    chop = functools.partial(chop_vegetables, quiet=True)
+    sauce = functools.partial(cook_sauce, quiet=True)
+    assemble = functools.partial(assemble_pasta, quiet=True)
+
+    chop_orders, sauce_orders, assemble_orders = itertools.tee(orders, 3)
+    if executor is None:
+        chop_stage, sauce_stage = stage(chop, "chop", timer), stage(sauce, "sauce", timer)
+    else:
+        chop_stage = concurrent_stage(chop, "chop", executor, max_pending, timer)
+        sauce_stage = concurrent_stage(sauce, "sauce", executor, max_pending, timer)
+
+    chopped = chop_stage((order[1],) for order in chop_orders)
+    sauces = sauce_stage((order[2], order[3]) for order in sauce_orders)
+    plates = (
+        (order[0], cooked, veggies)
+        for order, cooked, veggies in zip(assemble_orders, sauces, chopped)
+    )
+    return pipeline(plates, stage(assemble, "assemble", timer))
+
+
+def demo_composition():
+    """Function composition and the kitchen line."""
+    print("🔗 FUNCTION COMPOSITION - Building Complex Recipes")
+    print("=" * 40)
+
+    print("🔗 Function composition example:")
+    result = make_pasta_dish(
+        pasta_type="spaghetti",
+        vegetables=["onions", "garlic", "mushrooms"],
+        base_sauce="tomato",
+        spices=["basil", "oregano"]
+    )
+    print(f"✅ Final dish: {result}")
+    print()
+
+    print("🏭 Kitchen line for many orders:")
+    line_timer = StageTimer()
+    pasta_orders = [
+        ("spaghetti", ["onions", "garlic"], "tomato", ["basil"]),
+        ("penne", ["peppers"], "cream", ["pepper", "nutmeg"]),
+    ]
+    for dish in make_pasta_dishes(pasta_orders, timer=line_timer):
+        print(f"   🍝 {dish}")
+    line_timer.report()
+    print()
+
+
+# ==========================================
+# 10. BENCHMARKS - Timing the kitchen at scale
+# Run with: python week1_cli/04_functions.py --benchmark
+# (without --benchmark, main() runs the lesson demos instead)
+# ==========================================
+
+def benchmark_menu_index(sizes=(10_000, 100_000, 1_000_000), lookups=100_000):
+    """
+    Measure menu lookups per second for MenuIndex vs the old list scan.
+
+    ANALOGY: Timing a waiter who memorized the menu against one who
+    re-reads the whole card for every order.
+
+    Args:
+        sizes (tuple): Menu sizes to test
+        lookups (int): Number of MenuIndex lookups per size
+    """
+    print("⏱️ MenuIndex lookups per second:")
+    for size in sizes:
+        menu_items = [f"Dish_{n}" for n in range(size)]
+        # Half the orders are on the menu, half are not
+        orders = [f"dish_{n * 2}" for n in range(lookups)]
+
+        start = time.perf_counter()
+        index = MenuIndex(menu_items)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index.contains_many(orders)
+        index_rate = lookups / (time.perf_counter() - start)
+
+        # The old way is so slow that a handful of lookups is enough
+        scan_lookups = 20
+        start = time.perf_counter()
+        for name in orders[:scan_lookups]:
+            name.lower() in [item.lower() for item in menu_items]
+        scan_rate = scan_lookups / (time.perf_counter() - start)
+
+        validate_menu_item(orders[0], menu_items)  # Builds the cached index
+        start = time.perf_counter()
+        for name in orders[:scan_lookups]:
+            validate_menu_item(name, menu_items)
+        list_rate = scan_lookups / (time.perf_counter() - start)
+
+        print(f"   📋 {size:>9,} dishes: build {build_seconds:.3f}s, "
+              f"index {index_rate:,.0f}/s, list scan {scan_rate:,.0f}/s, "
+              f"validate_menu_item(list) {list_rate:,.0f}/s")
+    print()
+
+def benchmark_batch_billing(rows=1_000_000):
+    """
+    Compare calculate_bills with calling calculate_bill/calculate_tip per row.
+
+    Every total is checked exactly against a Decimal reference that
+    rounds half cents up. The float per-item totals are compared too:
+    they differ only where a total lands on a half cent and float
+    rounding goes the other way.
+
+    Args:
+        rows (int): Number of line items to price
+    """
+    from decimal import ROUND_HALF_UP, Decimal
+
+    prices = [round(0.99 + (n * 7919 % 50_000) / 100, 2) for n in range(rows)]
+    quantities = [1 + n % 5 for n in range(rows)]
+    tax_rates = [(0.0, 0.05, 0.08, 0.0825)[n % 4] for n in range(rows)]
+
+    start = time.perf_counter()
+    loop_totals = []
+    for price, quantity, rate in zip(prices, quantities, tax_rates):
+        subtotal = price * quantity
+        total = calculate_bill(price, quantity, rate) + calculate_tip(subtotal)
+        loop_totals.append(total)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bills = calculate_bills(prices, quantities, tax_rates)
+    batch_seconds = time.perf_counter() - start
+
+    multipliers = {rate: 1 + Decimal(str(rate)) + Decimal("0.15") for rate in set(tax_rates)}
+    cent = Decimal("1")
+    mismatches = sum(
+        1 for price, quantity, rate, cents in zip(prices, quantities, tax_rates, bills["total"])
+        if (Decimal(str(price)) * 100 * quantity * multipliers[rate]).quantize(
+            cent, rounding=ROUND_HALF_UP) != cents
+    )
+    # Float totals that land on a half cent can round either way
+    float_ties = sum(1 for expected, cents in zip(loop_totals, bills["total"])
+                     if round(expected * 100) != cents)
+    engine = "numpy" if _numpy() is not None else "array"
+    print(f"⏱️ Batch billing, {rows:,} rows ({engine}):")
+    print(f"   🐢 Per-item loop: {loop_seconds:.3f}s")
+    print(f"   🚀 calculate_bills: {batch_seconds:.3f}s "
+          f"({loop_seconds / batch_seconds:.1f}x)")
+    print(f"   🔍 Totals that differ from exact half-up cents: {mismatches:,}")
+    print(f"   🪙 Float loop totals a cent away (half-cent ties): {float_ties:,}")
+    print()
+
+def stress_test_order_counter(workers=32, orders_per_worker=2_000):
+    """
+    Take orders from a 32-worker thread pool and check none are lost.
+
+    Raises:
+        AssertionError: If the final count is not exactly workers * orders
+    """
+    import contextlib
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+
+    def station(worker):
+        for n in range(orders_per_worker):
+            take_order(f"dish_{worker}_{n}", 9.99)
+
+    before = order_counter.value
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(station, range(workers)))
+        taken = close_kitchen() - before
+
+    expected = workers * orders_per_worker
+    assert taken == expected, f"Lost {expected - taken} orders"
+    print(f"✅ Stress test: {workers} workers took {taken:,} orders, none lost")
+    print()
+
+
+class _SingleLockCounter:
+    """The simplest correct counter: one lock around one integer."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def increment(self, amount=1):
+        with self._lock:
+            self._count += amount
+
+
+def benchmark_order_counter(workers=32, increments_per_worker=100_000):
+    """
+    Compare OrderCounter with a single-lock counter under a thread pool.
+
+    Args:
+        workers (int): Number of threads incrementing at once
+        increments_per_worker (int): Increments done by each thread
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    print(f"⏱️ Counter throughput, {workers} threads:")
+    for label, counter in (("single lock", _SingleLockCounter()),
+                           ("OrderCounter", OrderCounter())):
+        def work(_):
+            increment = counter.increment
+            for _ in range(increments_per_worker):
+                increment()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(work, range(workers)))
+        seconds = time.perf_counter() - start
+        rate = workers * increments_per_worker / seconds
+        print(f"   🔢 {label:<12}: {rate:,.0f} increments/s")
+    print()
+
+def benchmark_prepare_meals(meals=100_000, stations=8):
+    """
+    Compare prepare_meals with calling prepare_meal in a Python loop.
+
+    Args:
+        meals (int): Number of meals in the batch
+        stations (int): Number of kitchen stations to schedule across
+    """
+    import contextlib
+    import io
+
+    dishes = ("Pizza", "Pasta", "Salad", "Soup", "Steak")
+    batch = [(dishes[n % 5], "Salad" if n % 3 else "Fries") for n in range(meals)]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        loop_total = sum(prepare_meal(main, side)[3] for main, side in batch)
+    loop_seconds = time.perf_counter() - start
+
+    print(f"⏱️ Meal planning, {meals:,} meals on {stations} stations:")
+    print(f"   🐢 prepare_meal loop: {loop_seconds:.3f}s")
+    for strategy in ("lpt", "spt"):
+        start = time.perf_counter()
+        plan = prepare_meals(batch, stations, strategy)
+        seconds = time.perf_counter() - start
+        assert sum(plan["prep_times"]) == loop_total
+        print(f"   🚀 prepare_meals ({strategy}): {seconds:.3f}s, "
+              f"makespan {plan['makespan']:,.1f} minutes")
+    print()
+
+def benchmark_receipts(receipts=100_000):
+    """
+    Compare format_receipt's print-per-line style with render_receipts.
+
+    Both write the same plain receipts to a temporary file.
+
+    Args:
+        receipts (int): Number of receipts to write
+    """
+    import contextlib
+    import os
+    import tempfile
+
+    items = ["Margherita Pizza", "Caesar Salad", "Tiramisu"]
+    prices = [18.99, 8.50, 6.99]
+
+    def orders():
+        for n in range(receipts):
+            yield f"Customer {n}", items, prices
+
+    def print_per_line(stream):
+        # The original format_receipt: one print() call per line
+        with contextlib.redirect_stdout(stream):
+            for customer_name, order_items, order_prices in orders():
+                print(f"\n🧾 RECEIPT FOR {customer_name.upper()}")
+                print("=" * 40)
+                subtotal = 0
+                for item, price in zip(order_items, order_prices):
+                    print(f"   🍽️ {item} - ${price:,.2f}")
+                    subtotal += price
+                tip = calculate_tip(subtotal)
+                print(f"   💰 Subtotal: ${subtotal:,.2f}")
+                print(f"   💰 Tip: ${tip:,.2f}")
+                print(f"   💰 Total: ${subtotal + tip:,.2f}")
+                print("=" * 40)
+
+    print(f"⏱️ Writing {receipts:,} receipts to a file:")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "receipts.txt")
+        runs = [("print per line", print_per_line)]
+        for fmt in RECEIPT_FORMATS:
+            runs.append((f"render {fmt}", lambda stream, fmt=fmt: render_receipts(orders(), stream, fmt)))
+        runs.append(("render max_memory",
+                     lambda stream: render_receipts(orders(), stream, max_memory=True)))
+        for label, run in runs:
+            # buffering=1 (line buffered) makes every line a write, like a terminal
+            with open(path, "w", encoding="utf-8", buffering=1) as stream:
+                start = time.perf_counter()
+                run(stream)
+                seconds = time.perf_counter() - start
+            print(f"   📝 {label:<18}: {seconds:.3f}s")
+    print()
+
+def benchmark_pasta_pipeline(orders=100_000):
+    """
+    Compare make_pasta_dish in a loop with the streaming kitchen line.
+
+    Runs the line sequentially, on a thread pool and on a process pool,
+    then prints the per-station timings of the last run.
+
+    Args:
+        orders (int): Number of pasta orders
+    """
+    import contextlib
+    import io
+    import os
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    veggies = ["onions", "garlic", "mushrooms", "peppers"]
+    batch = [("spaghetti", veggies[: 1 + n % 4], "tomato", ["basil", "oregano"])
+             for n in range(orders)]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [make_pasta_dish(*order) for order in batch]
+    print(f"⏱️ Pasta line, {orders:,} orders:")
+    print(f"   🐢 make_pasta_dish loop: {time.perf_counter() - start:.3f}s")
+
+    workers = os.cpu_count() or 1
+    runs = [("sequential stages", None),
+            ("thread pool", ThreadPoolExecutor(workers)),
+            ("process pool", ProcessPoolExecutor(workers))]
+    for label, executor in runs:
+        timer = StageTimer()
+        start = time.perf_counter()
+        # Process pools pay for pickling, so send them bigger in-flight windows
+        dishes = list(make_pasta_dishes(batch, executor, max_pending=256, timer=timer))
+        seconds = time.perf_counter() - start
+        if executor is not None:
+            executor.shutdown()
+        assert dishes == expected
+        print(f"   🚀 {label:<17}: {seconds:.3f}s (bottleneck: {timer.bottleneck})")
+    timer.report()
+    print()
+
+def benchmark_recipe_validation(recipes=1_000_000, failure_rate=0.1):
+    """
+    Compare RecipeSchema.validate_many with a try/except complex_recipe loop.
+
+    Args:
+        recipes (int): Number of recipe dicts
+        failure_rate (float): Share of recipes with a bad cooking method
+    """
+    every = round(1 / failure_rate)
+    batch = [
+        {"name": f"dish_{n}", "ingredients": ["flour", "eggs"],
+         "cooking_method": "microwave" if n % every == 0 else COOKING_METHODS[n % 5],
+         "temperature": 350, "time_minutes": 30}
+        for n in range(recipes)
+    ]
+
+    start = time.perf_counter()
+    failures = 0
+    for recipe in batch:
+        try:
+            complex_recipe(quiet=True, **recipe)
+        except ValueError:
+            failures += 1
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    errors = DEFAULT_RECIPE_SCHEMA.validate_many(batch)
+    batch_seconds = time.perf_counter() - start
+
+    assert len(errors) == failures
+    print(f"⏱️ Recipe validation, {recipes:,} recipes ({failures:,} invalid):")
+    print(f"   🐢 complex_recipe try/except: {loop_seconds:.3f}s")
+    print(f"   🚀 validate_many: {batch_seconds:.3f}s")
+    print()
+
+
+def benchmark_import_time(budget_ms=50):
+    """
+    Check that importing the lesson modules stays cheap and silent.
+
+    Each module is imported in a fresh interpreter with -X importtime,
+    the same way `python -X importtime` reports it. The cumulative time
+    of the week1_cli modules must stay under budget_ms and nothing may
+    be printed.
+
+    Args:
+        budget_ms (float): Allowed import time per module in milliseconds
+
+    Raises:
+        AssertionError: If a module is over budget or prints on import
+    """
+    import os
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(f"⏱️ Import time (budget {budget_ms:.0f} ms):")
+    for module in ("week1_cli", "week1_cli.01_variable", "week1_cli.02_control_flow",
+                   "week1_cli.03_loops", "week1_cli.04_functions"):
+        # __import__ (unlike importlib.import_module) is what -X importtime measures
+        code = f"__import__({module!r})"
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=root, capture_output=True, text=True, timeout=60, check=True,
+        )
+        # Lines look like: "import time:  self [us] | cumulative | imported package"
+        cumulative_us = max(
+            int(line.split("|")[1])
+            for line in completed.stderr.splitlines()
+            if line.startswith("import time:") and line.rstrip().endswith(module)
+        )
+        milliseconds = cumulative_us / 1000
+        print(f"   📦 {module:<26}: {milliseconds:7.2f} ms")
+        assert completed.stdout == "", f"{module} printed on import"
+        assert milliseconds <= budget_ms, f"{module} took {milliseconds:.1f} ms to import"
+    print()
+
+
+def main(argv=None):
+    """
+    Run every lesson demo in order, or the benchmarks with --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        benchmark_import_time()
+        benchmark_menu_index()
+        benchmark_batch_billing()
+        stress_test_order_counter()
+        benchmark_order_counter()
+        benchmark_prepare_meals()
+        benchmark_receipts()
+        benchmark_pasta_pipeline()
+        benchmark_recipe_validation()
+        return
+
+    demo_basic_functions()
+    demo_parameters()
+    demo_return_values()
+    demo_scope()
+    demo_multiple_values()
+    demo_docstrings()
+    demo_practical_examples()
+    demo_composition()
+
+
+if __name__ == "__main__":
+    main()
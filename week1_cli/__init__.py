@@ -0,0 +1,60 @@
+"""
+WEEK 1 CLI - The lesson files as an importable package
+======================================================
+
+Every lesson can still be run as a script (python week1_cli/04_functions.py),
+and importing it never prints or asks for input - the demos live in main().
+
+Lesson files start with a number, which `import` statements do not allow,
+so the kitchen functions are re-exported here instead:
+
+    from week1_cli import calculate_bill, validate_menu_item
+    from week1_cli import functions   # the whole 04_functions module
+
+ANALOGY: A pantry with labelled shelves. Nothing is taken off a shelf
+until a recipe actually asks for it, so opening the pantry is instant.
+"""
+
+import importlib
+
+# Short, importable names for the numbered lesson files
+_LESSONS = {
+    "variables": "01_variable",
+    "control_flow": "02_control_flow",
+    "loops": "03_loops",
+    "functions": "04_functions",
+}
+
+# Public name -> lesson file that defines it
+_EXPORTS = {
+    name: "04_functions"
+    for name in (
+        "greet_customer", "greet_customer_name", "prepare_order",
+        "calculate_bill", "calculate_bills", "calculate_tip",
+        "OrderCounter", "AsyncOrderCounter", "take_order", "close_kitchen",
+        "PREP_TIMES", "SIDE_PREP_TIMES", "register_prep_times",
+        "prepare_meal", "prepare_meals",
+        "COOKING_METHODS", "RecipeError", "RecipeSchema", "complex_recipe",
+        "MenuIndex", "validate_menu_item", "render_receipts", "format_receipt",
+        "chop_vegetables", "cook_sauce", "assemble_pasta", "make_pasta_dish",
+        "StageTimer", "stage", "concurrent_stage", "pipeline", "make_pasta_dishes",
+    )
+}
+
+__all__ = sorted([*_LESSONS, *_EXPORTS])
+
+
+def __getattr__(name):
+    """Import the lesson that provides name the first time it is used."""
+    if name in _LESSONS:
+        value = importlib.import_module(f"{__name__}.{_LESSONS[name]}")
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__ entirely
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+ASYNC PROMPTS IN PYTHON - Many Sessions, No Waiting
+===================================================
+
+03_loops.py asks for a password and "Continue? (y/n)" with input(). While
+input() waits, the whole program waits - one customer at a time. With
+asyncio, each session is a coroutine that pauses at its prompt, so one
+thread can keep thousands of sessions going at once.
+
+ANALOGY: The front desk
+- input() = A host who stares at one guest until they answer
+- A session coroutine = A host who takes the next guest while one thinks
+- Channel = Where the answers come from: the counter, the phone, a script
+- Prompt timeout = "I'll come back to you" after too long a silence
+- Lockout = Three wrong passwords and the account is locked
+
+WHAT THIS FILE COVERS:
+1. Channels: terminal, socket or scripted answers behind one interface
+2. PasswordGate and ask_continue(): 03_loops.py's two loops, as coroutines
+3. SessionEngine: per-prompt and per-session timeouts, a socket server
+4. A load test: 10,000 concurrent socket sessions against a local server
+
+USAGE:
+    python week1_cli/async_prompts.py
+    python week1_cli/async_prompts.py --terminal
+    python week1_cli/async_prompts.py --serve 8765
+    python week1_cli/async_prompts.py --load-test 10000
+"""
+
+import argparse
+import asyncio
+import collections
+import sys
+import threading
+import time
+
+PASSWORD = "python123"  # 03_loops.py's password
+PROMPT_END = b": "      # Every prompt ends like "Enter password: "
+
+SessionResult = collections.namedtuple("SessionResult", "account outcome attempts seconds")
+
+
+# ==========================================
+# 1. CHANNELS - Where the answers come from
+# ==========================================
+
+class Channel:
+    """
+    One person's side of a session: ask() a question, say() a message.
+
+    ANALOGY: The counter, the phone line or a written list of answers -
+    the host asks the same questions whichever it is.
+
+    Subclasses provide _readline() (a line, or None when the person has
+    gone) and say(). ask() waits at most timeout seconds for an answer.
+
+    Args:
+        timeout (float): Seconds to wait for each answer (default None: forever)
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+
+    def say(self, text, end="\n"):
+        raise NotImplementedError
+
+    async def _readline(self):
+        raise NotImplementedError
+
+    async def ask(self, prompt):
+        """
+        Show prompt and wait for one line of answer.
+
+        Returns:
+            str: The answer without surrounding whitespace
+
+        Raises:
+            asyncio.TimeoutError: If no answer comes within timeout seconds
+            EOFError: If the person has gone
+        """
+        self.say(prompt, end="")
+        line = await asyncio.wait_for(self._readline(), self.timeout)
+        if line is None:
+            raise EOFError("channel closed")
+        return line.strip()
+
+    def close(self):
+        """Hang up; the default does nothing."""
+
+
+class ScriptedChannel(Channel):
+    """
+    Answers from a list (or fed in later), with everything said recorded.
+
+    ANALOGY: A mystery shopper reading answers off a card, while a
+    notepad records what the host said.
+
+    Args:
+        answers (iterable): Answers given in order; when they run out the
+            channel waits for feed() or close()
+        delay (float): Seconds of "thinking" before each answer (default 0)
+        timeout (float): Seconds to wait for each answer (default None)
+    """
+
+    def __init__(self, answers=(), delay=0.0, timeout=None):
+        super().__init__(timeout)
+        self.delay = delay
+        self.transcript = []
+        self._answers = collections.deque(answers)
+        self._waiter = None
+
+    def say(self, text, end="\n"):
+        self.transcript.append(text + end)
+
+    def feed(self, answer):
+        """Add an answer after the channel has started."""
+        self._answers.append(answer)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def close(self):
+        """No more answers: the next ask() raises EOFError."""
+        self.feed(None)
+
+    async def _readline(self):
+        if not self._answers:
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        answer = self._answers.popleft()
+        self.transcript.append(f"{answer}\n" if answer is not None else "")
+        return answer
+
+
+class StreamChannel(Channel):
+    """
+    A session over a socket, from asyncio.start_server or open_connection.
+
+    Prompts are sent without a newline, like input() prints them; every
+    answer is one line.
+
+    Args:
+        reader (asyncio.StreamReader): Incoming lines
+        writer (asyncio.StreamWriter): Outgoing text
+        timeout (float): Seconds to wait for each answer (default None)
+    """
+
+    def __init__(self, reader, writer, timeout=None):
+        super().__init__(timeout)
+        self.reader = reader
+        self.writer = writer
+
+    def say(self, text, end="\n"):
+        if not self.writer.is_closing():
+            self.writer.write((text + end).encode())
+
+    async def _readline(self):
+        await self.writer.drain()
+        line = await self.reader.readline()
+        return line.decode(errors="replace") if line else None
+
+    def close(self):
+        self.writer.close()
+
+
+class TerminalChannel(Channel):
+    """
+    A session at the keyboard that does not block the event loop.
+
+    ANALOGY: An assistant stands at the counter and writes down
+    whatever the guest says, so the host is free until there is an
+    answer to read.
+
+    A background thread reads stdin and hands each line to the loop.
+    input() itself cannot be interrupted, so a timed-out prompt leaves
+    the thread waiting: the guest's late answer goes to the next prompt.
+
+    Args:
+        stdin (file): Where lines come from (default sys.stdin)
+        stdout (file): Where prompts go (default sys.stdout)
+        timeout (float): Seconds to wait for each answer (default None)
+    """
+
+    def __init__(self, stdin=None, stdout=None, timeout=None):
+        super().__init__(timeout)
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self._lines = None
+
+    def say(self, text, end="\n"):
+        self.stdout.write(text + end)
+        self.stdout.flush()
+
+    def _pump(self, loop):
+        for line in iter(self.stdin.readline, ""):
+            try:
+                loop.call_soon_threadsafe(self._lines.put_nowait, line)
+            except RuntimeError:  # The loop has finished
+                return
+        try:
+            loop.call_soon_threadsafe(self._lines.put_nowait, None)
+        except RuntimeError:
+            pass
+
+    async def _readline(self):
+        if self._lines is None:
+            self._lines = asyncio.Queue()
+            loop = asyncio.get_running_loop()
+            threading.Thread(target=self._pump, args=(loop,), daemon=True).start()
+        return await self._lines.get()
+
+
+# ==========================================
+# 2. THE TWO LOOPS FROM 03_loops.py
+# ==========================================
+
+class PasswordGate:
+    """
+    03_loops.py's password loop: three wrong answers lock the account.
+
+    ANALOGY: The staff door keypad. Three wrong codes and the door
+    stays shut for that cook until a manager unlocks it.
+
+    Locked accounts are remembered, so a locked cook who comes back in
+    a new session is refused at once.
+
+    Args:
+        password (str): The correct password (default "python123")
+        max_attempts (int): Wrong answers allowed before lockout (default 3)
+    """
+
+    def __init__(self, password=PASSWORD, max_attempts=3):
+        self.password = password
+        self.max_attempts = max_attempts
+        self.locked = set()
+
+    def unlock(self, account):
+        """Let a locked account try again."""
+        self.locked.discard(account)
+
+    async def login(self, channel, account="guest"):
+        """
+        Ask for the password until it is right or the account is locked.
+
+        Returns:
+            tuple: (outcome, attempts) - outcome is "granted", "locked"
+            (this session used up the attempts) or "refused" (it was
+            already locked)
+        """
+        if account in self.locked:
+            channel.say("🚫 Account locked!")
+            return "refused", 0
+        attempts = 0
+        while attempts < self.max_attempts:
+            password = await channel.ask("Enter password: ")
+            if password == self.password:
+                channel.say("✅ Access granted!")
+                return "granted", attempts + 1
+            attempts += 1
+            channel.say(f"❌ Wrong password. {self.max_attempts - attempts} attempts left.")
+        self.locked.add(account)
+        channel.say("🚫 Account locked!")
+        return "locked", attempts
+
+
+async def ask_continue(channel):
+    """
+    03_loops.py's "Continue? (y/n)" loop: ask until the answer is "n".
+
+    Returns:
+        int: How many answers it took
+    """
+    attempts = 0
+    while True:
+        response = (await channel.ask("Continue? (y/n): ")).lower()
+        attempts += 1
+        if response == "n":
+            channel.say(f"👋 Goodbye after {attempts} attempts!")
+            return attempts
+        if response == "y":
+            channel.say(f"🔄 Continuing... (attempt {attempts})")
+        else:
+            channel.say("❓ Please enter 'y' or 'n'")
+
+
+# ==========================================
+# 3. SESSION ENGINE - Many guests, one host
+# ==========================================
+
+class SessionEngine:
+    """
+    Run login-then-continue sessions, as many at once as arrive.
+
+    ANALOGY: One host running the whole front desk. Each guest gets
+    the same questions; nobody waits for another guest's answer.
+
+    Every prompt must be answered within prompt_timeout seconds and
+    the whole session must end within session_timeout. .peak_active
+    and .peak_connections record the most sessions and sockets open at
+    once. Outcomes are
+    counted in .outcomes: "granted" never happens on its own (granted
+    sessions go on to the continue loop and end as "goodbye"); the
+    others are "locked", "refused", "timeout", "closed" and "busy".
+
+    Args:
+        gate (PasswordGate): Checks passwords (default: a new one)
+        prompt_timeout (float): Seconds per answer (default 30)
+        session_timeout (float): Seconds per session (default 300)
+        max_sessions (int): Sessions at once before "busy" (default None: no limit)
+    """
+
+    def __init__(self, gate=None, prompt_timeout=30.0, session_timeout=300.0, max_sessions=None):
+        self.gate = gate or PasswordGate()
+        self.prompt_timeout = prompt_timeout
+        self.session_timeout = session_timeout
+        self.max_sessions = max_sessions
+        self.outcomes = collections.Counter()
+        self.active = 0
+        self.peak_active = 0
+        self.connections = 0
+        self.peak_connections = 0
+
+    async def _session(self, channel, account):
+        outcome, attempts = await self.gate.login(channel, account)
+        if outcome != "granted":
+            return outcome, attempts
+        return "goodbye", attempts + await ask_continue(channel)
+
+    async def run(self, channel, account="guest"):
+        """
+        Run one session on channel.
+
+        Returns:
+            SessionResult: account, outcome, answers given and seconds taken
+        """
+        if self.max_sessions is not None and self.active >= self.max_sessions:
+            channel.say("🚦 The kitchen is full - please try again later.")
+            self.outcomes["busy"] += 1
+            return SessionResult(account, "busy", 0, 0.0)
+
+        channel.timeout = self.prompt_timeout
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        start = time.perf_counter()
+        attempts = 0
+        try:
+            outcome, attempts = await asyncio.wait_for(self._session(channel, account),
+                                                       self.session_timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            channel.say("⌛ No answer in time - session closed.")
+        except (EOFError, ConnectionError):
+            outcome = "closed"
+        finally:
+            self.active -= 1
+        self.outcomes[outcome] += 1
+        return SessionResult(account, outcome, attempts, time.perf_counter() - start)
+
+    async def handle_connection(self, reader, writer):
+        """asyncio.start_server callback: ask for a name, then run a session."""
+        channel = StreamChannel(reader, writer, timeout=self.prompt_timeout)
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        try:
+            account = await channel.ask("Name: ")
+        except asyncio.TimeoutError:
+            self.outcomes["timeout"] += 1
+            channel.say("⌛ No answer in time - session closed.")
+        except (EOFError, ConnectionError):
+            self.outcomes["closed"] += 1
+        else:
+            await self.run(channel, account or "guest")
+        finally:
+            self.connections -= 1
+        channel.close()
+
+    async def serve(self, host="127.0.0.1", port=0, backlog=100):
+        """
+        Start a socket server with one session per connection.
+
+        Returns:
+            asyncio.Server: Call close() to stop it; port 0 picks a free port
+        """
+        return await asyncio.start_server(self.handle_connection, host, port, backlog=backlog)
+
+
+async def run_scripted(scripts, engine=None, delay=0.0):
+    """
+    Run one scripted session per account at the same time.
+
+    Args:
+        scripts (dict): account -> list of answers
+        engine (SessionEngine): Engine to use (default: a new one)
+        delay (float): Seconds of thinking before each answer (default 0)
+
+    Returns:
+        list: (SessionResult, transcript text) per account, in order
+    """
+    engine = engine or SessionEngine()
+    channels = {account: ScriptedChannel(answers, delay) for account, answers in scripts.items()}
+    for channel in channels.values():
+        channel.close()  # Running out of answers means hanging up
+    results = await asyncio.gather(*(engine.run(channel, account)
+                                     for account, channel in channels.items()))
+    return [(result, "".join(channels[result.account].transcript)) for result in results]
+
+
+# ==========================================
+# 4. LOAD TEST - 10,000 guests at once
+# ==========================================
+
+def _client_plan(number):
+    """
+    The answers guest number will give after its name.
+
+    One guest in 20 never answers (and should time out), one in 20 gets
+    the password wrong three times; the rest log in - a third of them
+    after one mistake - and leave after a few continue answers.
+    """
+    kind = number % 20
+    if kind == 0:
+        return None
+    if kind == 1:
+        return ["wrong", "wrong", "wrong"]
+    if number % 3 == 0:
+        return ["wrong", PASSWORD, "y", "maybe", "n"]
+    return [PASSWORD, "y", "n"]
+
+
+async def _swarm(port, sessions, think, connect_limit=500):
+    """Open every session, wait until all are connected, then answer."""
+    import random
+
+    connected = 0
+    failed = 0
+    all_in = asyncio.Event()
+    connecting = asyncio.Semaphore(connect_limit)
+    latencies = []
+
+    async def guest(number):
+        nonlocal connected, failed
+        try:
+            async with connecting:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                await reader.readuntil(PROMPT_END)  # "Name: "
+        except (OSError, asyncio.IncompleteReadError):
+            failed += 1
+            return
+        finally:
+            connected += 1
+            if connected == sessions:
+                all_in.set()
+        await all_in.wait()  # Every session is now open at the same time
+
+        plan = _client_plan(number)
+        if plan is None:
+            await reader.read()  # Say nothing until the server gives up
+        else:
+            for answer in [f"cook{number}", *plan]:
+                await asyncio.sleep(random.uniform(0, think))
+                writer.write(f"{answer}\n".encode())
+                start = time.perf_counter()
+                try:
+                    await reader.readuntil(PROMPT_END)
+                except asyncio.IncompleteReadError:
+                    break  # The session ended after that answer
+                finally:
+                    latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(guest(number)) for number in range(sessions)]
+    await all_in.wait()
+    connect_seconds = time.perf_counter() - start
+    await asyncio.gather(*tasks)
+    latencies.sort()
+    return {
+        "failed": failed,
+        "connect_seconds": connect_seconds,
+        "total_seconds": time.perf_counter() - start,
+        "answers": len(latencies),
+        "p50": latencies[len(latencies) // 2] if latencies else 0.0,
+        "p99": latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+        "max": latencies[-1] if latencies else 0.0,
+    }
+
+
+def _client_swarm(port, sessions, think):
+    """Run the guests in their own process (see load_test)."""
+    return asyncio.run(_swarm(port, sessions, think))
+
+
+def _raise_file_limit(needed):
+    """Raise the open-file limit towards needed; returns the new limit (or None)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+        soft = wanted
+    return soft
+
+
+async def load_test(sessions=10_000, prompt_timeout=15.0, think=5.0):
+    """
+    Hold sessions concurrent socket sessions against a local server.
+
+    The server runs in this process; the guests run in a second process
+    so each side needs only one socket per session. Every guest
+    connects and waits at the "Name: " prompt until all of them are
+    connected, so the server really holds all sessions at once.
+
+    Args:
+        sessions (int): Concurrent sessions (default 10,000)
+        prompt_timeout (float): The server's seconds per answer; it must
+            outlast the connect phase and think (default 15)
+        think (float): Most seconds a guest thinks before each answer;
+            0 makes every guest answer at the same moment (default 5)
+
+    Returns:
+        dict: The guests' timings plus the server's outcomes and peak connections
+    """
+    import multiprocessing
+    import resource
+    from concurrent.futures import ProcessPoolExecutor
+
+    limit = _raise_file_limit(sessions + 256)
+    engine = SessionEngine(prompt_timeout=prompt_timeout)
+    server = await engine.serve(backlog=min(sessions, 4096))
+    port = server.sockets[0].getsockname()[1]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"⏱️ {sessions:,} concurrent sessions on port {port} (file limit {limit}):")
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        stats = await loop.run_in_executor(pool, _client_swarm, port, sessions, think)
+    server.close()
+    await server.wait_closed()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    stats.update(outcomes=dict(engine.outcomes), peak_connections=engine.peak_connections)
+    expected = collections.Counter("timeout" if plan is None else "locked" if "wrong" == plan[-1]
+                                   else "goodbye"
+                                   for plan in map(_client_plan, range(sessions)))
+    print(f"   🔌 Connected in {stats['connect_seconds']:.2f}s "
+          f"({stats['failed']} failed); {engine.peak_connections:,} sessions open at once")
+    print(f"   🏁 All sessions finished in {stats['total_seconds']:.2f}s "
+          f"(silent guests wait {prompt_timeout:g}s for their timeout)")
+    print(f"   ⚡ Reply to an answer: p50 {stats['p50'] * 1e3:.1f} ms, "
+          f"p99 {stats['p99'] * 1e3:.1f} ms, max {stats['max'] * 1e3:.1f} ms "
+          f"({stats['answers']:,} answers)")
+    print(f"   📊 Outcomes {dict(engine.outcomes)}; expected {dict(expected)}")
+    print(f"   💾 Server memory grew {(rss_after - rss_before) / 1024:.1f} MB "
+          f"(~{(rss_after - rss_before) * 1024 / max(engine.peak_connections, 1) / 1024:.1f} KB "
+          f"per open session)")
+    print()
+    return stats
+
+
+def main(argv=None):
+    """
+    Demo scripted sessions, or use --terminal, --serve or --load-test.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="🚪 Async password and continue prompts")
+    parser.add_argument("--terminal", action="store_true", help="log in at the keyboard")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="serve sessions on PORT")
+    parser.add_argument("--load-test", type=int, nargs="?", const=10_000, metavar="SESSIONS",
+                        help="hold SESSIONS concurrent socket sessions (default 10,000)")
+    parser.add_argument("--prompt-timeout", type=float, default=None,
+                        help="seconds to wait for each answer")
+    parser.add_argument("--think", type=float, default=5.0,
+                        help="most seconds a load-test guest thinks per answer (default 5)")
+    args = parser.parse_args(argv)
+
+    if args.load_test:
+        asyncio.run(load_test(args.load_test, args.prompt_timeout or 15.0, args.think))
+        return
+    if args.serve is not None:
+        async def serve():
+            engine = SessionEngine(prompt_timeout=args.prompt_timeout or 30.0)
+            server = await engine.serve(port=args.serve)
+            print(f"🚪 Serving sessions on port {args.serve} (try: nc 127.0.0.1 {args.serve})")
+            async with server:
+                await server.serve_forever()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            print("\n🏁 Closing time!")
+        return
+    if args.terminal:
+        engine = SessionEngine(prompt_timeout=args.prompt_timeout or 30.0)
+        result = asyncio.run(engine.run(TerminalChannel()))
+        print(f"📋 Session ended: {result.outcome} after {result.attempts} answers")
+        return
+
+    print("🚪 ASYNC PROMPTS - Many Sessions, No Waiting")
+    print("=" * 40)
+    engine = SessionEngine(prompt_timeout=0.5)
+    scripts = {
+        "ana": [PASSWORD, "y", "maybe", "n"],
+        "ben": ["pasta", "pizza", "salad"],
+        "cleo": ["pasta", PASSWORD, "n"],
+    }
+    start = time.perf_counter()
+    results = asyncio.run(run_scripted(scripts, engine, delay=0.1))
+    answers = sum(map(len, scripts.values()))
+    print(f"⏱️ {len(scripts)} sessions, 0.1s per answer: {time.perf_counter() - start:.2f}s "
+          f"together, {answers * 0.1:.1f}s one after another")
+    for result, transcript in results:
+        print(f"👤 {result.account}: {result.outcome} after {result.attempts} answers")
+        print("   " + transcript.strip().replace("\n", "\n   "))
+    again = asyncio.run(run_scripted({"ben": [PASSWORD]}, engine))[0][0]
+    print(f"🔒 ben comes back with the right password: {again.outcome}")
+    silent = ScriptedChannel()
+    result = asyncio.run(engine.run(silent, "dan"))
+    print(f"⌛ dan never answers: {result.outcome} after {result.seconds:.1f}s")
+    print()
+
+
+if __name__ == "__main__":
+    main()
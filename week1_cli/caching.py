@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+CACHING IN PYTHON - Remembering Answers, With Limits
+====================================================
+
+calculate_bill(12.99, 2) gives the same answer every time, so working it
+out again is wasted effort. functools.lru_cache remembers answers, but it
+refuses list arguments (like a menu or a list of spices), never forgets
+an answer however old, and can only count entries, not bytes.
+
+ANALOGY: The cashier's cheat sheet
+- Memoizing = Writing down "2 x $12.99 = $28.06" the first time
+- Cache key = How the line on the sheet is labelled
+- TTL = Crossing out lines older than an hour (prices change)
+- Byte bound = The sheet is one page: old lines go when it is full
+- Statistics = Counting how often the sheet saved a calculation
+
+WHAT THIS FILE COVERS:
+1. make_key(): stable cache keys, including for lists, dicts and sets
+2. MemoCache: LRU entries with TTL, entry and byte bounds, statistics
+3. @memoize: a thread-safe drop-in for lru_cache
+4. A hit-path benchmark against lru_cache and no caching
+
+USAGE:
+    python week1_cli/caching.py
+    python week1_cli/caching.py --benchmark
+"""
+
+import collections
+import functools
+import importlib
+import itertools
+import sys
+import threading
+import time
+
+# Pure kitchen functions in 04_functions.py that memoize_kitchen() wraps
+KITCHEN_PURE_FUNCTIONS = ("calculate_bill", "calculate_tip", "cook_sauce", "validate_menu_item")
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", "hits misses evictions expirations currsize maxsize bytes max_bytes"
+)
+
+_ATOMS = (str, int, float, bool, bytes, type(None))
+
+
+# ==========================================
+# 1. CACHE KEYS - Labelling each line
+# ==========================================
+
+_FROZEN = object()  # Tags frozen copies, so no real argument can look like one
+
+
+def _freeze(value):
+    """A hashable stand-in for value that is equal for equal contents."""
+    if isinstance(value, _ATOMS):
+        return value
+    if isinstance(value, (list, tuple)):
+        return (_FROZEN, type(value).__name__, tuple(map(_freeze, value)))
+    if isinstance(value, dict):
+        return (_FROZEN, "dict",
+                frozenset((_freeze(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (_FROZEN, "set", frozenset(map(_freeze, value)))
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"Cannot build a cache key from {type(value).__name__!r}; "
+                        f"pass key= to memoize") from None
+    return value
+
+
+def make_key(args, kwargs):
+    """
+    A hashable key for one call's arguments.
+
+    ANALOGY: Labelling a line on the cheat sheet with exactly what was
+    asked, so the same question always finds the same line.
+
+    Hashable positional arguments are the key as they are (the fast
+    path). Lists, tuples, dicts and sets are turned into frozen copies
+    of their contents, so cook_sauce("tomato", ["basil"]) twice is one
+    entry, while ["basil"] and ("basil",) stay different entries. Other
+    objects are used as they are, which for most classes means "this
+    same object": if such an object changes (a MenuIndex gets a new
+    dish), call cache_clear().
+
+    Raises:
+        TypeError: If an argument is unhashable and not a list, tuple,
+            dict or set
+
+    Example:
+        >>> make_key(("tomato", ["basil", "garlic"]), {}) == make_key(("tomato", ["basil", "garlic"]), {})
+        True
+        >>> make_key((12.99, 2), {})
+        (12.99, 2)
+    """
+    if kwargs:
+        args = (*args, _FROZEN, *sorted(kwargs.items()))
+    try:
+        hash(args)
+    except TypeError:
+        return tuple(map(_freeze, args))
+    return args
+
+
+# ==========================================
+# 2. THE CACHE - One page of answers
+# ==========================================
+
+def approximate_size(key, value):
+    """
+    Bytes an entry roughly holds: key and value plus their direct items.
+
+    sys.getsizeof only counts an object's own header, so the items of
+    a tuple, list or dict are added one level down. That is enough to
+    tell a 60-byte float from a 10 kB receipt.
+    """
+    total = 0
+    for item in (key, value):
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            total += sum(map(sys.getsizeof, item.keys())) + sum(map(sys.getsizeof, item.values()))
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            total += sum(map(sys.getsizeof, item))
+    return total
+
+
+class MemoCache:
+    """
+    A thread-safe least-recently-used cache with expiry and a byte budget.
+
+    ANALOGY: A one-page cheat sheet. New answers go at the bottom,
+    answers that are used move back to the bottom, and when the page
+    is full (maxsize lines or max_bytes of ink) the lines at the top -
+    the ones nobody has needed for longest - are erased. Lines older
+    than ttl seconds are ignored and erased when they are next read.
+
+    Any number of threads can share the cache. A hit takes no lock:
+    reading an entry and moving it to the end are single operations on
+    the C-implemented OrderedDict, and hits are counted with
+    itertools.count, whose next() cannot lose an increment under the
+    GIL. Everything else happens under one lock, and never walks the
+    entries while a hit might move one: expire() copies them into a
+    list first (one C-level step) and eviction pops the oldest with
+    popitem(). Values are computed
+    outside the lock: two threads missing the same key at once both
+    compute it, and the second answer simply replaces the first.
+
+    Args:
+        maxsize (int): Most entries kept (default 1024; None for no limit)
+        max_bytes (int): Most bytes kept, per approximate_size (default None)
+        ttl (float): Seconds an entry stays valid (default None: forever)
+        sizeof (callable): sizeof(key, value) -> bytes (default approximate_size)
+        clock (callable): Returns seconds (default time.monotonic)
+    """
+
+    def __init__(self, maxsize=1024, max_bytes=None, ttl=None, sizeof=approximate_size,
+                 clock=time.monotonic):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self._entries = collections.OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._hits = itertools.count()
+        self._hit_reads = 0
+        self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def hits(self):
+        """How many lookups found a valid entry."""
+        with self._lock:
+            # Reading an itertools.count means advancing it, so subtract earlier reads
+            value = next(self._hits) - self._hit_reads
+            self._hit_reads += 1
+            return value
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        The cached value for key (counted as a hit), or default (a miss).
+
+        Raises:
+            TypeError: If key is unhashable
+        """
+        entry = self._entries.get(key)
+        if entry is not None and (entry[1] is None or entry[1] > self.clock()):
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                pass  # Erased by another thread just now; the answer is still good
+            next(self._hits)
+            return entry[0]
+        with self._lock:
+            if entry is not None and self._entries.get(key) is entry:
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+        return default
+
+    def set(self, key, value):
+        """
+        Store value under key, erasing old entries if over a bound.
+
+        A value bigger than max_bytes on its own is not stored.
+        """
+        size = self.sizeof(key, value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while ((self.maxsize is not None and len(self._entries) > self.maxsize)
+                   or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+                self.evictions += 1
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[2]
+
+    def expire(self):
+        """
+        Erase every expired entry now instead of when it is next read.
+
+        Returns:
+            int: How many entries were erased
+        """
+        if self.ttl is None:
+            return 0
+        now = self.clock()
+        with self._lock:
+            # Hits call move_to_end() without the lock, so walk a copy
+            expired = [key for key, (_, expires_at, _) in list(self._entries.items())
+                       if expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self):
+        """Erase every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._reset_stats()
+
+    def info(self):
+        """Statistics as a CacheInfo, like lru_cache's cache_info()."""
+        hits = self.hits
+        with self._lock:
+            return CacheInfo(hits, self.misses, self.evictions, self.expirations,
+                             len(self._entries), self.maxsize, self._bytes, self.max_bytes)
+
+
+# ==========================================
+# 3. THE DECORATOR - A cheat sheet per function
+# ==========================================
+
+_MISSING = object()
+
+
+def memoize(func=None, *, maxsize=1024, max_bytes=None, ttl=None, key=make_key,
+            sizeof=approximate_size, clock=time.monotonic):
+    """
+    Decorator: remember each call's result in a MemoCache.
+
+    ANALOGY: The cashier writes each answer on the cheat sheet and
+    reads it from there next time - unless it has expired or been
+    erased to make room.
+
+    Use it bare (@memoize) or with options (@memoize(ttl=60)). Like
+    lru_cache, the wrapper has cache_info() and cache_clear(); .cache
+    is the MemoCache itself. Exceptions are not cached.
+
+    Only memoize functions whose result depends on nothing but their
+    arguments: a cached call does not run the function, so anything
+    it prints or changes happens only the first time.
+
+    Args:
+        maxsize (int): Most entries kept (default 1024; None for no limit)
+        max_bytes (int): Most bytes kept (default None)
+        ttl (float): Seconds each result stays valid (default None: forever)
+        key (callable): key(args, kwargs) -> hashable (default make_key)
+        sizeof (callable): sizeof(key, value) -> bytes (default approximate_size)
+        clock (callable): Returns seconds (default time.monotonic)
+    """
+    def decorate(func):
+        cache = MemoCache(maxsize, max_bytes, ttl, sizeof, clock)
+        get = cache.get
+        plain_key = key is make_key
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # make_key(args, {}) is args itself when every argument is hashable:
+            # try that first and only build a key when the lookup cannot hash it
+            cache_key = args if plain_key and not kwargs else key(args, kwargs)
+            try:
+                value = get(cache_key, _MISSING)
+            except TypeError:
+                cache_key = key(args, kwargs)
+                value = get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(cache_key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def load_kitchen():
+    """Import 04_functions.py, whether week1_cli is a package on the path or not."""
+    try:
+        return importlib.import_module("week1_cli.04_functions")
+    except ImportError:
+        return importlib.import_module("04_functions")
+
+
+def memoize_kitchen(**options):
+    """
+    Memoized copies of KITCHEN_PURE_FUNCTIONS from 04_functions.py.
+
+    The module itself is not changed; use the returned functions where
+    repeated calls are expected (e.g. replaying orders). Pass
+    quiet=True to cook_sauce so its output does not depend on whether
+    the call was cached.
+
+    Args:
+        **options: Passed to memoize (maxsize, max_bytes, ttl, ...)
+
+    Returns:
+        dict: name -> memoized function
+    """
+    kitchen = load_kitchen()
+    return {name: memoize(getattr(kitchen, name), **options) for name in KITCHEN_PURE_FUNCTIONS}
+
+
+# ==========================================
+# BENCHMARK - What does a hit cost?
+# ==========================================
+
+def benchmark_hits(calls=1_000_000, threads=8):
+    """
+    Time the hit path of @memoize against lru_cache and no cache.
+
+    Every call uses arguments that are already cached, so the numbers
+    are the price of finding an answer. A thread pool then hammers one
+    cache to check that the statistics add up.
+
+    Args:
+        calls (int): Calls per measurement (default 1M)
+        threads (int): Worker threads for the thread-safety check (default 8)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    kitchen = load_kitchen()
+    menu = ["pizza", "pasta", "salad", "soup", "steak", "fish", "cake", "ice cream"] * 5
+
+    def per_call(func, *args):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter_ns()
+            for _ in range(calls):
+                func(*args)
+            best = min(best, (time.perf_counter_ns() - start) / calls)
+        return best
+
+    cases = [
+        ("calculate_bill(12.99, 2)", kitchen.calculate_bill, (12.99, 2)),
+        ("calculate_tip(25.98)", kitchen.calculate_tip, (25.98,)),
+        ("cook_sauce('tomato', [2 spices])", kitchen.cook_sauce, ("tomato", ["basil", "garlic"], True)),
+        ("validate_menu_item(40-item list)", kitchen.validate_menu_item, ("Pasta", menu)),
+    ]
+    print(f"⏱️ Hit path, best of 3 x {calls:,} calls (ns per call):")
+    print(f"   {'call':<34} {'no cache':>9} {'lru_cache':>10} {'memoize':>9} {'ttl=60':>9}")
+    for label, func, args in cases:
+        plain = per_call(func, *args)
+        lru = functools.lru_cache(maxsize=1024)(func)
+        try:
+            lru(*args)
+            lru_ns = f"{per_call(lru, *args):9.0f}"
+        except TypeError:  # lru_cache cannot hash the list
+            lru_ns = "TypeError"
+        memo = memoize(func)
+        timed = memoize(func, ttl=60)
+        print(f"   {label:<34} {plain:9.0f} {lru_ns:>10} {per_call(memo, *args):9.0f} "
+              f"{per_call(timed, *args):9.0f}")
+
+    bounded = memoize(kitchen.calculate_bill, maxsize=None, max_bytes=64_000)
+    for quantity in range(10_000):
+        bounded(12.99, quantity)
+    info = bounded.cache_info()
+    print(f"   📏 max_bytes=64,000 after 10,000 bills: {info.currsize:,} entries, "
+          f"{info.bytes:,} bytes, {info.evictions:,} evicted")
+
+    shared = memoize(kitchen.calculate_bill, maxsize=500)
+    per_thread = calls // threads
+
+    def replay(offset):
+        for number in range(per_thread):
+            shared(12.99, (number * 7 + offset) % 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(replay, range(threads)))
+    info = shared.cache_info()
+    assert info.hits + info.misses == per_thread * threads
+    assert info.currsize <= 500
+    print(f"   🧵 {threads} threads, {per_thread * threads:,} calls in "
+          f"{time.perf_counter() - start:.2f}s: {info.hits:,} hits + {info.misses:,} misses "
+          f"= every call, {info.evictions:,} evictions, {info.currsize} entries")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the memoized kitchen functions, or run --benchmark [calls].
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        rest = argv[argv.index("--benchmark") + 1:]
+        benchmark_hits(int(rest[0]) if rest else 1_000_000)
+        return
+
+    print("🧠 CACHING - Remembering Answers, With Limits")
+    print("=" * 40)
+    kitchen = memoize_kitchen(ttl=3600)
+    for quantity in (2, 3, 2, 2):
+        kitchen["calculate_bill"](12.99, quantity)
+    print(f"🧾 calculate_bill x4 (2 distinct): {kitchen['calculate_bill'].cache_info()}")
+    for _ in range(3):
+        kitchen["cook_sauce"]("tomato", ["basil", "garlic"], quiet=True)
+    print(f"🍅 cook_sauce with a list, x3: hits={kitchen['cook_sauce'].cache_info().hits}")
+    menu = ["pizza", "pasta", "salad"]
+    checks = [kitchen["validate_menu_item"](dish, menu) for dish in ("Pasta", "Sushi", "Pasta")]
+    print(f"📋 validate_menu_item: {checks} (hits={kitchen['validate_menu_item'].cache_info().hits})")
+
+    now = [0.0]
+    tip = memoize(load_kitchen().calculate_tip, ttl=60, clock=lambda: now[0])
+    tip(50.0)
+    now[0] = 61.0
+    tip(50.0)
+    info = tip.cache_info()
+    print(f"⌛ calculate_tip after 61s with ttl=60: misses={info.misses}, "
+          f"expirations={info.expirations}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
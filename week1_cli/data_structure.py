@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+DATA STRUCTURES IN PYTHON - Picking the Right Container
+=======================================================
+
+Lists, dicts, sets and tuples all hold data, but they answer questions at
+very different speeds. "Is flour in stock?" takes one step in a set and a
+walk past every item in a list.
+
+ANALOGY: Organising the pantry
+- List = Items on a long shelf; finding one means walking along it
+- Set / dict = Labelled bins; you go straight to the right one
+- Count array = A tally sheet next to the bins: how many of each
+- Bloom filter = A sticky note that says "definitely not here" or "maybe here"
+- Bitmap = A wall of light switches, one per product number
+- Sorted index = Items lined up by price, so you can grab a price range
+
+WHAT THIS FILE COVERS:
+1. Inventory: O(1) "do we have it, and how many?"
+2. Bitmap and BloomFilter: tiny prefilters for huge catalogs
+3. PriceIndex: price-range queries with bisect
+4. A benchmark that measures each choice (the README quotes its numbers)
+"""
+
+import bisect
+import math
+import sys
+import time
+from array import array
+
+
+# ==========================================
+# 1. INVENTORY - Labelled bins plus a tally sheet
+# ==========================================
+
+class Inventory:
+    """
+    Stock counts with O(1) membership and stock checks.
+
+    ANALOGY: 03_loops.py checks `item not in inventory` against a list
+    - walking the whole shelf each time. Here every item has a bin
+    number (a dict, i.e. a hash table) and its count sits at that
+    number in a compact array.
+
+    Example:
+        >>> pantry = Inventory({"flour": 5, "eggs": 12})
+        >>> "flour" in pantry, pantry.count("milk")
+        (True, 0)
+        >>> pantry.missing(["flour", "eggs", "vanilla"])
+        ['vanilla']
+    """
+
+    def __init__(self, stock=None):
+        self._slots = {}
+        self._counts = array("q")
+        if stock:
+            for item, count in stock.items():
+                self.add(item, count)
+
+    def add(self, item, count=1):
+        """
+        Put count more of item into stock.
+
+        Raises:
+            ValueError: If count is negative
+        """
+        if count < 0:
+            raise ValueError(f"Cannot add a negative count ({count}) of {item!r}")
+        slot = self._slots.get(item)
+        if slot is None:
+            self._slots[item] = len(self._counts)
+            self._counts.append(count)
+        else:
+            self._counts[slot] += count
+
+    def take(self, item, count=1):
+        """
+        Take count of item out of stock.
+
+        Raises:
+            ValueError: If count is negative or there are fewer than count in stock
+            KeyError: If item was never stocked
+        """
+        if count < 0:
+            raise ValueError(f"Cannot take a negative count ({count}) of {item!r}")
+        slot = self._slots.get(item)
+        if slot is None:
+            raise KeyError(f"{item!r} was never stocked")
+        have = self._counts[slot]
+        if have < count:
+            raise ValueError(f"Only {have} of {item!r} in stock, {count} needed")
+        self._counts[slot] -= count
+
+    def count(self, item):
+        """How many of item are in stock (0 if never stocked)."""
+        slot = self._slots.get(item)
+        return 0 if slot is None else self._counts[slot]
+
+    def __contains__(self, item):
+        slot = self._slots.get(item)
+        return slot is not None and self._counts[slot] > 0
+
+    def has(self, item, needed=1):
+        """True if at least needed of item are in stock."""
+        return self.count(item) >= needed
+
+    def missing(self, items):
+        """
+        The items that are out of stock, in the order asked.
+
+        Returns:
+            list: Items with a count of zero (empty if all are available)
+        """
+        return [item for item in items if item not in self]
+
+    def __len__(self):
+        """Number of different items currently in stock."""
+        return len(self._counts) - self._counts.count(0)
+
+    def items(self):
+        """Yield (item, count) for every item in stock."""
+        counts = self._counts
+        for item, slot in self._slots.items():
+            if counts[slot]:
+                yield item, counts[slot]
+
+
+# ==========================================
+# 2. PREFILTERS - "Definitely not" in a few bits
+# ==========================================
+
+class Bitmap:
+    """
+    One bit per integer id: exact membership for dense product numbers.
+
+    ANALOGY: A wall of light switches numbered 0 to size-1. Switching
+    on #4711 means product 4711 is in the catalog.
+
+    Ten million ids fit in 1.25 MB, against hundreds of MB for a set
+    of ints.
+
+    Args:
+        size (int): Ids run from 0 to size - 1
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._bits = bytearray((size + 7) // 8)
+
+    def _check(self, number):
+        if not 0 <= number < self.size:
+            raise IndexError(f"Id {number} is outside 0-{self.size - 1}")
+
+    def add(self, number):
+        """Switch on one id."""
+        self._check(number)
+        self._bits[number >> 3] |= 1 << (number & 7)
+
+    def update(self, numbers):
+        """Switch on many ids."""
+        bits = self._bits
+        for number in numbers:
+            self._check(number)
+            bits[number >> 3] |= 1 << (number & 7)
+
+    def __contains__(self, number):
+        return 0 <= number < self.size and bool(self._bits[number >> 3] >> (number & 7) & 1)
+
+    def __len__(self):
+        """Number of ids switched on."""
+        return sum(map(int.bit_count, self._bits))
+
+    def nbytes(self):
+        """Bytes used by the bits."""
+        return len(self._bits)
+
+
+_MASK64 = 0xFFFF_FFFF_FFFF_FFFF
+
+
+class BloomFilter:
+    """
+    A compact "definitely not / maybe" test for any hashable items.
+
+    ANALOGY: A sticky note on the walk-in freezer. If the note says a
+    dish's ingredients are not inside, don't bother opening the door.
+    If it says "maybe", go and look - it is right almost every time.
+
+    Never says "no" for an item that was added. Says "maybe" for an
+    item that was not added with probability about error_rate. Use it
+    in front of a slow lookup (a disk file, a database, another
+    service) so most misses never reach it.
+
+    It uses Python's hash(), which changes between runs for strings,
+    so a filter is only valid inside the process that built it.
+
+    Args:
+        capacity (int): Expected number of items
+        error_rate (float): Wanted false-"maybe" rate (default 1%)
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be at least 1 and error_rate between 0 and 1")
+        # Standard sizing: m = -n ln(p) / ln(2)^2 bits, k = m/n ln(2) hashes
+        self.bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: k positions from two halves of one 64-bit hash.
+        # hash(n) is n for small ints, so mix it first (splitmix64's
+        # finalizer) or the high half is 0 and the k bits sit side by side.
+        value = (hash(item) + 0x9E37_79B9_7F4A_7C15) & _MASK64
+        value = ((value ^ (value >> 30)) * 0xBF58_476D_1CE4_E5B9) & _MASK64
+        value = ((value ^ (value >> 27)) * 0x94D0_49BB_1331_11EB) & _MASK64
+        value ^= value >> 31
+        bits = self.bits
+        # An odd step from 1 to bits - 1: never a multiple of bits, so the probes spread
+        first, step = value & 0xFFFF_FFFF, (value >> 32) % (bits - 1) | 1
+        return [(first + index * step) % bits for index in range(self.hashes)]
+
+    def add(self, item):
+        """Remember item."""
+        table = self._array
+        for position in self._positions(item):
+            table[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items):
+        """Remember many items."""
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        table = self._array
+        for position in self._positions(item):
+            if not table[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
+
+    def nbytes(self):
+        """Bytes used by the bits."""
+        return len(self._array)
+
+
+# ==========================================
+# 3. PRICE INDEX - Items lined up by price
+# ==========================================
+
+class PriceIndex:
+    """
+    Dishes sorted by price, for fast price-range questions.
+
+    ANALOGY: The menu board ordered from cheapest to dearest. "What can
+    I get for $10-$15?" means finding where $10 starts and $15 ends -
+    two quick binary searches, not a walk past every dish.
+
+    Prices are in cents (as in calculate_bills()).
+
+    Args:
+        dishes (iterable): (name, price_cents) pairs
+    """
+
+    def __init__(self, dishes=()):
+        pairs = sorted(dishes, key=lambda pair: pair[1])
+        self._prices = array("q", [price for _, price in pairs])
+        self._names = [name for name, _ in pairs]
+
+    def add(self, name, price_cents):
+        """Insert one dish in price order (O(n): rebuild for big batches)."""
+        position = bisect.bisect_right(self._prices, price_cents)
+        self._prices.insert(position, price_cents)
+        self._names.insert(position, name)
+
+    def _span(self, low, high):
+        return bisect.bisect_left(self._prices, low), bisect.bisect_right(self._prices, high)
+
+    def between(self, low, high):
+        """
+        Dishes priced from low to high cents, inclusive, cheapest first.
+
+        Returns:
+            list: (name, price_cents) pairs
+        """
+        start, end = self._span(low, high)
+        return list(zip(self._names[start:end], self._prices[start:end]))
+
+    def count_between(self, low, high):
+        """How many dishes cost from low to high cents - without listing them."""
+        start, end = self._span(low, high)
+        return end - start
+
+    def cheapest(self, count=1):
+        """The count cheapest dishes."""
+        return list(zip(self._names[:count], self._prices[:count]))
+
+    def __len__(self):
+        return len(self._prices)
+
+
+# ==========================================
+# BENCHMARK - Numbers for "when to use each structure"
+# ==========================================
+
+def _per_lookup(check, probes, repeat=3):
+    """Best time per probe, in nanoseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for probe in probes:
+            check(probe)
+        best = min(best, time.perf_counter() - start)
+    return best / len(probes) * 1e9
+
+
+def benchmark_structures(sizes=(1_000, 100_000, 1_000_000)):
+    """
+    Measure lookups, memory and range queries at several sizes.
+
+    Prints a Markdown table; the README's guidance quotes one run.
+
+    Args:
+        sizes (tuple): Number of items to test
+    """
+    import random
+    import tracemalloc
+
+    def memory(build):
+        tracemalloc.start()
+        built = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return built, current
+
+    print("| Items | Structure | Lookup (ns) | Memory (bytes/item) |")
+    print("|------:|-----------|------------:|--------------------:|")
+    for size in sizes:
+        names, name_bytes = memory(lambda: [f"ingredient_{n}" for n in range(size)])
+        rng = random.Random(size)
+        probes = [names[rng.randrange(size)] for _ in range(500)] + [f"missing_{n}" for n in range(500)]
+        list_probes = probes if size <= 100_000 else probes[::50]  # Lists are too slow for all
+
+        as_set, set_bytes = memory(lambda: set(names))
+        inventory, inventory_bytes = memory(lambda: Inventory(dict.fromkeys(names, 3)))
+        bloom, bloom_bytes = memory(lambda: _built(BloomFilter(size), names))
+        ids = [rng.randrange(size * 10) for _ in range(size)]
+        bitmap, bitmap_bytes = memory(lambda: _built(Bitmap(size * 10), ids))
+        id_probes = ids[:500] + [rng.randrange(size * 10) for _ in range(500)]
+
+        rows = [
+            ("list (`in`)", _per_lookup(names.__contains__, list_probes), name_bytes),
+            ("set", _per_lookup(as_set.__contains__, probes), set_bytes),
+            ("Inventory", _per_lookup(inventory.__contains__, probes), inventory_bytes),
+            ("BloomFilter (1%)", _per_lookup(bloom.__contains__, probes), bloom_bytes),
+            ("Bitmap (int ids)", _per_lookup(bitmap.__contains__, id_probes), bitmap_bytes),
+        ]
+        for label, nanoseconds, used in rows:
+            print(f"| {size:,} | {label} | {nanoseconds:,.0f} | {used / size:,.1f} |")
+
+        prices = [(name, 500 + rng.randrange(5000)) for name in names]
+        index = PriceIndex(prices)
+        scan = _per_lookup(lambda low: [pair for pair in prices if low <= pair[1] <= low + 100],
+                           range(1000, 1010) if size <= 100_000 else range(1000, 1002), repeat=1)
+        indexed = _per_lookup(lambda low: index.between(low, low + 100), range(1000, 1100))
+        counted = _per_lookup(lambda low: index.count_between(low, low + 100), range(1000, 1100))
+        print(f"| {size:,} | $1 price range: scan list | {scan:,.0f} | |")
+        print(f"| {size:,} | $1 price range: PriceIndex.between | {indexed:,.0f} | |")
+        print(f"| {size:,} | $1 price range: PriceIndex.count_between | {counted:,.0f} | |")
+    print()
+
+
+def _built(structure, items):
+    structure.update(items)
+    return structure
+
+
+def main(argv=None):
+    """
+    Demo the structures, or run the benchmark with --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        benchmark_structures()
+        return
+
+    print("🗄️ DATA STRUCTURES - Picking the Right Container")
+    print("=" * 40)
+    pantry = Inventory({"flour": 5, "eggs": 12, "milk": 2, "sugar": 3, "butter": 1, "vanilla": 1})
+    needed = ["flour", "eggs", "vanilla"]
+    print(f"📦 Pantry holds {len(pantry)} items; missing for the cake: {pantry.missing(needed) or 'nothing'}")
+    pantry.take("vanilla")
+    print(f"🍰 Used the vanilla; missing now: {pantry.missing(needed)}")
+    try:
+        pantry.take("eggs", 20)
+    except ValueError as error:
+        print(f"❌ {error}")
+
+    catalog = BloomFilter(capacity=1000)
+    catalog.update(["truffle_oil", "saffron", "vanilla"])
+    print(f"🔎 Bloom filter ({catalog.nbytes()} bytes): saffron maybe? {'saffron' in catalog}; "
+          f"caviar maybe? {'caviar' in catalog}")
+
+    products = Bitmap(10_000)
+    products.update([42, 4711, 9999])
+    print(f"💡 Bitmap: #4711 listed? {4711 in products}; #4712 listed? {4712 in products}")
+
+    menu = PriceIndex([("soup", 650), ("salad", 850), ("pasta", 1250), ("pizza", 1899),
+                       ("steak", 2900), ("cake", 700)])
+    print(f"💰 Dishes from $6 to $9: {menu.between(600, 900)}")
+    print(f"🥇 Cheapest two: {menu.cheapest(2)}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
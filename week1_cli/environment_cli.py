@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+ENVIRONMENT VARIABLES IN PYTHON - Configuring Apps
+==================================================
+
+Environment variables let the same program behave differently on a laptop,
+a test server and in production without changing the code: the tax rate,
+the number of tables or the restaurant's name come from outside.
+
+ANALOGY: The restaurant's opening checklist
+- os.environ = Notes the manager leaves on the kitchen door
+- .env file = The printed checklist kept in the drawer
+- Settings snapshot = The whiteboard copied from both before service starts
+- Reload = Rewriting the whiteboard only when a note actually changed
+
+WHAT THIS FILE COVERS:
+1. Turning text like "8", "0.08", "yes" and "pizza,pasta" into typed values
+2. Reading a .env file
+3. A typed __slots__ settings snapshot, read once
+4. Reloading only when the environment or the .env file changed
+5. A command line that prints the effective configuration
+
+USAGE:
+    python week1_cli/environment_cli.py
+    python week1_cli/environment_cli.py --env-file .env --format json
+    KITCHEN_TABLES=12 python week1_cli/environment_cli.py
+    python week1_cli/environment_cli.py --benchmark
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+
+DEFAULT_ENV_FILE = ".env"
+
+
+# ==========================================
+# 1. COERCION - Text in, typed values out
+# ==========================================
+
+_TRUE = frozenset({"1", "true", "yes", "on", "y"})
+_FALSE = frozenset({"0", "false", "no", "off", "n", ""})
+
+def to_bool(text):
+    """
+    Read "yes"/"no", "true"/"false", "on"/"off" or "1"/"0" as a bool.
+
+    Raises:
+        ValueError: If the text is none of those
+    """
+    lowered = text.strip().lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"Not a boolean: {text!r}")
+
+
+def to_list(text):
+    """Split "pizza, pasta,salad" into ["pizza", "pasta", "salad"]."""
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+COERCERS = {str: str, int: int, float: float, bool: to_bool, list: to_list}
+
+Field = collections.namedtuple("Field", ["type", "default"])
+
+
+def coerce(name, text, kind):
+    """
+    Convert one variable's text to kind.
+
+    Raises:
+        ValueError: If the text cannot be converted (the message names the variable)
+    """
+    try:
+        return COERCERS[kind](text)
+    except ValueError as error:
+        raise ValueError(f"{name}={text!r} is not a valid {kind.__name__}: {error}") from None
+
+
+# ==========================================
+# 2. .ENV FILES - The checklist in the drawer
+# ==========================================
+
+def read_env_file(path):
+    """
+    Read KEY=VALUE lines from a .env file.
+
+    Blank lines and lines starting with # are skipped, an "export "
+    prefix is allowed and matching quotes around a value are removed.
+
+    Returns:
+        dict: name -> text ({} if the file does not exist)
+    """
+    values = {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        return values
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        name, _, value = line.partition("=")
+        name = name.removeprefix("export ").strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values[name] = value
+    return values
+
+
+# ==========================================
+# 3. SETTINGS SNAPSHOT - The whiteboard
+# ==========================================
+
+class Settings:
+    """
+    Base class for read-only, typed settings.
+
+    ANALOGY: The whiteboard in the kitchen. Everybody reads it all
+    evening; nobody scribbles on it during service.
+
+    Subclasses are made with define_settings(). Every field is a slot,
+    so reading settings.tables is a plain attribute lookup - no dict,
+    no property, no parsing. List fields are stored as tuples, so
+    nobody can append to a snapshot's menu (or to a shared default).
+    """
+
+    __slots__ = ()
+    FIELDS = {}
+    PREFIX = ""
+
+    def __init__(self, **values):
+        for name in self.FIELDS:
+            value = values[name]
+            if isinstance(value, list):
+                value = tuple(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only; change the environment and reload")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self):
+        """Return the settings as a plain dict."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def variable(cls, name):
+        """The environment variable that sets a field, e.g. KITCHEN_TABLES."""
+        return cls.PREFIX + name.upper()
+
+
+def define_settings(class_name, fields, prefix=""):
+    """
+    Make a Settings subclass with one slot per field.
+
+    Args:
+        class_name (str): Name of the new class
+        fields (dict): field name -> Field(type, default); type is one
+            of str, int, float, bool or list (read into a tuple)
+        prefix (str): Prepended to upper-cased field names to get the
+            environment variable names
+
+    Returns:
+        type: The new Settings subclass
+
+    Raises:
+        ValueError: If a field has an unsupported type
+    """
+    for name, field in fields.items():
+        if field.type not in COERCERS:
+            raise ValueError(f"Field {name!r} has unsupported type {field.type!r}. "
+                             f"Must be one of: {[kind.__name__ for kind in COERCERS]}")
+    return type(class_name, (Settings,), {
+        "__slots__": tuple(fields),
+        "FIELDS": dict(fields),
+        "PREFIX": prefix,
+    })
+
+
+KitchenSettings = define_settings("KitchenSettings", {
+    "restaurant_name": Field(str, "Python Bistro"),
+    "tables": Field(int, 8),
+    "tax_rate": Field(float, 0.08),
+    "open_late": Field(bool, False),
+    "menu": Field(list, ("pizza", "pasta", "salad")),
+}, prefix="KITCHEN_")
+
+
+# ==========================================
+# 4. LOADING AND RELOADING
+# ==========================================
+
+class ConfigLoader:
+    """
+    Build a settings snapshot from os.environ and a .env file.
+
+    ANALOGY: The manager who copies the door notes and the drawer
+    checklist onto the whiteboard, and only wipes it when a note changed.
+
+    Variables in the environment win over the .env file, which wins
+    over the field defaults. get() compares a cheap stamp - the .env
+    file's mtime and size plus the values of this class's variables -
+    and only re-parses when it changed. In a hot path call get() once
+    per request and then read attributes from the snapshot.
+
+    Args:
+        settings_class (type): A class made with define_settings()
+        env_file (str): Optional .env file (default ".env"; None for none)
+        environ (mapping): Where to read variables (default os.environ)
+    """
+
+    def __init__(self, settings_class=KitchenSettings, env_file=DEFAULT_ENV_FILE, environ=None):
+        self.settings_class = settings_class
+        self.env_file = env_file
+        self.environ = os.environ if environ is None else environ
+        self.reloads = 0
+        self._variables = [settings_class.variable(name) for name in settings_class.FIELDS]
+        self._stamp = None
+        self._snapshot = None
+        self.sources = {}
+
+    def _current_stamp(self):
+        file_stamp = None
+        if self.env_file is not None:
+            try:
+                info = os.stat(self.env_file)
+                file_stamp = (info.st_mtime_ns, info.st_size)
+            except FileNotFoundError:
+                pass
+        get = self.environ.get
+        return file_stamp, tuple([get(variable) for variable in self._variables])
+
+    def _build(self):
+        from_file = read_env_file(self.env_file) if self.env_file is not None else {}
+        values, sources = {}, {}
+        for name, field in self.settings_class.FIELDS.items():
+            variable = self.settings_class.variable(name)
+            if variable in self.environ:
+                values[name] = coerce(variable, self.environ[variable], field.type)
+                sources[name] = "environment"
+            elif variable in from_file:
+                values[name] = coerce(variable, from_file[variable], field.type)
+                sources[name] = self.env_file
+            else:
+                values[name] = field.default
+                sources[name] = "default"
+        return self.settings_class(**values), sources
+
+    def get(self):
+        """
+        Return the current snapshot, re-reading only if something changed.
+
+        Raises:
+            ValueError: If a variable cannot be converted to its field's type
+        """
+        stamp = self._current_stamp()
+        if stamp != self._stamp:
+            self._snapshot, self.sources = self._build()
+            self._stamp = stamp
+            self.reloads += 1
+        return self._snapshot
+
+
+# ==========================================
+# BENCHMARK - Is a snapshot lookup as cheap as an attribute?
+# ==========================================
+
+def benchmark_access(number=2_000_000):
+    """
+    Time reading one setting in different ways.
+
+    Args:
+        number (int): Reads per approach
+    """
+    import timeit
+
+    class Plain:
+        def __init__(self):
+            self.tables = 8
+
+    loader = ConfigLoader(env_file=None, environ={"KITCHEN_TABLES": "8"})
+    snapshot = loader.get()
+    plain = Plain()
+    as_dict = {"tables": 8}
+    environ = {"KITCHEN_TABLES": "8"}
+
+    runs = [
+        ("plain object attribute", "plain.tables"),
+        ("Settings snapshot", "snapshot.tables"),
+        ("dict lookup", "as_dict['tables']"),
+        ("environ.get + int()", "int(environ.get('KITCHEN_TABLES', '8'))"),
+        ("loader.get().tables", "loader.get().tables"),
+    ]
+    names = {"plain": plain, "snapshot": snapshot, "as_dict": as_dict,
+             "environ": environ, "loader": loader}
+    print(f"⏱️ Reading one setting ({number:,} reads, best of 5):")
+    for label, statement in runs:
+        seconds = min(timeit.repeat(statement, globals=names, number=number, repeat=5))
+        print(f"   ⚙️ {label:<23}: {seconds / number * 1e9:6.1f} ns per read")
+    print()
+
+
+# ==========================================
+# COMMAND LINE
+# ==========================================
+
+def main(argv=None):
+    """
+    Print the effective configuration, or run the benchmark with --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="⚙️ Show the kitchen's effective configuration")
+    parser.add_argument("--env-file", default=DEFAULT_ENV_FILE, help=".env file to read")
+    parser.add_argument("--format", choices=("plain", "json", "env"), default="plain",
+                        help="output format")
+    parser.add_argument("--benchmark", action="store_true", help="time attribute access")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_access()
+        return
+
+    loader = ConfigLoader(env_file=args.env_file)
+    try:
+        settings = loader.get()
+    except ValueError as error:
+        print(f"❌ {error}")
+        sys.exit(1)
+
+    if args.format == "json":
+        print(json.dumps(settings.as_dict(), indent=2))
+    elif args.format == "env":
+        for name, value in settings.as_dict().items():
+            if isinstance(value, tuple):
+                value = ",".join(value)
+            elif isinstance(value, bool):
+                value = str(value).lower()
+            print(f"{settings.variable(name)}={value}")
+    else:
+        print("⚙️ ENVIRONMENT - Effective Configuration")
+        print("=" * 40)
+        for name, value in settings.as_dict().items():
+            print(f"   {settings.variable(name):<24} = {value!r:<30} ({loader.sources[name]})")
+        print()
+
+
+if __name__ == "__main__":
+    main()
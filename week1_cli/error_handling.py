@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+ERROR HANDLING IN PYTHON - Retries, Breakers and Batches
+========================================================
+
+try/except handles one failure at a time. Real kitchens need more: try the
+supplier again in a moment, stop calling a supplier that is clearly down,
+and list every bad order in a batch instead of stopping at the first.
+
+ANALOGY: Dealing with a flaky supplier
+- Retry with backoff = Calling again, waiting a little longer each time
+- Jitter = Not every restaurant calls back at exactly the same second
+- Circuit breaker = "Stop calling them for 30 minutes, they're down"
+- Error collector = A clipboard listing every problem in the delivery
+
+WHAT THIS FILE COVERS:
+1. @retry: jittered exponential backoff for functions and coroutines
+2. CircuitBreaker: fail fast while a dependency is down
+3. ErrorCollector: gather a batch's failures without raising per item
+
+Every decorator works on plain functions and on async functions.
+"""
+
+import asyncio
+import collections
+import functools
+import inspect
+import operator
+import random
+import sys
+import threading
+import time
+
+
+# ==========================================
+# 1. RETRY WITH JITTERED EXPONENTIAL BACKOFF
+# ==========================================
+
+def backoff_delays(attempts, base_delay=0.1, max_delay=10.0, jitter=True, rng=random.random):
+    """
+    Yield the waits between attempts: base_delay, 2x, 4x, ... up to max_delay.
+
+    ANALOGY: Calling the supplier back after 1 minute, then 2, then 4.
+    With jitter each wait is a random time up to that value ("full
+    jitter"), so many callers who failed together do not all call back
+    together.
+
+    Args:
+        attempts (int): Total attempts (one fewer waits are yielded)
+        base_delay (float): First wait in seconds (default 0.1)
+        max_delay (float): Longest wait in seconds (default 10)
+        jitter (bool): Randomise each wait (default True)
+        rng (callable): Returns a float in [0, 1) (default random.random)
+    """
+    for attempt in range(attempts - 1):
+        delay = min(max_delay, base_delay * 2 ** attempt)
+        yield delay * rng() if jitter else delay
+
+
+def retry(attempts=3, base_delay=0.1, max_delay=10.0, exceptions=(Exception,), jitter=True,
+          sleep=None):
+    """
+    Decorator: call the function again when it raises one of exceptions.
+
+    ANALOGY: A waiter who politely asks the kitchen again - but gives
+    up after a few tries and tells the customer what went wrong.
+
+    Works on plain and async functions; async functions wait with
+    asyncio.sleep so other tasks keep running. The last exception is
+    re-raised once all attempts have failed.
+
+    Args:
+        attempts (int): Total attempts including the first (default 3)
+        base_delay (float): First wait in seconds (default 0.1)
+        max_delay (float): Longest wait in seconds (default 10)
+        exceptions (tuple): Exception types worth retrying (default Exception)
+        jitter (bool): Randomise waits (default True)
+        sleep (callable): Replaces time.sleep / asyncio.sleep, e.g. in tests
+
+    Raises:
+        ValueError: If attempts is less than 1
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1")
+
+    def decorate(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                wait = sleep or asyncio.sleep
+                for delay in backoff_delays(attempts, base_delay, max_delay, jitter):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions:
+                        await wait(delay)
+                return await func(*args, **kwargs)  # Last try: let it raise
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            wait = sleep or time.sleep
+            for delay in backoff_delays(attempts, base_delay, max_delay, jitter):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions:
+                    wait(delay)
+            return func(*args, **kwargs)  # Last try: let it raise
+        return wrapper
+
+    return decorate
+
+
+# ==========================================
+# 2. CIRCUIT BREAKER - Stop calling a supplier that is down
+# ==========================================
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a function whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency keeps failing.
+
+    ANALOGY: After five failed calls to the fish supplier, the manager
+    says "don't call them for 30 seconds". After that, one person may
+    try once: if it works, everyone may call again; if not, wait again.
+
+    States:
+        closed    - calls go through; failures are counted
+        open      - calls fail at once with CircuitOpenError
+        half_open - one trial call is let through
+
+    Use it as a decorator (@breaker) on plain or async functions, or
+    call breaker.call(func, ...). It is safe to share between threads.
+    Exceptions outside `exceptions` (a cancelled task, a bug in the
+    caller's arguments) pass straight through and change nothing.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit (default 5)
+        reset_timeout (float): Seconds to stay open before a trial call (default 30)
+        exceptions (tuple): Exception types that count as failures (default Exception)
+        clock (callable): Returns seconds (default time.monotonic)
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, exceptions=(Exception,),
+                 clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.exceptions = exceptions
+        self.clock = clock
+        self.failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """"closed", "open" or "half_open"."""
+        if self._opened_at is None:
+            return "closed"
+        if self.clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def _before_call(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return
+            raise CircuitOpenError(f"Circuit open after {self.failures} failures; "
+                                   f"retry in {self.reset_timeout:g}s")
+
+    def _after_call(self, failed):
+        """
+        Record how a call ended: True (a failure), False (a success), or
+        None - an exception the breaker does not count, such as
+        asyncio.CancelledError. That only frees the trial slot and
+        leaves the failure count and the state as they were.
+        """
+        with self._lock:
+            self._trial_running = False
+            if failed is None:
+                return
+            if failed:
+                self.failures += 1
+                if self._opened_at is not None or self.failures >= self.failure_threshold:
+                    self._opened_at = self.clock()  # (Re)open and restart the timer
+            else:
+                self.failures = 0
+                self._opened_at = None
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call func through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self.exceptions:
+            self._after_call(failed=True)
+            raise
+        except BaseException:
+            self._after_call(failed=None)  # Says nothing about the dependency
+            raise
+        self._after_call(failed=False)
+        return result
+
+    async def call_async(self, func, *args, **kwargs):
+        """
+        Await func(*args, **kwargs) through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except self.exceptions:
+            self._after_call(failed=True)
+            raise
+        except BaseException:
+            self._after_call(failed=None)  # E.g. the caller cancelled the task
+            raise
+        self._after_call(failed=False)
+        return result
+
+    def __call__(self, func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.call_async(func, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        return wrapper
+
+
+# ==========================================
+# 3. ERROR COLLECTOR - The delivery clipboard
+# ==========================================
+
+BatchFailure = collections.namedtuple("BatchFailure", ["index", "item", "error"])
+
+_ERROR = operator.itemgetter(2)
+
+
+class BatchError(ValueError):
+    """Raised by ErrorCollector.raise_if_failed(); .failures holds the details."""
+
+    def __init__(self, message, failures):
+        super().__init__(message)
+        self.failures = failures
+
+
+class ErrorCollector:
+    """
+    Collect the failures of a whole batch instead of stopping at the first.
+
+    ANALOGY: The person checking a delivery writes every damaged crate
+    on a clipboard and hands over the list at the end.
+
+    Two ways to feed it:
+    - check_all(check, items): check(item) RETURNS a problem (any truthy
+      value, e.g. a message) or None. No exception is raised per item,
+      so this is the fast way for validation.
+    - collect(func, items): func(item) RAISES on failure. Only failed
+      items pay for an exception; results of the others are returned.
+
+    Both have async versions (acheck_all, acollect). Only the first
+    max_failures failures are kept, but all are counted.
+
+    Args:
+        max_failures (int): Failures to keep in detail (default 1000; None for all)
+    """
+
+    def __init__(self, max_failures=1000):
+        self.max_failures = max_failures
+        self.failures = []
+        self.count = 0
+        self._kinds = collections.Counter()
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def _record(self, failures, raised):
+        """Record a list of (index, item, error) tuples in one go."""
+        self.count += len(failures)
+        # Count exception classes (or returned problems) with C-level maps;
+        # names are only made when by_kind is read
+        errors = map(_ERROR, failures)
+        self._kinds.update(map(type, errors) if raised else errors)
+        room = len(failures) if self.max_failures is None else self.max_failures - len(self.failures)
+        if room > 0:
+            self.failures.extend(map(BatchFailure._make, failures[:room]))
+
+    @property
+    def by_kind(self):
+        """collections.Counter: exception class name or problem text -> count."""
+        kinds = collections.Counter()
+        for kind, count in self._kinds.items():
+            kinds[kind.__name__ if isinstance(kind, type) else str(kind)] += count
+        return kinds
+
+    def add(self, index, item, error):
+        """Record one failure."""
+        self._record([(index, item, error)], isinstance(error, BaseException))
+
+    def check_all(self, check, items):
+        """
+        Run check(item) for every item and record the truthy results.
+
+        Returns:
+            int: Number of items that failed
+        """
+        failures = [(index, item, problem) for index, item in enumerate(items)
+                    if (problem := check(item))]
+        self._record(failures, raised=False)
+        return len(failures)
+
+    def collect(self, func, items, exceptions=(Exception,)):
+        """
+        Run func(item) for every item, recording the ones that raise.
+
+        Exceptions past max_failures are counted by class and dropped at
+        once. Keeping every exception alive (each holds its traceback and
+        frames) is what makes a long raise/catch batch slow: the garbage
+        collector has to walk all of them again and again.
+
+        Returns:
+            list: func's results for the items that succeeded
+        """
+        room = None if self.max_failures is None else self.max_failures - len(self.failures)
+        results, failures, extra_kinds = [], [], []
+        for index, item in enumerate(items):
+            try:
+                results.append(func(item))
+            except exceptions as error:
+                if room is None or len(failures) < room:
+                    failures.append((index, item, error))
+                else:
+                    extra_kinds.append(type(error))
+        self._record(failures, raised=True)
+        self.count += len(extra_kinds)
+        self._kinds.update(extra_kinds)
+        return results
+
+    async def acheck_all(self, check, items):
+        """Like check_all, for an async check."""
+        failures = []
+        for index, item in enumerate(items):
+            problem = await check(item)
+            if problem:
+                failures.append((index, item, problem))
+        self._record(failures, raised=False)
+        return len(failures)
+
+    async def acollect(self, func, items, exceptions=(Exception,), concurrency=100):
+        """
+        Like collect, for an async func, running up to concurrency items at once.
+
+        Returns:
+            list: Results for the items that succeeded, in item order
+        """
+        items = list(items)
+        results, failures = [], []
+        for start in range(0, len(items), concurrency):
+            batch = items[start:start + concurrency]
+            outcomes = await asyncio.gather(*(func(item) for item in batch), return_exceptions=True)
+            for offset, (item, outcome) in enumerate(zip(batch, outcomes)):
+                if isinstance(outcome, exceptions):
+                    failures.append((start + offset, item, outcome))
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    results.append(outcome)
+        self._record(failures, raised=True)
+        return results
+
+    def summary(self):
+        """One line such as "3 failures: ValueError x2, KeyError x1"."""
+        kinds = ", ".join(f"{kind} x{count}" for kind, count in self.by_kind.most_common())
+        return f"{self.count} failures" + (f": {kinds}" if kinds else "")
+
+    def raise_if_failed(self):
+        """
+        Raise one BatchError for everything collected so far.
+
+        Raises:
+            BatchError: If any failure was recorded
+        """
+        if self.count:
+            raise BatchError(self.summary(), self.failures)
+
+
+# ==========================================
+# BENCHMARK - Clipboard vs raise/catch per item
+# ==========================================
+
+def _collector_run(method, func, batch):
+    collector = ErrorCollector()
+    getattr(collector, method)(func, batch)
+    return collector
+
+
+def benchmark_collector(items=1_000_000, failure_rate=0.10):
+    """
+    Time a batch with failures handled three ways.
+
+    Args:
+        items (int): Batch size (default 1M)
+        failure_rate (float): Share of items that fail (default 10%)
+    """
+    every = round(1 / failure_rate)
+    batch = range(items)
+
+    def portion_raises(n):
+        if n % every == 0:
+            raise ValueError("burnt")
+        return n
+
+    def portion_problem(n):
+        return "burnt" if n % every == 0 else None
+
+    def raise_and_catch():
+        results, errors = [], []
+        for index, n in enumerate(batch):
+            try:
+                results.append(portion_raises(n))
+            except ValueError as error:
+                errors.append((index, n, error))
+        return len(errors)
+
+    runs = [
+        ("raise/catch per item", raise_and_catch),
+        ("ErrorCollector.collect", lambda: len(_collector_run("collect", portion_raises, batch))),
+        ("ErrorCollector.check_all", lambda: len(_collector_run("check_all", portion_problem, batch))),
+    ]
+    print(f"⏱️ {items:,} items, {failure_rate:.0%} failing:")
+    for label, run in runs:
+        start = time.perf_counter()
+        failures = run()
+        seconds = time.perf_counter() - start
+        print(f"   📋 {label:<25}: {seconds:.3f}s ({failures:,} failures)")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the toolkit, or run the benchmark with --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        benchmark_collector()
+        return
+
+    print("🛡️ ERROR HANDLING - Retries, Breakers and Batches")
+    print("=" * 40)
+
+    calls = []
+
+    @retry(attempts=4, base_delay=0.01)
+    def call_supplier():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("line busy")
+        return "🐟 fish delivered"
+
+    print(f"📞 {call_supplier()} after {len(calls)} calls")
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    @breaker
+    def order_bread():
+        raise TimeoutError("bakery not answering")
+
+    for _ in range(3):
+        try:
+            order_bread()
+        except (TimeoutError, CircuitOpenError) as error:
+            print(f"🍞 {type(error).__name__}: {error} (circuit {breaker.state})")
+
+    @retry(attempts=2, base_delay=0.01)
+    async def check_oven(number):
+        await asyncio.sleep(0)
+        if number % 3 == 0:
+            raise RuntimeError(f"oven {number} too cold")
+        return number
+
+    collector = ErrorCollector()
+    ready = asyncio.run(collector.acollect(check_oven, range(1, 8)))
+    print(f"🔥 Ovens ready: {ready}; {collector.summary()}")
+
+    orders = [{"dish": "pizza", "quantity": 2}, {"dish": "", "quantity": 1},
+              {"dish": "pasta", "quantity": 0}, {"dish": "salad", "quantity": 3}]
+    collector = ErrorCollector()
+    collector.check_all(lambda order: ("no dish" if not order["dish"] else
+                                       "no quantity" if order["quantity"] < 1 else None), orders)
+    try:
+        collector.raise_if_failed()
+    except BatchError as error:
+        print(f"📋 {error}")
+        for failure in error.failures:
+            print(f"   ❌ order {failure.index}: {failure.error}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
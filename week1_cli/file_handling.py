@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+FILE HANDLING IN PYTHON - Reading Big Files
+===========================================
+
+Files let programs remember data after they stop. Small files can be read
+in one go, but order exports can be gigabytes - far too big to load at once.
+
+ANALOGY: Unloading a delivery truck
+- open().readlines() = Carrying the whole truck into the kitchen at once
+- Chunked reading = Unloading one crate at a time
+- mmap = Walking into the truck and reading the labels where they are
+- Parser = The chef who turns each crate into usable ingredients
+
+WHAT THIS FILE COVERS:
+1. Reading a file in fixed-size chunks
+2. Turning chunks into lines without loading the whole file
+3. Scanning records in place with mmap (no copies)
+4. read_records(): a constant-memory generator of parsed records
+"""
+
+import mmap
+import os
+import sys
+import time
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB per read
+
+
+# ==========================================
+# 1. CHUNKED READING - One crate at a time
+# ==========================================
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield a file's bytes in chunks of at most chunk_size.
+
+    ANALOGY: Unloading the truck crate by crate - the kitchen never
+    holds more than one crate.
+
+    Args:
+        path (str): File to read
+        chunk_size (int): Bytes per chunk (default 1 MiB)
+    """
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+# ==========================================
+# 2. LINES FROM CHUNKS
+# ==========================================
+
+def iter_lines(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding=None):
+    """
+    Yield the lines of a file, reading it in chunks.
+
+    A chunk usually ends halfway through a line, so the unfinished part
+    is carried over and glued to the front of the next chunk.
+
+    Args:
+        path (str): File to read
+        chunk_size (int): Bytes per read (default 1 MiB)
+        encoding (str): Decode lines with this encoding (default: yield bytes)
+
+    Yields:
+        bytes or str: Each line without its trailing newline
+    """
+    leftover = b""
+    for chunk in iter_chunks(path, chunk_size):
+        lines = (leftover + chunk).split(b"\n")
+        leftover = lines.pop()  # Unfinished line (b"" if the chunk ended on a newline)
+        if encoding is None:
+            yield from lines
+        else:
+            for line in lines:
+                yield line.decode(encoding)
+    if leftover:
+        yield leftover if encoding is None else leftover.decode(encoding)
+
+
+# ==========================================
+# 3. MMAP SCANNING - Reading labels inside the truck
+# ==========================================
+
+def scan_records(path, delimiter=b"\n"):
+    """
+    Yield each delimiter-separated record as a memoryview into the file.
+
+    ANALOGY: Reading the crate labels inside the truck instead of
+    carrying every crate out first.
+
+    The file is memory-mapped, so the operating system pages it in as
+    needed and no record is copied. A memoryview is only valid until the
+    next record is requested - call bytes(record) to keep one.
+
+    Args:
+        path (str): File to scan
+        delimiter (bytes): Record separator (default newline)
+
+    Yields:
+        memoryview: Each record without its delimiter
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            record = view
+            try:
+                start, size, step = 0, len(mapped), len(delimiter)
+                find = mapped.find
+                while start < size:
+                    end = find(delimiter, start)
+                    if end == -1:
+                        end = size
+                    record = view[start:end]
+                    yield record
+                    record.release()
+                    start = end + step
+            finally:
+                # Views must be released before the mmap can be closed
+                record.release()
+                view.release()
+
+
+def count_records(path, delimiter=b"\n"):
+    """
+    Count records with mmap without creating any per-record objects.
+
+    Returns:
+        int: Number of records (a last record without a delimiter counts too)
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(delimiter) == 1:
+                # A one-byte delimiter cannot straddle two windows, so count
+                # window by window at C speed
+                count = sum(mapped[start:start + DEFAULT_CHUNK_SIZE].count(delimiter)
+                            for start in range(0, size, DEFAULT_CHUNK_SIZE))
+                return count + (mapped[size - 1:] != delimiter)
+            count, start, step = 0, 0, len(delimiter)
+            find = mapped.find
+            while (end := find(delimiter, start)) != -1:
+                count += 1
+                start = end + step
+            return count + (start < size)
+
+
+# ==========================================
+# 4. PARSED RECORDS - Constant memory
+# ==========================================
+
+def parse_order(line, separator=","):
+    """
+    Parse one "dish,price,quantity" line into a dict.
+
+    ANALOGY: The chef opening a crate and listing what is inside.
+    """
+    dish, price, quantity = line.split(separator)
+    return {"dish": dish, "price": float(price), "quantity": int(quantity)}
+
+
+def read_records(path, parser=parse_order, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+    """
+    Yield parser(line) for every non-empty line of a file.
+
+    Only one chunk and one record are held at a time, so memory use is
+    the same for a 1 KB file and a 10 GB file.
+
+    Args:
+        path (str): File to read
+        parser (callable): Turns one line (str) into a record (default parse_order)
+        chunk_size (int): Bytes per read (default 1 MiB)
+        encoding (str): Text encoding of the file (default utf-8)
+    """
+    for line in iter_lines(path, chunk_size, encoding):
+        if line:
+            yield parser(line.rstrip("\r"))
+
+
+# ==========================================
+# BENCHMARK - Truck unloading race
+# ==========================================
+
+def write_synthetic_orders(path, size_mb):
+    """Write "dish,price,quantity" lines until the file is about size_mb megabytes."""
+    block = "".join(f"dish_{n % 5000},{n % 9000 / 100 + 1:.2f},{1 + n % 7}\n"
+                    for n in range(100_000)).encode()
+    with open(path, "wb") as file:
+        for _ in range(max(1, size_mb * (1 << 20) // len(block))):
+            file.write(block)
+
+
+def benchmark_readers(size_mb=1024):
+    """
+    Compare open().readlines() with the chunked and mmap readers.
+
+    Args:
+        size_mb (int): Size of the synthetic order export (default 1 GB)
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "orders.csv")
+        write_synthetic_orders(path, size_mb)
+        megabytes = os.path.getsize(path) / (1 << 20)
+
+        def readlines():
+            with open(path, "rb") as file:
+                return len(file.readlines())
+
+        runs = [
+            ("open().readlines()", readlines),
+            ("iter_lines", lambda: sum(1 for _ in iter_lines(path))),
+            ("scan_records (mmap)", lambda: sum(1 for _ in scan_records(path))),
+            ("count_records (mmap)", lambda: count_records(path)),
+            ("read_records + parse", lambda: sum(1 for _ in read_records(path))),
+        ]
+        print(f"⏱️ Reading a {megabytes:,.0f} MB order export:")
+        for label, run in runs:
+            start = time.perf_counter()
+            lines = run()
+            seconds = time.perf_counter() - start
+            print(f"   📂 {label:<21}: {seconds:6.2f}s  {megabytes / seconds:7.0f} MB/s  ({lines:,} lines)")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the readers on a small file, or run the benchmark with --benchmark [size_mb].
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    import tempfile
+
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        rest = argv[argv.index("--benchmark") + 1:]
+        benchmark_readers(int(rest[0]) if rest else 1024)
+        return
+
+    print("📂 FILE HANDLING - Reading Big Files")
+    print("=" * 40)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "orders.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("pizza,18.99,2\npasta,12.50,1\nsalad,8.50,3\n")
+
+        print(f"📦 Chunks of 16 bytes: {[bytes(chunk) for chunk in iter_chunks(path, 16)]}")
+        print(f"📋 Lines: {list(iter_lines(path, chunk_size=16, encoding='utf-8'))}")
+        print(f"🔍 Records found with mmap: {count_records(path)}")
+        for record in scan_records(path):
+            print(f"   🏷️ {bytes(record).decode()}")
+        print("🍽️ Parsed orders:")
+        for order in read_records(path):
+            print(f"   {order}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+LIST COMPREHENSIONS IN PYTHON - Measuring Instead of Guessing
+=============================================================
+
+A list comprehension builds a list in one expression:
+
+    quality_products = [p for p in products if "bad" not in p]
+
+The lessons build lists in several ways: 03_loops.py uses an append loop
+for quality control, chop_vegetables() in 04_functions.py uses a
+comprehension. This file measures which is faster, by how much, and what
+each costs in memory - at sizes from 10 to 10 million items.
+
+ANALOGY: Sorting a crate of vegetables
+- Append loop = Picking up each vegetable, deciding, then placing it
+- Comprehension = The same, but the sorter works without stopping to talk
+- Generator = Handing each good vegetable straight to the cook - no crate
+- filter()/map() = A sorting machine built into the conveyor belt
+
+WHAT THIS FILE COVERS:
+1. The same two jobs written four ways (filter the products, chop them)
+2. A timing harness: warmup, repeats, mean/median/stdev
+3. Peak memory of each version with tracemalloc
+4. JSON results you can diff between Python versions
+
+USAGE:
+    python week1_cli/list_comprehensions.py
+    python week1_cli/list_comprehensions.py --benchmark --json results-3.11.json
+    python week1_cli/list_comprehensions.py --benchmark --sizes 10 1000 100000
+    python week1_cli/list_comprehensions.py --compare results-3.11.json results-3.12.json
+"""
+
+import argparse
+import collections
+import json
+import platform
+import statistics
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 10_000_000)
+
+
+# ==========================================
+# 1. ONE JOB, FOUR WAYS
+# ==========================================
+
+def make_products(size):
+    """A list of size products like 03_loops.py's, about 40% of them defective."""
+    kinds = ["good_apple", "bad_apple", "good_banana", "rotten_orange", "good_grape"]
+    return [f"{kinds[n % 5]}_{n}" for n in range(size)]
+
+
+def _exhaust(iterator):
+    """Run an iterator to the end without keeping anything."""
+    collections.deque(iterator, maxlen=0)
+
+
+# Quality control - 03_loops.py's quality_products loop
+
+def quality_append(products):
+    """Append loop, as in 03_loops.py."""
+    quality_products = []
+    for product in products:
+        if "bad" in product or "rotten" in product:
+            continue
+        quality_products.append(product)
+    return quality_products
+
+def quality_comprehension(products):
+    """List comprehension."""
+    return [product for product in products if not ("bad" in product or "rotten" in product)]
+
+def quality_generator(products):
+    """Generator expression, consumed one item at a time (no list is built)."""
+    _exhaust(product for product in products if not ("bad" in product or "rotten" in product))
+
+def quality_filter(products):
+    """filter() with a predicate function."""
+    return list(filter(lambda product: not ("bad" in product or "rotten" in product), products))
+
+
+# Chopping - chop_vegetables() in 04_functions.py
+
+def chop_append(vegetables):
+    """Append loop."""
+    chopped = []
+    for veg in vegetables:
+        chopped.append(f"chopped_{veg}")
+    return chopped
+
+def chop_comprehension(vegetables):
+    """List comprehension, as in chop_vegetables()."""
+    return [f"chopped_{veg}" for veg in vegetables]
+
+def chop_generator(vegetables):
+    """Generator expression, consumed one item at a time (no list is built)."""
+    _exhaust(f"chopped_{veg}" for veg in vegetables)
+
+def chop_map(vegetables):
+    """map() with a bound method - no Python-level function call per item."""
+    return list(map("chopped_".__add__, vegetables))
+
+
+PATTERNS = {
+    "quality_control": {
+        "append loop": quality_append,
+        "comprehension": quality_comprehension,
+        "generator": quality_generator,
+        "filter": quality_filter,
+    },
+    "chop": {
+        "append loop": chop_append,
+        "comprehension": chop_comprehension,
+        "generator": chop_generator,
+        "map": chop_map,
+    },
+}
+
+
+# ==========================================
+# 2. TIMING HARNESS
+# ==========================================
+
+def measure_time(func, data, repeat=5, warmup=1, min_time=0.05):
+    """
+    Time func(data) with warmup runs and several repeats.
+
+    ANALOGY: Letting the cooks warm up before the stopwatch starts,
+    then timing several rounds instead of trusting one.
+
+    Small inputs are run many times per repeat (timeit's autorange)
+    so each repeat lasts at least min_time seconds.
+
+    Returns:
+        dict: seconds per call (mean, median, stdev, min), loops per
+        repeat and nanoseconds per item (from the median)
+    """
+    timer = timeit.Timer(lambda: func(data))
+    for _ in range(warmup):
+        timer.timeit(1)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10
+    samples = [seconds / loops for seconds in timer.repeat(repeat=repeat, number=loops)]
+    median = statistics.median(samples)
+    return {
+        "mean": statistics.fmean(samples),
+        "median": median,
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "loops": loops,
+        "ns_per_item": median / max(len(data), 1) * 1e9,
+    }
+
+
+def measure_peak_memory(func, data):
+    """
+    Peak bytes allocated while running func(data) once.
+
+    The input is already allocated, so this is the memory the version
+    itself needs: the result list, or nothing much for a generator.
+    """
+    tracemalloc.start()
+    try:
+        func(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+# ==========================================
+# 3. THE SUITE AND ITS JSON RESULTS
+# ==========================================
+
+def run_suite(sizes=DEFAULT_SIZES, repeat=5, patterns=PATTERNS, report=print):
+    """
+    Time and measure every version of every pattern at every size.
+
+    Args:
+        sizes (iterable): Input sizes (default 10 to 10M)
+        repeat (int): Timed repeats per measurement (default 5)
+        patterns (dict): pattern -> {version name: function}
+        report (callable): Called with one line of text per measurement
+            (default print; None for silence)
+
+    Returns:
+        dict: metadata (Python version, platform, time) and a results list
+    """
+    results = []
+    for size in sizes:
+        data = make_products(size)
+        for pattern, versions in patterns.items():
+            for version, func in versions.items():
+                timing = measure_time(func, data, repeat=repeat)
+                peak = measure_peak_memory(func, data)
+                results.append({"pattern": pattern, "version": version, "size": size,
+                                "peak_bytes": peak, **timing})
+                if report:
+                    report(f"   {pattern:<16} {version:<14} {size:>11,}: "
+                           f"{timing['median'] * 1e3:10.3f} ms ± {timing['stdev'] * 1e3:7.3f} "
+                           f"({timing['ns_per_item']:6.1f} ns/item, peak {peak / 1024:10,.0f} KiB)")
+        del data
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def write_results(suite, path):
+    """Save run_suite()'s output as JSON."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(suite, file, indent=2)
+
+
+def compare_results(old_path, new_path):
+    """
+    Print how each measurement changed between two JSON result files.
+
+    Returns:
+        list: (pattern, version, size, old median, new median) tuples for
+        the measurements found in both files
+    """
+    with open(old_path, encoding="utf-8") as file:
+        old = json.load(file)
+    with open(new_path, encoding="utf-8") as file:
+        new = json.load(file)
+    before = {(row["pattern"], row["version"], row["size"]): row["median"] for row in old["results"]}
+    rows = [(row["pattern"], row["version"], row["size"], before[key], row["median"])
+            for row in new["results"]
+            if (key := (row["pattern"], row["version"], row["size"])) in before]
+
+    print(f"📊 Python {old['python']} -> {new['python']}:")
+    for pattern, version, size, old_median, new_median in rows:
+        change = (new_median / old_median - 1) * 100 if old_median else 0.0
+        mark = "🚀" if change < -5 else "🐢" if change > 5 else "➖"
+        print(f"   {mark} {pattern:<16} {version:<14} {size:>11,}: {change:+6.1f}%")
+    return rows
+
+
+def main(argv=None):
+    """
+    Demo the four versions, or run the suite with --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="📋 Append loops vs comprehensions vs generators")
+    parser.add_argument("--benchmark", action="store_true", help="run the full suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes for --benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repeats per measurement")
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two JSON result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare_results(*args.compare)
+        return
+    if args.benchmark:
+        print(f"⏱️ Python {platform.python_version()}, sizes {args.sizes}:")
+        start = time.perf_counter()
+        suite = run_suite(args.sizes, args.repeat)
+        print(f"   Done in {time.perf_counter() - start:.1f}s")
+        if args.json:
+            write_results(suite, args.json)
+            print(f"💾 Results written to {args.json}")
+        print()
+        return
+
+    print("📋 LIST COMPREHENSIONS - Measuring Instead of Guessing")
+    print("=" * 40)
+    products = ["good_apple", "bad_apple", "good_banana", "rotten_orange", "good_grape"]
+    print(f"🔬 Append loop:   {quality_append(products)}")
+    print(f"🔬 Comprehension: {quality_comprehension(products)}")
+    print(f"🔬 filter():      {quality_filter(products)}")
+    print(f"🥕 map():         {chop_map(['carrot', 'onion'])}")
+    print("⏱️ Quick run (use --benchmark for 10 to 10M items):")
+    run_suite(sizes=(1_000,), repeat=3)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+MENU CATALOG IN PYTHON - Millions of Dishes, One Course at a Time
+=================================================================
+
+03_loops.py keeps the menu as a dict of course -> list of dishes and
+formats every dish with .replace('_', ' ').title() as it prints it. That is
+fine for nine dishes. A catalog of five million dishes in thousands of
+courses would mean five million string objects (about 60 bytes of
+overhead each) and five million title() calls on every printout.
+
+ANALOGY: The restaurant's recipe binder
+- Streaming load = Filing recipes as they arrive, never spreading the pile out
+- Course blob = One printed page per course instead of a card per dish
+- Precomputed display = Printing the page neatly once, not rewriting it per guest
+- iter_course() = Opening the binder at one tab - other courses stay shut
+
+WHAT THIS FILE COVERS:
+1. Streaming a JSON-lines or CSV catalog without holding the file
+2. MenuCatalog: one compact UTF-8 blob of display names per course
+3. iter_course() and menu_lines(): lazy, per-course access
+4. A load-time and RSS benchmark on a 5-million-dish catalog
+
+USAGE:
+    python week1_cli/menu_catalog.py
+    python week1_cli/menu_catalog.py --catalog menu.jsonl --course mains
+    python week1_cli/menu_catalog.py --benchmark 5000000
+"""
+
+import argparse
+import collections
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+
+CHUNK_SIZE = 1 << 20  # 1 MiB per read
+CSV_HEADER = b"course,dish"
+
+
+# ==========================================
+# 1. STREAMING THE FILE - Filing recipes as they arrive
+# ==========================================
+
+def _iter_line_batches(path, chunk_size=CHUNK_SIZE):
+    """Yield lists of complete lines (bytes, no newline), one chunk at a time."""
+    with open(path, "rb") as file:
+        carry = b""
+        while chunk := file.read(chunk_size):
+            lines = (carry + chunk).split(b"\n")
+            carry = lines.pop()  # Unfinished last line waits for the next chunk
+            yield lines
+        if carry:
+            yield [carry]
+
+
+def _csv_pairs(lines):
+    """(course, dish) bytes pairs from CSV lines; quoted lines go through csv."""
+    for line in lines:
+        line = line.rstrip(b"\r")
+        if not line or line == CSV_HEADER:
+            continue
+        if b'"' in line:
+            row = next(csv.reader([line.decode()]))
+            yield row[0].encode(), row[1].encode()
+        else:
+            course, _, dish = line.partition(b",")
+            yield course, dish
+
+
+def _jsonl_pairs(lines):
+    """(course, dish) bytes pairs from JSON lines, parsed one batch per json.loads."""
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return
+    for record in json.loads(b"[" + b",".join(lines) + b"]"):
+        yield record["course"].encode(), record["dish"].encode()
+
+
+def _catalog_format(path, fmt):
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".json", ".ndjson")) else "csv")
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError(f"Unknown catalog format {fmt!r}; use 'jsonl' or 'csv'")
+    return fmt
+
+
+def iter_catalog(path, fmt=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield (course, dish) pairs from a catalog file, as bytes.
+
+    Only one chunk of the file is held at a time. JSON lines need
+    "course" and "dish" keys (other keys are ignored); CSV files have
+    course,dish rows with an optional header.
+
+    Args:
+        path (str): Catalog file
+        fmt (str): "jsonl" or "csv" (default: from the file name, .jsonl/.json -> jsonl)
+        chunk_size (int): Bytes per read (default 1 MiB)
+    """
+    pairs = _jsonl_pairs if _catalog_format(path, fmt) == "jsonl" else _csv_pairs
+    for lines in _iter_line_batches(path, chunk_size):
+        yield from pairs(lines)
+
+
+# ==========================================
+# 2. THE CATALOG - One page per course
+# ==========================================
+
+def display_name(dish):
+    """ "ice_cream" -> "Ice Cream", exactly as 03_loops.py prints dishes."""
+    return dish.replace("_", " ").title()
+
+
+class MenuCatalog:
+    """
+    A course-indexed menu holding each course as one blob of display names.
+
+    ANALOGY: A binder with one printed page per course. Adding a dish
+    writes a line on its course's page; printing the menu reads pages
+    instead of shuffling millions of index cards.
+
+    While loading, each course collects its raw dish names in a
+    bytearray, one per line. finish() then formats every course in one
+    go: the whole page is decoded and .replace('_', ' ').title() runs
+    once per course in C, which gives the same result as per dish
+    because a newline is a word break for title(). A course is only
+    turned into Python strings when it is iterated.
+
+    Dish names must not contain newlines.
+
+    Example:
+        >>> catalog = MenuCatalog()
+        >>> catalog.add("desserts", "ice_cream")
+        >>> catalog.add("mains", "pasta")
+        >>> catalog.add("desserts", "cake")
+        >>> list(catalog.finish().iter_course("desserts"))
+        ['Ice Cream', 'Cake']
+    """
+
+    def __init__(self):
+        self._loading = {}   # course (bytes) -> bytearray of raw names, until finish()
+        self._pages = {}     # course (str) -> bytes of display names, after finish()
+        self._counts = {}    # course (str) -> number of dishes
+
+    @classmethod
+    def load(cls, path, fmt=None, chunk_size=CHUNK_SIZE):
+        """Stream a catalog file into a finished MenuCatalog."""
+        catalog = cls()
+        add_lines = catalog._add_jsonl_lines if _catalog_format(path, fmt) == "jsonl" \
+            else catalog._add_csv_lines
+        for number, lines in enumerate(_iter_line_batches(path, chunk_size)):
+            if number == 0 and lines and lines[0].rstrip(b"\r") == CSV_HEADER:
+                lines = lines[1:]
+            add_lines(lines)
+        return catalog.finish()
+
+    def _check_open(self):
+        if self._pages:
+            raise RuntimeError("Catalog is finished; build a new one to add dishes")
+
+    def _file(self, groups):
+        """Append each course's batch of dish names (all str or all bytes) to its page."""
+        loading = self._loading
+        for course, dishes in groups.items():
+            if isinstance(course, str):
+                course = course.encode()
+                joined = "\n".join(dishes).encode()
+            else:
+                joined = b"\n".join(dishes)
+            page = loading.get(course)
+            if page is None:
+                page = loading[course] = bytearray()
+            page += joined
+            page += b"\n"
+
+    def _add_jsonl_lines(self, lines):
+        """File one batch of JSON lines: one json.loads, then grouped by course."""
+        self._check_open()
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            return
+        groups = collections.defaultdict(list)
+        for record in json.loads(b"[" + b",".join(lines) + b"]"):
+            groups[record["course"]].append(record["dish"])
+        self._file(groups)
+
+    def _add_csv_lines(self, lines):
+        """
+        File one batch of CSV lines, grouped by course first.
+
+        Appending to a list per course and joining once per batch is
+        much cheaper than growing a bytearray per dish. Batches with
+        quotes or carriage returns take the careful csv path.
+        """
+        self._check_open()
+        joined = b"\n".join(lines)
+        if b'"' in joined or b"\r" in joined:
+            self.extend(_csv_pairs(lines))
+            return
+        groups = collections.defaultdict(list)
+        for course, _, dish in map(bytes.partition, lines, itertools.repeat(b",")):
+            groups[course].append(dish)
+        groups.pop(b"", None)  # Blank lines
+        self._file(groups)
+
+    def add(self, course, dish):
+        """Add one dish (str or UTF-8 bytes) to a course."""
+        self.extend([(course, dish)])
+
+    def extend(self, pairs):
+        """
+        Add many (course, dish) pairs (str or UTF-8 bytes).
+
+        Raises:
+            RuntimeError: If the catalog is already finished
+        """
+        self._check_open()
+        groups = {}
+        for course, dish in pairs:
+            if isinstance(course, str):
+                course = course.encode()
+            if isinstance(dish, str):
+                dish = dish.encode()
+            dishes = groups.get(course)
+            if dishes is None:
+                groups[course] = [dish]
+            else:
+                dishes.append(dish)
+        self._file(groups)
+
+    def finish(self):
+        """Format every course's display names once; returns the catalog."""
+        loading, self._loading = self._loading, {}
+        for course in list(loading):
+            # Pop each raw page as it is formatted, so the two copies never all coexist
+            page = loading.pop(course)
+            name = course.decode()
+            self._counts[name] = page.count(b"\n")
+            self._pages[name] = display_name(page.decode()).encode()[:-1]  # Drop the last newline
+        return self
+
+    def __len__(self):
+        self.finish()
+        return sum(self._counts.values())
+
+    def __contains__(self, course):
+        self.finish()
+        return course in self._pages
+
+    def courses(self):
+        """Course names, in the order they first appeared."""
+        self.finish()
+        return list(self._pages)
+
+    def count(self, course):
+        """Number of dishes in course (0 if there is no such course)."""
+        self.finish()
+        return self._counts.get(course, 0)
+
+    def iter_course(self, course):
+        """
+        Yield the display names of one course's dishes, in file order.
+
+        Only this course's page is decoded; other courses stay compact
+        bytes.
+
+        Raises:
+            KeyError: If there is no such course
+        """
+        self.finish()
+        page = self._pages[course]
+        if self._counts[course]:
+            yield from page.decode().split("\n")
+
+    def menu_lines(self, courses=None):
+        """
+        Yield the menu as 03_loops.py prints it, one line at a time.
+
+        Args:
+            courses (iterable): Courses to include (default all, in order)
+        """
+        for course in self.courses() if courses is None else courses:
+            yield f"🍽️ {course.upper()}:"
+            for dish in self.iter_course(course):
+                yield f"   • {dish}"
+
+    def nbytes(self):
+        """Bytes held by the course pages (names only, not the dict overhead)."""
+        self.finish()
+        return sum(map(sys.getsizeof, self._pages.values()))
+
+
+# ==========================================
+# BENCHMARK - A 5-million-dish catalog
+# ==========================================
+
+def write_catalog(path, dishes, courses=2_000, fmt=None):
+    """
+    Write a catalog of dishes spread over courses, as JSON lines or CSV.
+
+    Dishes are interleaved across courses, as in a real export that is
+    not sorted by course.
+    """
+    fmt = _catalog_format(path, fmt)
+    words = ["spicy", "golden", "smoked", "crispy", "garden", "house", "wild", "slow_roast"]
+    bases = ["pasta", "steak", "fish", "salad", "soup", "ice_cream", "garlic_bread", "tart"]
+    batch = 500_000
+    with open(path, "w", encoding="utf-8") as file:
+        if fmt == "csv":
+            file.write("course,dish\n")
+        for first in range(0, dishes, batch):
+            rows = [(f"course_{n % courses:04d}",
+                     f"{words[n % 8]}_{bases[n // 8 % 8]}_no_{n}") for n in range(first, min(first + batch, dishes))]
+            if fmt == "csv":
+                file.write("".join(f"{course},{dish}\n" for course, dish in rows))
+            else:
+                file.write("".join(f'{{"course": "{course}", "dish": "{dish}"}}\n'
+                                   for course, dish in rows))
+
+
+def _rss_mb():
+    """Resident memory of this process in MB (Linux /proc, else the peak)."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def _measure_load(path, naive):
+    """Load path in a fresh process; returns (seconds, RSS growth MB, dishes, first course)."""
+    before = _rss_mb()
+    start = time.perf_counter()
+    if naive:
+        menu = {}  # 03_loops.py's shape: course -> list of display names
+        for course, dish in iter_catalog(path):
+            menu.setdefault(course.decode(), []).append(display_name(dish.decode()))
+        dishes = sum(map(len, menu.values()))
+        first = menu["course_0000"][:2]
+    else:
+        catalog = MenuCatalog.load(path)
+        dishes = len(catalog)
+        course = catalog.iter_course("course_0000")
+        first = [next(course), next(course)]
+    return time.perf_counter() - start, _rss_mb() - before, dishes, first
+
+
+def benchmark_catalog(dishes=5_000_000, courses=2_000):
+    """
+    Load time and memory for a dishes-dish catalog in JSON lines and CSV.
+
+    Each load runs in its own process so the memory numbers do not
+    include the previous load. The 03_loops.py-style dict of lists is
+    loaded from the CSV file for comparison.
+
+    Args:
+        dishes (int): Dishes in the catalog (default 5M)
+        courses (int): Courses they are spread over (default 2,000)
+    """
+    import multiprocessing
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    with tempfile.TemporaryDirectory() as folder:
+        print(f"⏱️ {dishes:,} dishes in {courses:,} courses:")
+        runs = []
+        for fmt in ("jsonl", "csv"):
+            path = os.path.join(folder, f"catalog.{fmt}")
+            write_catalog(path, dishes, courses)
+            runs.append((f"MenuCatalog from {fmt}", path, False))
+        runs.append(("dict of lists from csv", path, True))
+
+        context = multiprocessing.get_context("spawn")
+        results = []
+        for label, path, naive in runs:
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                seconds, rss, loaded, first = pool.submit(_measure_load, path, naive).result()
+            assert loaded == dishes
+            results.append(first)
+            print(f"   📚 {label:<24}: {seconds:6.2f}s, RSS +{rss:7.1f} MB "
+                  f"({rss * 1e6 / dishes:5.1f} bytes/dish; file {os.path.getsize(path) / 1e6:.0f} MB)")
+        assert results[0] == results[1] == results[2], results
+        print(f"   🍽️ course_0000 starts with {results[0]} in every version")
+
+        catalog = MenuCatalog.load(path)
+        start = time.perf_counter()
+        shown = sum(1 for _ in catalog.iter_course("course_1234"))
+        print(f"   🔎 iter_course on one course ({shown:,} dishes): "
+              f"{(time.perf_counter() - start) * 1e3:.2f} ms")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the catalog, print a catalog file (--catalog), or run --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="📚 Stream a course -> dishes catalog")
+    parser.add_argument("--catalog", help="JSON-lines or CSV catalog to load")
+    parser.add_argument("--course", action="append", help="only print this course (repeatable)")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=5_000_000, metavar="DISHES",
+                        help="time and measure loading a generated catalog (default 5M)")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_catalog(args.benchmark)
+        return
+    if args.catalog:
+        catalog = MenuCatalog.load(args.catalog)
+        for line in catalog.menu_lines(args.course):
+            print(line)
+        return
+
+    import tempfile
+
+    print("📚 MENU CATALOG - Millions of Dishes, One Course at a Time")
+    print("=" * 40)
+    menu = {
+        "appetizers": ["soup", "salad", "breadsticks"],
+        "mains": ["pasta", "steak", "fish"],
+        "desserts": ["cake", "ice_cream", "fruit"],
+    }
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "menu.jsonl")
+        with open(path, "w", encoding="utf-8") as file:
+            for course, dishes in menu.items():
+                for dish in dishes:
+                    file.write(json.dumps({"course": course, "dish": dish}) + "\n")
+        catalog = MenuCatalog.load(path)
+    print(f"📖 {len(catalog)} dishes in {len(catalog.courses())} courses, "
+          f"{catalog.nbytes()} bytes of pages")
+    for line in catalog.menu_lines(["desserts"]):
+        print(line)
+    print(f"🔎 Mains only: {list(catalog.iter_course('mains'))}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
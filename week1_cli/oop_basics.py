@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+OBJECT-ORIENTED PROGRAMMING IN PYTHON - A Lean Kitchen Model
+============================================================
+
+So far orders travel as loose tuples (prepare_meal returns a 4-tuple) and
+dicts (complex_recipe returns a 6-key dict). Classes give those shapes a
+name, a fixed set of fields and behaviour of their own.
+
+ANALOGY: The restaurant's paperwork
+- Class = A printed form ("Order slip": table, dish, quantity)
+- Object = One filled-in slip
+- __slots__ = A form with exactly these boxes - no space for scribbles
+- Columnar batch = One ledger with a column per box, instead of a pile of slips
+
+WHAT THIS FILE COVERS:
+1. Dish, Order, Recipe and Receipt: small classes with __slots__
+2. Cheap equality and hashing, so objects work as dict keys and in sets
+3. OrderBatch: a million orders stored as a few array columns
+4. How much memory each way of storing orders really takes
+"""
+
+import importlib
+import operator
+import sys
+import time
+from array import array
+
+
+# ==========================================
+# 1. SLOTTED VALUE CLASSES - Forms with fixed boxes
+# ==========================================
+
+class _Record:
+    """
+    Shared behaviour for the small value classes below.
+
+    ANALOGY: The printing rules every form follows - how to read it
+    out loud (repr), how to tell two slips are the same (==), and how
+    to file it (hash).
+
+    Subclasses list their fields in __slots__. Without a per-object
+    __dict__ each object is smaller, and reading a field is a direct
+    slot lookup. Equality and hashing use an attrgetter built once per
+    class, so comparing two objects does not run a Python loop.
+
+    Treat objects as read-only once they are in a set or used as a dict
+    key: changing a field changes the hash.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # attrgetter is not a function, so it is not bound: call it as self._values(self)
+        cls._values = operator.attrgetter(*cls.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values(self) == other._values(other)
+
+    def __hash__(self):
+        return hash(self._values(self))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self):
+        """The fields as a plain dict (e.g. for json.dumps)."""
+        return dict(zip(self.__slots__, self._values(self)))
+
+
+class Dish(_Record):
+    """
+    One item on the menu.
+
+    ANALOGY: A line on the menu card: name, price and how long it takes.
+
+    Prices are whole cents, like calculate_bills() in 04_functions.py,
+    so totals never pick up float rounding.
+
+    Args:
+        name (str): Dish name
+        price_cents (int): Price in cents
+        prep_minutes (int): Preparation time (default 10)
+        course (str): "appetizers", "mains" or "desserts" (default "mains")
+    """
+
+    __slots__ = ("name", "price_cents", "prep_minutes", "course")
+
+    def __init__(self, name, price_cents, prep_minutes=10, course="mains"):
+        self.name = name
+        self.price_cents = price_cents
+        self.prep_minutes = prep_minutes
+        self.course = course
+
+
+class Order(_Record):
+    """
+    One order slip: a dish, how many, and which table.
+
+    Args:
+        order_id (int): Order number
+        dish (str): Dish name
+        quantity (int): How many
+        price_cents (int): Price of one, in cents
+        table (int): Table number (default 0 for take-away)
+    """
+
+    __slots__ = ("order_id", "dish", "quantity", "price_cents", "table")
+
+    def __init__(self, order_id, dish, quantity, price_cents, table=0):
+        self.order_id = order_id
+        self.dish = dish
+        self.quantity = quantity
+        self.price_cents = price_cents
+        self.table = table
+
+    @property
+    def subtotal_cents(self):
+        """quantity x price, in cents."""
+        return self.quantity * self.price_cents
+
+
+class Recipe(_Record):
+    """
+    A prepared recipe - the same fields as complex_recipe()'s dict.
+
+    Args:
+        name (str): Dish name
+        method (str): Cooking method
+        temperature (int): Fahrenheit
+        cooking_time (int): Minutes
+        ingredients_used (int): Number of ingredients
+    """
+
+    __slots__ = ("name", "method", "temperature", "cooking_time", "ingredients_used")
+
+    def __init__(self, name, method, temperature=350, cooking_time=30, ingredients_used=0):
+        self.name = name
+        self.method = method
+        self.temperature = temperature
+        self.cooking_time = cooking_time
+        self.ingredients_used = ingredients_used
+
+    @classmethod
+    def from_summary(cls, summary):
+        """Build a Recipe from the dict complex_recipe() returns."""
+        return cls(summary["dish_name"], summary["method"], summary["temperature"],
+                   summary["cooking_time"], summary["ingredients_used"])
+
+    @property
+    def status(self):
+        """The same status text complex_recipe() reports."""
+        return f"Successfully prepared {self.name}"
+
+
+class Receipt(_Record):
+    """
+    What one order costs, in cents - one row of calculate_bills().
+
+    Like calculate_bills(), the total is rounded once, so it can be a
+    cent away from subtotal + tax + tip added up.
+
+    Args:
+        order_id (int): Order number
+        subtotal (int): Before tax and tip
+        tax (int): Tax
+        tip (int): Tip
+        total (int): Amount to pay
+    """
+
+    __slots__ = ("order_id", "subtotal", "tax", "tip", "total")
+
+    def __init__(self, order_id, subtotal, tax, tip, total):
+        self.order_id = order_id
+        self.subtotal = subtotal
+        self.tax = tax
+        self.tip = tip
+        self.total = total
+
+    @classmethod
+    def for_order(cls, order, tax_rate=0.08, tip_percentage=15):
+        """
+        Price one Order with bill_cents() from 04_functions.py, so halves
+        round up exactly as they do in calculate_bills().
+
+        ANALOGY: The cashier writing up one table's bill.
+        """
+        subtotal = order.subtotal_cents
+        tax, tip, total = load_kitchen().bill_cents(subtotal, tax_rate, tip_percentage)
+        return cls(order.order_id, subtotal, tax, tip, total)
+
+    def format(self):
+        """The receipt as one line of text."""
+        return (f"#{self.order_id}: ${self.subtotal / 100:.2f} + tax ${self.tax / 100:.2f} "
+                f"+ tip ${self.tip / 100:.2f} = ${self.total / 100:.2f}")
+
+
+def load_kitchen():
+    """Import 04_functions.py, whether week1_cli is a package on the path or not."""
+    try:
+        return importlib.import_module("week1_cli.04_functions")
+    except ImportError:
+        return importlib.import_module("04_functions")
+
+
+# ==========================================
+# 2. COLUMNAR BATCH - One ledger instead of a pile of slips
+# ==========================================
+
+class OrderBatch:
+    """
+    Many orders stored column by column in compact arrays.
+
+    ANALOGY: Instead of a million paper slips, one ledger with a column
+    for order numbers, one for quantities, one for prices... Each
+    number takes 2-8 bytes in its column, with no per-slip paper.
+
+    Dish names repeat, so each distinct name is stored once and the
+    dish column holds its number. Orders are turned back into Order
+    objects only when you index or loop over the batch.
+
+    Example:
+        >>> batch = OrderBatch()
+        >>> batch.append(1, "pizza", 2, 1899, table=4)
+        >>> batch[0]
+        Order(order_id=1, dish='pizza', quantity=2, price_cents=1899, table=4)
+        >>> batch[:1]
+        [Order(order_id=1, dish='pizza', quantity=2, price_cents=1899, table=4)]
+    """
+
+    __slots__ = ("order_id", "dish_code", "quantity", "price_cents", "table",
+                 "dish_names", "_dish_codes")
+
+    def __init__(self, orders=()):
+        self.order_id = array("q")
+        self.dish_code = array("I")
+        self.quantity = array("I")
+        self.price_cents = array("q")
+        self.table = array("H")
+        self.dish_names = []
+        self._dish_codes = {}
+        for order in orders:
+            self.append_order(order)
+
+    def _code(self, dish):
+        code = self._dish_codes.get(dish)
+        if code is None:
+            code = self._dish_codes[dish] = len(self.dish_names)
+            self.dish_names.append(dish)
+        return code
+
+    def append(self, order_id, dish, quantity, price_cents, table=0):
+        """
+        Add one order from its fields.
+
+        Raises:
+            OverflowError: If a number does not fit its column (e.g. table > 65535)
+        """
+        self.order_id.append(order_id)
+        self.dish_code.append(self._code(dish))
+        self.quantity.append(quantity)
+        self.price_cents.append(price_cents)
+        self.table.append(table)
+
+    def append_order(self, order):
+        """Add one Order object."""
+        self.append(order.order_id, order.dish, order.quantity, order.price_cents, order.table)
+
+    def extend(self, order_ids, dishes, quantities, prices_cents, tables):
+        """
+        Add many orders given as columns (any iterables of equal length).
+
+        Whole columns are copied into the arrays at C speed; only the
+        dish names go through the name table.
+        """
+        order_ids, quantities = array("q", order_ids), array("I", quantities)
+        prices_cents, tables = array("q", prices_cents), array("H", tables)
+        dishes = list(dishes)
+        # Check before naming any dish, so a bad call leaves the name table alone
+        if not len(order_ids) == len(dishes) == len(quantities) == len(prices_cents) == len(tables):
+            raise ValueError("All columns must have the same length")
+        codes = array("I", map(self._code, dishes))
+        self.order_id.extend(order_ids)
+        self.dish_code.extend(codes)
+        self.quantity.extend(quantities)
+        self.price_cents.extend(prices_cents)
+        self.table.extend(tables)
+
+    def __len__(self):
+        return len(self.order_id)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Order(self.order_id[index], self.dish_names[self.dish_code[index]],
+                     self.quantity[index], self.price_cents[index], self.table[index])
+
+    def __iter__(self):
+        names = self.dish_names
+        for order_id, code, quantity, price, table in zip(
+                self.order_id, self.dish_code, self.quantity, self.price_cents, self.table):
+            yield Order(order_id, names[code], quantity, price, table)
+
+    def subtotals(self):
+        """quantity x price for every order, as an array of cents."""
+        return array("q", map(operator.mul, self.quantity, self.price_cents))
+
+    def total_cents(self):
+        """Sum of all subtotals, in cents."""
+        return sum(map(operator.mul, self.quantity, self.price_cents))
+
+    def nbytes(self):
+        """Bytes used by the columns (not counting the dish name table)."""
+        return sum(column.itemsize * len(column) for column in
+                   (self.order_id, self.dish_code, self.quantity, self.price_cents, self.table))
+
+
+# ==========================================
+# BENCHMARK - A million orders, four ways
+# ==========================================
+
+class _PlainOrder:
+    """An Order without __slots__, for comparison."""
+
+    def __init__(self, order_id, dish, quantity, price_cents, table=0):
+        self.order_id = order_id
+        self.dish = dish
+        self.quantity = quantity
+        self.price_cents = price_cents
+        self.table = table
+
+
+def benchmark_memory(count=1_000_000):
+    """
+    Measure memory (tracemalloc) and build time for count orders.
+
+    Args:
+        count (int): Number of orders (default 1M)
+    """
+    import tracemalloc
+
+    dishes = ["pizza", "pasta", "salad", "steak", "soup"]
+
+    def as_dicts():
+        return [{"order_id": n, "dish": dishes[n % 5], "quantity": 1 + n % 4,
+                 "price_cents": 899 + n % 1000, "table": n % 40} for n in range(count)]
+
+    def as_plain():
+        return [_PlainOrder(n, dishes[n % 5], 1 + n % 4, 899 + n % 1000, n % 40) for n in range(count)]
+
+    def as_slotted():
+        return [Order(n, dishes[n % 5], 1 + n % 4, 899 + n % 1000, n % 40) for n in range(count)]
+
+    def as_batch():
+        batch = OrderBatch()
+        numbers = range(count)
+        batch.extend(numbers, (dishes[n % 5] for n in numbers), (1 + n % 4 for n in numbers),
+                     (899 + n % 1000 for n in numbers), (n % 40 for n in numbers))
+        return batch
+
+    print(f"⏱️ {count:,} orders in memory:")
+    for label, build in [("dicts", as_dicts), ("plain class", as_plain),
+                         ("__slots__ class", as_slotted), ("OrderBatch columns", as_batch)]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        orders = build()
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   🧾 {label:<19}: {current / 1e6:7.1f} MB ({current / count:5.1f} bytes/order, "
+              f"peak {peak / 1e6:6.1f} MB), built in {seconds:.2f}s")
+        del orders
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the classes, or run the benchmark with --benchmark [count].
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        rest = argv[argv.index("--benchmark") + 1:]
+        benchmark_memory(int(rest[0]) if rest else 1_000_000)
+        return
+
+    print("🏗️ OOP BASICS - A Lean Kitchen Model")
+    print("=" * 40)
+    pizza = Dish("pizza", 1899, prep_minutes=15)
+    print(f"🍕 {pizza}")
+    print(f"🔁 Same dish, same hash: {pizza == Dish('pizza', 1899, 15)}, "
+          f"{len({pizza, Dish('pizza', 1899, 15)})} entry in a set")
+    try:
+        pizza.spicy = True
+    except AttributeError as error:
+        print(f"🚫 No extra boxes on a slotted form: {error}")
+
+    recipe = Recipe.from_summary({"dish_name": "chocolate cake", "method": "bake", "temperature": 350,
+                                  "cooking_time": 45, "ingredients_used": 3,
+                                  "status": "Successfully prepared chocolate cake"})
+    print(f"🎂 {recipe} -> {recipe.status}")
+
+    batch = OrderBatch()
+    batch.append(1, "pizza", 2, 1899, table=4)
+    batch.append(2, "pasta", 1, 1250, table=4)
+    batch.append(3, "pizza", 3, 1899, table=7)
+    print(f"📒 Batch of {len(batch)} orders in {batch.nbytes()} bytes, dishes {batch.dish_names}")
+    for order in batch:
+        print(f"   🧾 {Receipt.for_order(order).format()}")
+    print(f"💰 Batch total: ${batch.total_cents() / 100:.2f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+ORDER REPLAY IN PYTHON - Millions of Orders Across Many Processes
+=================================================================
+
+take_order() in 04_functions.py handles one order: it works out the price,
+prints it and bumps the order counter. Replaying a day's log of ten million
+orders that way means ten million calls on one core. This file splits the
+log into chunks, totals each chunk in a separate process and adds the
+chunk totals up at the end - with exactly the same result.
+
+ANALOGY: Counting the day's tickets
+- Order log = The spike full of tickets at closing time
+- Chunk = A handful of tickets pulled off the spike
+- Worker process = A cashier with their own desk and calculator
+- Reduce = The manager adding up every cashier's slip
+- Integer cents = Everyone writing $12.99 as 1299, so the sums always agree
+
+WHAT THIS FILE COVERS:
+1. Writing and reading an order log (dish,price,quantity lines)
+2. Totalling one chunk: counts, quantities and cents per dish
+3. replay_orders(): chunks fanned out over a ProcessPoolExecutor, then reduced
+4. A check against sequential take_order() and a 1-16 worker scaling benchmark
+
+USAGE:
+    python week1_cli/order_replay.py
+    python week1_cli/order_replay.py --log orders.csv --workers 4
+    python week1_cli/order_replay.py --benchmark 10000000
+"""
+
+import argparse
+import collections
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+HEADER = b"dish,price,quantity"
+CHUNK_BYTES = 8 * 1024 * 1024  # Most bytes a worker reads at once
+
+MENU = (("pizza", "12.99"), ("pasta", "11.50"), ("salad", "8.50"), ("soup", "6.50"),
+        ("steak", "24.00"), ("fish", "19.75"), ("cake", "7.00"), ("ice cream", "4.25"))
+
+DishTotals = collections.namedtuple("DishTotals", "orders quantity cents")
+ReplayResult = collections.namedtuple("ReplayResult", "orders quantity cents by_dish")
+
+
+# ==========================================
+# 1. THE ORDER LOG - Tickets on the spike
+# ==========================================
+
+def write_order_log(path, orders, menu=MENU, batch=1_000_000):
+    """
+    Write a log of orders, one "dish,price,quantity" line each.
+
+    The orders follow a fixed pattern (no randomness), so the same
+    count always gives the same file.
+
+    Args:
+        path (str): File to write
+        orders (int): Number of order lines
+        menu (tuple): (dish, price) pairs to order from
+        batch (int): Lines built in memory at a time (default 1M)
+    """
+    lines = [f"{dish},{price},".encode() for dish, price in menu]
+    with open(path, "wb") as file:
+        file.write(HEADER + b"\n")
+        for first in range(0, orders, batch):
+            numbers = range(first, min(first + batch, orders))
+            file.write(b"".join(lines[(n * 13 + n // 7) % len(lines)] + b"%d\n" % (n % 5 + 1)
+                                for n in numbers))
+
+
+def parse_cents(price):
+    """
+    "12.99" -> 1299, without going through float.
+
+    Example:
+        >>> parse_cents("12.99"), parse_cents("4.5"), parse_cents("-0.25")
+        (1299, 450, -25)
+
+    Raises:
+        ValueError: If price has more than two decimal places
+    """
+    sign = -1 if price.startswith("-") else 1
+    whole, _, fraction = price.lstrip("+-").partition(".")
+    if len(fraction) > 2:
+        raise ValueError(f"Price {price!r} has more than two decimal places")
+    return sign * (int(whole or "0") * 100 + int(fraction.ljust(2, "0")))
+
+
+def chunk_ranges(path, chunk_bytes=CHUNK_BYTES):
+    """
+    Split the file into (start, end) byte ranges that end on line breaks.
+
+    ANALOGY: Pulling handfuls of tickets off the spike without tearing
+    any ticket in half.
+
+    Returns:
+        list: (start, end) pairs covering the whole file in order
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()  # Move on to the end of the line we landed in
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+# ==========================================
+# 2. ONE CHUNK - One cashier's slip
+# ==========================================
+
+def replay_chunk(path, start, end):
+    """
+    Total the orders between two byte offsets of the log.
+
+    Runs in a worker process, so it reads its own part of the file:
+    only the offsets are sent to it and only the totals come back.
+
+    Repeated lines are counted first (collections.Counter works in C),
+    so each distinct "dish,price,quantity" line is parsed once and
+    multiplied by how often it appeared. Money is kept in integer
+    cents, which add up the same in any order - float sums would
+    depend on how the log was split.
+
+    Returns:
+        dict: dish -> DishTotals, in order of first appearance
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).split(b"\n")
+    totals = {}
+    for line, count in collections.Counter(lines).items():
+        if not line or line == HEADER:
+            continue
+        dish, price, quantity = line.decode().rsplit(",", 2)
+        quantity = int(quantity)
+        orders, ordered, cents = totals.get(dish, (0, 0, 0))
+        totals[dish] = DishTotals(orders + count, ordered + quantity * count,
+                                  cents + parse_cents(price) * quantity * count)
+    return totals
+
+
+def merge_totals(results):
+    """
+    Add up per-chunk totals (the reduce step).
+
+    Args:
+        results (iterable): dish -> DishTotals dicts, in log order
+
+    Returns:
+        ReplayResult: Totals over every chunk, dishes in order of first appearance
+    """
+    by_dish = {}
+    for totals in results:
+        for dish, (orders, quantity, cents) in totals.items():
+            before = by_dish.get(dish)
+            if before is None:
+                by_dish[dish] = DishTotals(orders, quantity, cents)
+            else:
+                by_dish[dish] = DishTotals(before.orders + orders, before.quantity + quantity,
+                                           before.cents + cents)
+    return ReplayResult(sum(item.orders for item in by_dish.values()),
+                        sum(item.quantity for item in by_dish.values()),
+                        sum(item.cents for item in by_dish.values()),
+                        by_dish)
+
+
+# ==========================================
+# 3. THE ENGINE - Every cashier at once
+# ==========================================
+
+def replay_orders(path, workers=None, chunk_bytes=CHUNK_BYTES, executor=None):
+    """
+    Replay an order log across worker processes.
+
+    ANALOGY: The manager hands each cashier a handful of tickets, and
+    adds up their slips when they are all done.
+
+    Results are the same for any number of workers: every sum is in
+    integer cents and the chunks are merged in log order.
+
+    Args:
+        path (str): The order log
+        workers (int): Worker processes (default os.cpu_count(); 0 runs
+            every chunk in this process)
+        chunk_bytes (int): About how many bytes per chunk (default 8 MiB)
+        executor (Executor): Use this pool instead of starting one
+
+    Returns:
+        ReplayResult: orders, quantity, cents and per-dish DishTotals
+    """
+    ranges = chunk_ranges(path, chunk_bytes)
+    paths = [path] * len(ranges)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    if workers == 0 and executor is None:
+        return merge_totals(map(replay_chunk, paths, starts, ends))
+    if executor is not None:
+        return merge_totals(executor.map(replay_chunk, paths, starts, ends))
+    with ProcessPoolExecutor(workers) as pool:
+        return merge_totals(pool.map(replay_chunk, paths, starts, ends))
+
+
+def load_kitchen():
+    """Import 04_functions.py, whether week1_cli is a package on the path or not."""
+    try:
+        return importlib.import_module("week1_cli.04_functions")
+    except ImportError:
+        return importlib.import_module("04_functions")
+
+
+def replay_with_take_order(path, limit=None):
+    """
+    Replay the log the slow way: one take_order() call per order.
+
+    take_order prints two lines per order; they are sent to os.devnull.
+    Its float total is turned into cents per order so it can be
+    compared exactly with replay_orders().
+
+    Args:
+        path (str): The order log
+        limit (int): Stop after this many orders (default: all)
+
+    Returns:
+        ReplayResult: Same shape as replay_orders()
+    """
+    import contextlib
+    import csv
+    import itertools
+
+    kitchen = load_kitchen()
+    by_dish = {}
+    counted_before = kitchen.order_counter.value
+    with open(path, newline="", encoding="utf-8") as file, \
+            open(os.devnull, "w", encoding="utf-8") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        rows = csv.reader(file)
+        next(rows)  # Header
+        for dish, price, quantity in itertools.islice(rows, limit):
+            total = kitchen.take_order(dish, float(price), int(quantity))
+            orders, ordered, cents = by_dish.get(dish, (0, 0, 0))
+            by_dish[dish] = DishTotals(orders + 1, ordered + int(quantity), cents + round(total * 100))
+    result = merge_totals([by_dish])
+    assert kitchen.order_counter.value - counted_before == result.orders
+    return result
+
+
+# ==========================================
+# BENCHMARK - 1 to 16 workers
+# ==========================================
+
+def benchmark_scaling(orders=10_000_000, worker_counts=(1, 2, 4, 8, 16), check_orders=200_000):
+    """
+    Time replay_orders on an orders-line log with each worker count.
+
+    Every run must give exactly the same totals. First, a smaller log
+    is replayed with take_order() itself to show the engine matches it.
+
+    Args:
+        orders (int): Orders in the benchmark log (default 10M)
+        worker_counts (tuple): Worker counts to time
+        check_orders (int): Orders replayed through take_order (default 200k)
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as folder:
+        small = os.path.join(folder, "check.csv")
+        write_order_log(small, check_orders)
+        start = time.perf_counter()
+        expected = replay_with_take_order(small)
+        slow_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        fast = replay_orders(small, workers=2, chunk_bytes=256 * 1024)
+        fast_seconds = time.perf_counter() - start
+        assert fast == expected, "replay_orders does not match take_order"
+        print(f"✅ {check_orders:,} orders: take_order one by one {slow_seconds:.2f}s, "
+              f"replay_orders {fast_seconds:.2f}s - identical totals")
+
+        path = os.path.join(folder, "orders.csv")
+        start = time.perf_counter()
+        write_order_log(path, orders)
+        print(f"📝 Wrote {orders:,} orders ({os.path.getsize(path) / 1e6:.0f} MB) "
+              f"in {time.perf_counter() - start:.1f}s; {os.cpu_count()} CPU(s) available")
+
+        start = time.perf_counter()
+        baseline = replay_orders(path, workers=0)
+        in_process = time.perf_counter() - start
+        print(f"⏱️ In this process (no pool): {in_process:6.2f}s")
+        for workers in worker_counts:
+            start = time.perf_counter()
+            result = replay_orders(path, workers=workers)
+            seconds = time.perf_counter() - start
+            assert result == baseline, f"{workers} workers gave different totals"
+            print(f"   👥 {workers:>2} workers: {seconds:6.2f}s  "
+                  f"speedup {in_process / seconds:4.2f}x  "
+                  f"({orders / seconds / 1e6:.1f}M orders/s)")
+        print(f"   💰 {baseline.orders:,} orders, {baseline.quantity:,} items, "
+              f"${baseline.cents / 100:,.2f} - the same for every worker count")
+    print()
+
+
+def main(argv=None):
+    """
+    Replay a log (--log), demo on a small generated log, or --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="🧾 Replay an order log across processes")
+    parser.add_argument("--log", help="order log to replay (dish,price,quantity lines)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--benchmark", type=int, nargs="?", const=10_000_000, metavar="ORDERS",
+                        help="time 1-16 workers on a generated log (default 10M orders)")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_scaling(args.benchmark)
+        return
+    if args.log:
+        result = replay_orders(args.log, args.workers)
+        for dish, totals in result.by_dish.items():
+            print(f"{dish},{totals.orders},{totals.quantity},{totals.cents / 100:.2f}")
+        return
+
+    import tempfile
+
+    print("🧾 ORDER REPLAY - Millions of Orders Across Many Processes")
+    print("=" * 40)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "orders.csv")
+        write_order_log(path, 20_000)
+        result = replay_orders(path, workers=2, chunk_bytes=64 * 1024)
+        print(f"📋 {result.orders:,} orders in {len(chunk_ranges(path, 64 * 1024))} chunks, "
+              f"{result.quantity:,} items, ${result.cents / 100:,.2f}")
+        for dish, totals in result.by_dish.items():
+            print(f"   🍽️ {dish:<10} {totals.orders:>5,} orders {totals.quantity:>6,} items "
+                  f"${totals.cents / 100:>10,.2f}")
+        same = replay_with_take_order(path) == result
+        print(f"✅ Same totals as calling take_order() 20,000 times: {same}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+"""
+QUALITY CONTROL IN PYTHON - Rejecting Millions of Items at Once
+===============================================================
+
+03_loops.py checks products one at a time:
+
+    if "bad" in product or "rotten" in product:
+        continue
+
+Every product goes around the Python loop, and every extra reject rule is
+one more check per product. This file compiles a list of reject rules
+(substrings, prefixes and regular expressions) into one QualityFilter that
+inspects a whole chunk of products per call, optionally in several
+processes, and counts how many products each rule rejected.
+
+ANALOGY: The inspection line
+- Reject rule = A note on the inspector's board ("bad", "starts with TEST-")
+- QualityFilter = The inspector who has learned the whole board by heart
+- Chunk = A crate of products checked in one go, not one at a time
+- Reject counts = The tally of how many items each note caught
+- Worker process = A second inspection line with its own inspector
+
+WHAT THIS FILE COVERS:
+1. Reject rules: "bad", "prefix:TEST-", "regex:_\\d{3}$"
+2. QualityFilter: joins a chunk into one string and scans it in C
+3. filter(): chunks, optional worker processes and per-rule counts
+4. A benchmark against the 03_loops.py loop at 1M and 50M items
+
+USAGE:
+    python week1_cli/quality_control.py
+    python week1_cli/quality_control.py --rule bad --rule prefix:test_ < products.txt
+    python week1_cli/quality_control.py --benchmark 1000000 50000000
+"""
+
+import argparse
+import collections
+import itertools
+import operator
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 65_536  # Products inspected per call
+FIND_LIMIT = 16      # More substrings than this share one trie regex scan
+
+RULE_KINDS = ("substring", "prefix", "regex")
+
+# \A, \Z, lookarounds and a scoped "-m" (such as (?-m:^a)) would see the
+# neighbouring products, or only the chunk's edges, in a joined chunk
+_NEEDS_OWN_PRODUCT = re.compile(r"\\[AZ]|\(\?<?[=!]|\(\?[a-zA-Z]*-[a-zA-Z]*m")
+
+Rule = collections.namedtuple("Rule", "kind pattern name")
+FilterResult = collections.namedtuple("FilterResult", "accepted checked rejected")
+
+
+# ==========================================
+# 1. REJECT RULES - Notes on the board
+# ==========================================
+
+def parse_rule(spec):
+    """
+    Turn a rule written as text into a Rule.
+
+    Plain text is a substring rule. "prefix:" and "regex:" pick the other
+    kinds, and "substring:" can be written out to reject text that
+    contains a colon. The rule's name (used for the reject counts) is
+    the spec itself.
+
+    Example:
+        >>> parse_rule("bad")
+        Rule(kind='substring', pattern='bad', name='bad')
+        >>> parse_rule("prefix:test_").kind
+        'prefix'
+
+    Args:
+        spec (str or Rule): The rule, e.g. "rotten" or "regex:_\\d{3}$"
+
+    Returns:
+        Rule: kind, pattern and name
+
+    Raises:
+        ValueError: If the pattern is empty (it would reject everything)
+    """
+    if isinstance(spec, Rule):
+        kind, pattern, name = spec
+    else:
+        kind, colon, pattern = spec.partition(":")
+        if not colon or kind not in RULE_KINDS:
+            kind, pattern = "substring", spec
+        name = spec
+    if kind not in RULE_KINDS:
+        raise ValueError(f"Unknown rule kind {kind!r}; use one of {', '.join(RULE_KINDS)}")
+    if not pattern:
+        raise ValueError(f"Rule {name!r} is empty and would reject every product")
+    if kind == "regex":
+        re.compile(pattern)  # Report a bad pattern now, not halfway through a run
+    return Rule(kind, pattern, name)
+
+
+def _trie_pattern(words):
+    """
+    One regex for many words, shaped like a trie so shared starts are
+    only tried once.
+
+    Example:
+        >>> _trie_pattern(["bad", "bruised", "rotten"])
+        '(?:b(?:ad|ruised)|rotten)'
+    """
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = "(?:" + "|".join(branches) + ")" if len(branches) > 1 or "" in node else branches[0]
+        return body + "?" if "" in node else body
+
+    return build(root)
+
+
+# ==========================================
+# 2. THE COMPILED FILTER - One inspector, every rule
+# ==========================================
+
+class QualityFilter:
+    """
+    Reject rules compiled into one matcher that works a chunk at a time.
+
+    ANALOGY: Instead of picking up each apple and reading the whole board,
+    the inspector lays the crate out in a row and sweeps along it once
+    per note - and a sweep is fast, because str.find runs in C.
+
+    A chunk is joined into one newline-separated string. Substrings and
+    prefixes are found with str.find on that string, each regular
+    expression scans it once, and more than FIND_LIMIT substrings share
+    one trie-shaped regex scan. Only the few products that are hit are
+    looked at one by one, to count them against the first rule in the
+    list that rejects them - the same rule an if/or chain would stop at.
+
+    Regular expressions see one product at a time with re.MULTILINE, so
+    ^ and $ mean the start and end of the product. A regex with \\A, \\Z,
+    a lookahead/lookbehind or a group that switches MULTILINE off, such as
+    (?-m:^a), would see past its product in the joined string, so it is
+    searched in each product on its own instead. Chunks
+    that contain a product with a newline in it are checked product by
+    product.
+
+    Example:
+        >>> qc = QualityFilter(["bad", "rotten"])
+        >>> accepted, counts = qc.filter_chunk(["good_apple", "bad_apple", "rotten_bad_pear"])
+        >>> accepted, counts
+        (['good_apple'], [2, 0])
+        >>> qc.reject_rule("rotten_orange")
+        'rotten'
+    """
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules (list): Rule objects or specs for parse_rule()
+
+        Raises:
+            ValueError: If there are no rules, or two rules share a name
+        """
+        self.rules = tuple(map(parse_rule, rules))
+        if not self.rules:
+            raise ValueError("A QualityFilter needs at least one reject rule")
+        names = [rule.name for rule in self.rules]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Rule names must be unique: {names}")
+
+        self._tests = []   # (index, kind, pattern) checked against one product
+        self._alone = []   # (index, regex) searched in each product on its own
+        literals, prefixes, scanned = [], [], []
+        for index, (kind, pattern, _) in enumerate(self.rules):
+            if kind == "regex":
+                if _NEEDS_OWN_PRODUCT.search(pattern):
+                    self._alone.append((index, re.compile(pattern, re.MULTILINE)))
+                else:
+                    scanned.append(index)
+                pattern = re.compile(pattern, re.MULTILINE)
+            elif kind == "prefix":
+                prefixes.append((index, "\n" + pattern))
+            else:
+                literals.append((index, pattern))
+            self._tests.append((index, kind, pattern))
+        # Rules with a newline in them could match across two products
+        self._joinable = not any("\n" in rule.pattern for rule in self.rules if rule.kind != "regex")
+
+        self._scans = [self._tests[index][2] for index in scanned]
+        if len(literals) > FIND_LIMIT:
+            self._scans.append(re.compile(_trie_pattern(word for _, word in literals)))
+            scanned.extend(index for index, _ in literals)
+            literals = []
+        self._literals = literals
+        self._prefixes = prefixes
+        self._scanned = [self._tests[index] for index in sorted(scanned)]
+
+    def __reduce__(self):
+        """Send only the rules to a worker process; it compiles its own copy."""
+        return type(self), (self.rules,)
+
+    def __repr__(self):
+        return f"QualityFilter({[rule.name for rule in self.rules]!r})"
+
+    def _first_match(self, product, tests):
+        """Index of the first rule in tests that rejects product, or None."""
+        for index, kind, pattern in tests:
+            if kind == "substring":
+                if pattern in product:
+                    return index
+            elif kind == "prefix":
+                if product.startswith(pattern):
+                    return index
+            elif pattern.search(product):
+                return index
+        return None
+
+    def reject_rule(self, product):
+        """
+        Check one product, like the loop in 03_loops.py.
+
+        Args:
+            product (str): The product name
+
+        Returns:
+            str: Name of the first rule that rejects it, or None to accept it
+        """
+        index = self._first_match(product, self._tests)
+        return None if index is None else self.rules[index].name
+
+    def _filter_each(self, chunk):
+        """Check a chunk product by product (products with newlines in them)."""
+        accepted = []
+        counts = [0] * len(self.rules)
+        first_match = self._first_match
+        tests = self._tests
+        for product in chunk:
+            index = first_match(product, tests)
+            if index is None:
+                accepted.append(product)
+            else:
+                counts[index] += 1
+        return accepted, counts
+
+    def _hits(self, text):
+        """(position, rule index or None) for every product a rule may reject."""
+        hits = []
+        find = text.find
+        for index, word in self._literals:
+            position = find(word)
+            while position >= 0:
+                hits.append((position, index))
+                position = find(word, position + 1)
+        for index, word in self._prefixes:
+            if text.startswith(word[1:]):
+                hits.append((0, index))
+            position = find(word)
+            while position >= 0:
+                hits.append((position + 1, index))
+                position = find(word, position + 1)
+        for scan in self._scans:
+            search = scan.search
+            match = search(text)
+            while match is not None:
+                position = match.start()
+                hits.append((position, None))  # Checked on its own product later
+                end = find("\n", position)
+                if end < 0:
+                    break
+                match = search(text, end + 1)
+        return hits
+
+    def rejects_in(self, text, size):
+        """
+        Find the rejected products in a chunk joined with newlines.
+
+        This is the part that runs in a worker process: it only needs
+        the joined text, and sends back a short list instead of the
+        accepted products.
+
+        Args:
+            text (str): The chunk, as "\\n".join(products)
+            size (int): How many products were joined
+
+        Returns:
+            list: (product number, rule index) pairs in product order, or
+            None if the text does not hold exactly size products (one of
+            them had a newline in it)
+        """
+        newlines = text.count
+        hits = self._hits(text)
+        hits.sort(key=operator.itemgetter(0))
+        rejected = {}  # Product number -> index of the first rule that rejects it
+        line = last = 0
+        for position, index in hits:
+            line += newlines("\n", last, position)
+            last = position
+            if index is None:
+                end = text.find("\n", position)
+                product = text[text.rfind("\n", 0, position) + 1:end if end >= 0 else len(text)]
+                index = self._first_match(product, self._scanned)
+                if index is None:
+                    continue  # A regex matched across two products
+            if index < rejected.get(line, len(self.rules)):
+                rejected[line] = index
+        if line + newlines("\n", last) != size - 1:
+            return None  # Counted while walking the hits, so the text is only read once
+        if self._alone:
+            products = text.split("\n")
+            for index, pattern in self._alone:
+                for line in itertools.compress(itertools.count(), map(pattern.search, products)):
+                    if index < rejected.get(line, len(self.rules)):
+                        rejected[line] = index
+        return sorted(rejected.items())
+
+    def _split(self, chunk, rejects):
+        """Accepted products and reject counts from rejects_in()'s answer."""
+        accepted = []
+        counts = [0] * len(self.rules)
+        start = 0
+        for line, index in rejects:
+            accepted += chunk[start:line]
+            start = line + 1
+            counts[index] += 1
+        accepted += chunk[start:]
+        return accepted, counts
+
+    def filter_chunk(self, chunk):
+        """
+        Split one chunk into accepted products and reject counts.
+
+        Args:
+            chunk (list): Product names (str)
+
+        Returns:
+            tuple: (accepted products in their original order,
+                    list of reject counts in rule order)
+        """
+        if self._joinable:
+            rejects = self.rejects_in("\n".join(chunk), len(chunk))
+            if rejects is not None:
+                return self._split(chunk, rejects)
+        return self._filter_each(chunk)
+
+    def filter(self, products, chunk_size=CHUNK_SIZE, workers=0, keep=True, executor=None):
+        """
+        Filter any iterable of products, a chunk at a time.
+
+        ANALOGY: Crates come off the truck one after another; with workers,
+        several inspection lines each take the next crate, and the
+        accepted products are put back in the order they arrived.
+
+        Args:
+            products (iterable): Product names (a list, a file, a generator)
+            chunk_size (int): Products per chunk (default 65,536)
+            workers (int): Worker processes (default 0 = this process)
+            keep (bool): Keep the accepted products (False only counts them)
+            executor (Executor): Use this pool instead of starting one
+
+        Returns:
+            FilterResult: accepted (list, or a count when keep=False),
+            checked and rejected (rule name -> count, in rule order)
+        """
+        accepted = [] if keep else 0
+        checked = 0
+        totals = [0] * len(self.rules)
+        for size, kept, counts in iter_filtered(self, products, chunk_size, workers, executor):
+            checked += size
+            if keep:
+                accepted += kept
+            else:
+                accepted += len(kept)
+            totals = list(map(int.__add__, totals, counts))
+        rejected = {rule.name: count for rule, count in zip(self.rules, totals)}
+        return FilterResult(accepted, checked, rejected)
+
+
+# ==========================================
+# 3. CHUNKS AND WORKERS - Several inspection lines
+# ==========================================
+
+def iter_chunks(products, chunk_size=CHUNK_SIZE):
+    """
+    Cut any iterable into lists of up to chunk_size products.
+
+    Example:
+        >>> list(iter_chunks("abcde", 2))
+        [['a', 'b'], ['c', 'd'], ['e']]
+    """
+    products = iter(products)
+    return iter(lambda: list(itertools.islice(products, chunk_size)), [])
+
+
+_WORKER_FILTERS = {}  # Rules -> QualityFilter, compiled once per worker process
+
+
+def _rejects_in(rules, text, size):
+    """Run in a worker: find the rejects in one joined chunk."""
+    quality_filter = _WORKER_FILTERS.get(rules)
+    if quality_filter is None:
+        quality_filter = _WORKER_FILTERS[rules] = QualityFilter(rules)
+    return quality_filter.rejects_in(text, size)
+
+
+def iter_filtered(quality_filter, products, chunk_size=CHUNK_SIZE, workers=0, executor=None):
+    """
+    Yield (chunk size, accepted, reject counts) for each chunk, in order.
+
+    Workers get each chunk as one joined string and answer with the
+    rejected product numbers, so little has to be copied between
+    processes; the accepted lists are cut from the chunk here. Only a
+    couple of chunks per worker are in flight at once, so a generator
+    of 50M products never has to fit in memory.
+
+    Args:
+        quality_filter (QualityFilter): The compiled rules
+        products (iterable): Product names
+        chunk_size (int): Products per chunk
+        workers (int): Worker processes (0 = this process)
+        executor (Executor): Use this pool instead of starting one
+    """
+    chunks = iter_chunks(products, chunk_size)
+    if (not workers and executor is None) or not quality_filter._joinable:
+        for chunk in chunks:
+            yield (len(chunk),) + quality_filter.filter_chunk(chunk)
+        return
+
+    def finish(chunk, future):
+        rejects = future.result()
+        if rejects is None:
+            return (len(chunk),) + quality_filter.filter_chunk(chunk)
+        return (len(chunk),) + quality_filter._split(chunk, rejects)
+
+    pool = executor or ProcessPoolExecutor(workers)
+    try:
+        in_flight = collections.deque()
+        limit = 2 * (workers or os.cpu_count() or 1)
+        for chunk in chunks:
+            future = pool.submit(_rejects_in, quality_filter.rules, "\n".join(chunk), len(chunk))
+            in_flight.append((chunk, future))
+            if len(in_flight) >= limit:
+                yield finish(*in_flight.popleft())
+        while in_flight:
+            yield finish(*in_flight.popleft())
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+
+# ==========================================
+# 4. BENCHMARK - The 03_loops.py loop against the filter
+# ==========================================
+
+LOOP_RULES = ("bad", "rotten")  # The two checks in 03_loops.py
+WIDE_RULES = LOOP_RULES + (
+    "moldy", "bruised", "expired", "spoiled", "recalled", "damaged", "leaking", "dented",
+    "stale", "wilted", "crushed", "mislabeled", "contaminated", "returned",
+    "prefix:test_", "prefix:sample_", "regex:9{4}$", "regex:(?i)do.not.sell",
+)
+
+
+def make_products(count, distinct=100_000):
+    """
+    A repeatable stream of product names, about 1 in 25 of them defective.
+
+    Args:
+        count (int): How many names to yield
+        distinct (int): How many different names to cycle through
+
+    Returns:
+        iterator: Names like "good_apple_00042" and "bad_pear_00017"
+    """
+    fruits = ("apple", "banana", "orange", "grape", "mango", "pear", "kiwi", "plum")
+    grades = ("good", "fresh", "ripe", "good", "fresh")
+    defects = {7: "bad", 31: "bruised", 57: "rotten", 83: "test"}
+    names = []
+    for number in range(distinct):
+        grade = defects.get(number % 100) or grades[number % 5]
+        names.append(f"{grade}_{fruits[number % 8]}_{number:05d}")
+    return itertools.islice(itertools.cycle(names), count)
+
+
+def quality_loop(products):
+    """
+    The quality-control loop from 03_loops.py, without the prints.
+
+    Returns:
+        tuple: (quality products, products rejected)
+    """
+    quality_products = []
+    rejected = 0
+    for product in products:
+        if "bad" in product or "rotten" in product:
+            rejected += 1
+            continue
+        quality_products.append(product)
+    return quality_products, rejected
+
+
+def benchmark_filter(sizes=(1_000_000, 50_000_000), workers=2):
+    """
+    Time the 03_loops.py loop against QualityFilter on the same products.
+
+    Both must accept exactly the same products. The 20-rule board is
+    timed at the smallest size against checking each product in turn.
+
+    Args:
+        sizes (tuple): Product counts to time (default 1M and 50M)
+        workers (int): Worker processes for the pooled run
+    """
+    loop_filter = QualityFilter(LOOP_RULES)
+    print(f"⏱️ Rules {list(LOOP_RULES)}; {os.cpu_count()} CPU(s) available")
+    for size in sizes:
+        products = list(make_products(size))
+        start = time.perf_counter()
+        expected, rejected = quality_loop(products)
+        loop_seconds = time.perf_counter() - start
+        print(f"   📦 {size:>11,} products: 03_loops loop {loop_seconds:6.2f}s  "
+              f"({size / loop_seconds / 1e6:.1f}M/s)")
+
+        for label, count in (("QualityFilter", 0), (f"{workers} workers", workers)):
+            start = time.perf_counter()
+            result = loop_filter.filter(products, workers=count)
+            seconds = time.perf_counter() - start
+            assert result.accepted == expected, f"{label} accepted different products"
+            assert sum(result.rejected.values()) == rejected
+            print(f"      🔬 {label:<14} {seconds:6.2f}s  speedup {loop_seconds / seconds:4.2f}x  "
+                  f"rejected {result.rejected}")
+            del result
+        del products, expected
+
+    size = min(sizes)
+    wide = QualityFilter(WIDE_RULES)
+    products = list(make_products(size))
+    start = time.perf_counter()
+    expected = [product for product in products if wide.reject_rule(product) is None]
+    one_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    result = wide.filter(products)
+    seconds = time.perf_counter() - start
+    assert result.accepted == expected, "The 20-rule filter accepted different products"
+    print(f"   📋 {len(WIDE_RULES)} rules, {size:,} products: one by one {one_seconds:6.2f}s, "
+          f"QualityFilter {seconds:6.2f}s  speedup {one_seconds / seconds:4.2f}x")
+    print()
+
+
+def main(argv=None):
+    """
+    Filter stdin (--rule), show the demo, or --benchmark.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="🔬 Reject defective products in bulk")
+    parser.add_argument("--rule", action="append", metavar="SPEC",
+                        help='reject rule, e.g. "bad", "prefix:test_" or "regex:_\\d{3}$"')
+    parser.add_argument("--workers", type=int, default=0, help="worker processes")
+    parser.add_argument("--benchmark", type=int, nargs="*", metavar="PRODUCTS",
+                        help="time against the 03_loops.py loop (default 1M and 50M)")
+    args = parser.parse_args(argv)
+
+    if args.benchmark is not None:
+        benchmark_filter(tuple(args.benchmark) or (1_000_000, 50_000_000))
+        return
+    if args.rule:
+        quality_filter = QualityFilter(args.rule)
+        products = (line.rstrip("\n") for line in sys.stdin)
+        checked = 0
+        totals = [0] * len(quality_filter.rules)
+        for size, accepted, counts in iter_filtered(quality_filter, products, workers=args.workers):
+            checked += size
+            totals = list(map(int.__add__, totals, counts))
+            sys.stdout.write("".join(product + "\n" for product in accepted))
+        for rule, count in zip(quality_filter.rules, totals):
+            print(f"{rule.name}: {count:,} of {checked:,} rejected", file=sys.stderr)
+        return
+
+    print("🔬 QUALITY CONTROL - Rejecting Millions of Items at Once")
+    print("=" * 40)
+    products = ["good_apple", "bad_apple", "good_banana", "rotten_orange", "good_grape",
+                "test_kiwi", "good_pear_9999", "fresh_plum"]
+    quality_filter = QualityFilter(["bad", "rotten", "prefix:test_", "regex:_9{4}$"])
+    print(f"📋 Rules: {[rule.name for rule in quality_filter.rules]}")
+    for product in products:
+        rule = quality_filter.reject_rule(product)
+        print(f"   {'❌' if rule else '✅'} {product:<15} {f'rejected by {rule!r}' if rule else ''}")
+    result = quality_filter.filter(products, chunk_size=3)
+    print(f"📊 Quality products: {result.accepted}")
+    print(f"📊 Rejected per rule: {result.rejected}")
+    result = quality_filter.filter(make_products(1_000_000), keep=False)
+    print(f"📦 {result.checked:,} generated products: {result.accepted:,} accepted, "
+          f"{sum(result.rejected.values()):,} rejected")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+REGULAR EXPRESSIONS IN PYTHON - Scanning Text Fast
+==================================================
+
+Regular expressions describe text patterns: "the word pizza", "a price like
+12.50", "an order id like ORD-0042". Python's re module finds them for you.
+
+ANALOGY: A kitchen inspector with a checklist
+- Pattern = One item on the checklist ("is there a price?")
+- re.compile() = Laminating the checklist so it is not rewritten each time
+- Pattern cache = A drawer of laminated checklists, oldest thrown out first
+- Multi-pattern scanner = Checking the whole list in ONE walk through the kitchen
+- finditer_file() = Inspecting a huge warehouse one aisle at a time
+
+WHAT THIS FILE COVERS:
+1. An LRU-bounded cache of compiled patterns
+2. Combining many patterns into one scan with named groups
+3. Streaming matches out of files bigger than memory
+"""
+
+import collections
+import math
+import os
+import re
+import sys
+import threading
+import time
+
+
+# ==========================================
+# 1. COMPILED PATTERN CACHE
+# ==========================================
+
+class PatternCache:
+    """
+    A size-limited cache of compiled regular expressions.
+
+    ANALOGY: A drawer that holds a fixed number of laminated
+    checklists. When it is full, the one used longest ago goes out.
+
+    re keeps its own small cache, but it is shared by the whole process
+    and cleared wholesale when full. This one has a size you choose,
+    evicts one pattern at a time and counts hits and misses.
+
+    Args:
+        maxsize (int): Most patterns kept at once (default 256)
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._patterns = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def compile(self, pattern, flags=0):
+        """
+        Return the compiled form of pattern, compiling it only once.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
+        """
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+        compiled = re.compile(pattern, flags)
+        with self._lock:
+            self.misses += 1
+            self._patterns[key] = compiled
+            if len(self._patterns) > self.maxsize:
+                self._patterns.popitem(last=False)  # Least recently used
+        return compiled
+
+
+_default_cache = PatternCache()
+
+def compile_cached(pattern, flags=0):
+    """Compile pattern through the module's shared PatternCache."""
+    return _default_cache.compile(pattern, flags)
+
+
+# ==========================================
+# 2. MULTI-PATTERN SCANNER - One walk, many checks
+# ==========================================
+
+class MultiPatternScanner:
+    """
+    Find many patterns in a single pass over the text.
+
+    ANALOGY: One inspector walking through the kitchen once with the
+    whole checklist, instead of walking through once per item.
+
+    The text is scanned once with all patterns joined into one
+    alternation, p0|p1|...|pN. That plain alternation keeps re's
+    shortcuts (shared prefixes, first-character sets), which is what
+    makes one pass fast. Only where something matched do we ask which
+    pattern it was: first which bucket of about sqrt(N) patterns, then
+    which pattern in that bucket, using named groups.
+
+    Like any alternation, it reports leftmost, non-overlapping matches:
+    when two patterns could match at the same place, the one listed
+    first wins. Patterns must not use numbered backreferences (\\1),
+    because their group numbers change inside the combined pattern.
+
+    Args:
+        patterns (dict or iterable): name -> pattern, or just patterns
+            (then each pattern is its own name)
+        flags (int): re flags for every pattern
+    """
+
+    def __init__(self, patterns, flags=0):
+        if not isinstance(patterns, dict):
+            patterns = {pattern: pattern for pattern in patterns}
+        if not patterns:
+            raise ValueError("MultiPatternScanner needs at least one pattern")
+        owners = {}  # Group name -> the pattern that uses it
+        for name, pattern in patterns.items():
+            for group in compile_cached(pattern, flags).groupindex:
+                if re.fullmatch(r"_[bp]\d+", group):
+                    raise ValueError(f"Group name {group!r} in {name!r} is reserved for the scanner")
+                if group in owners:
+                    raise ValueError(f"Group name {group!r} is used by both {owners[group]!r} "
+                                     f"and {name!r}; names must be unique across patterns")
+                owners[group] = name
+        self.names = list(patterns)
+        sources = [f"(?:{pattern})" for pattern in patterns.values()]
+        self.regex = compile_cached("|".join(sources), flags)
+
+        size = math.isqrt(max(len(sources) - 1, 0)) + 1
+        buckets = [range(first, min(first + size, len(sources)))
+                   for first in range(0, len(sources), size)]
+        self._bucket_regex = compile_cached("|".join(
+            f"(?P<_b{number}>{'|'.join(sources[index] for index in bucket)})"
+            for number, bucket in enumerate(buckets)
+        ), flags)
+        self._named_regexes = [
+            compile_cached("|".join(f"(?P<_p{index}>{sources[index]})" for index in bucket), flags)
+            for bucket in buckets
+        ]
+
+    def name_match(self, text, pos):
+        """
+        Re-match at pos to find out which pattern matched there.
+
+        Returns:
+            tuple: (name, match), where match covers the same text as
+            the combined regex's match at pos
+        """
+        bucket = int(self._bucket_regex.match(text, pos).lastgroup[2:])
+        match = self._named_regexes[bucket].match(text, pos)
+        return self.names[int(match.lastgroup[2:])], match
+
+    def finditer(self, text, pos=0):
+        """Yield (name, match) for every match in text."""
+        name_match = self.name_match
+        for match in self.regex.finditer(text, pos):
+            yield name_match(text, match.start())
+
+    def counts(self, text):
+        """
+        Count matches of each pattern in text.
+
+        Returns:
+            collections.Counter: name -> number of matches
+        """
+        return collections.Counter(name for name, _ in self.finditer(text))
+
+
+# ==========================================
+# 3. STREAMING MATCHES FROM BIG FILES
+# ==========================================
+
+def finditer_file(path, pattern, chunk_size=1 << 20, max_match=4096, encoding="utf-8"):
+    """
+    Yield (offset, match) for every match in a file, reading it in chunks.
+
+    ANALOGY: Inspecting a warehouse aisle by aisle, but keeping the end
+    of the last aisle in view so nothing on the border is missed.
+
+    A match can start in one chunk and end in the next. So the last
+    max_match characters of each chunk (or the match that was still
+    growing) are carried over and scanned again together with the next
+    chunk. Matches must be at most max_match characters long.
+
+    Up to max_match characters before the carried text are kept too, and
+    scanning starts after them, so \\b, ^ and lookbehinds see the text
+    that really comes before a match instead of a chunk boundary. An
+    empty match found right at the end of one pass is found again at the
+    start of the next, so it is only yielded once.
+
+    Args:
+        path (str): Text file to scan
+        pattern: A pattern string, compiled pattern or MultiPatternScanner
+            (pass a scanner's matches to scanner.name_match to name them)
+        chunk_size (int): Characters read at a time (default 1 Mi)
+        max_match (int): Longest possible match in characters (default 4096)
+        encoding (str): File encoding (default utf-8)
+
+    Yields:
+        tuple: (offset, match) - offset + match.start() is the position
+        of the match in the whole file
+    """
+    regex = getattr(pattern, "regex", pattern)
+    if isinstance(regex, str):
+        regex = compile_cached(regex)
+
+    with open(path, encoding=encoding, newline="") as file:
+        buffer, offset = "", 0  # offset = position of buffer[0] in the file
+        pos = 0  # Where scanning starts; buffer[:pos] is only context
+        last_empty = -1  # File position of the last empty match yielded
+        while True:
+            chunk = file.read(chunk_size)
+            buffer += chunk
+            at_end = not chunk
+            safe = len(buffer) if at_end else len(buffer) - max_match
+            carry_from = max(safe, pos)
+            for match in regex.finditer(buffer, pos):
+                if not at_end and match.end() > safe:
+                    # It might grow (or only exist) once more text arrives
+                    carry_from = min(match.start(), carry_from)
+                    break
+                start = match.start()
+                if start == match.end():
+                    if offset + start == last_empty:
+                        continue  # Already yielded at the end of the last pass
+                    last_empty = offset + start
+                yield offset, match
+                carry_from = max(carry_from, match.end())
+            if at_end:
+                return
+            keep_from = max(carry_from - max_match, 0)
+            buffer = buffer[keep_from:]
+            offset += keep_from
+            pos = carry_from - keep_from
+
+
+# ==========================================
+# BENCHMARK - One walk vs 200 walks
+# ==========================================
+
+def _benchmark_patterns(count):
+    return {f"code_{n}": rf"E{n:03d}-\d{{4}}" for n in range(count)}
+
+
+def write_synthetic_log(path, size_mb):
+    """Write log lines with error codes until the file is about size_mb megabytes."""
+    block = "".join(
+        f"2024-05-01T12:{n % 60:02d}:00Z order={n} status=ok note=E{n % 250:03d}-{n % 10_000:04d} table {n % 40}\n"
+        for n in range(50_000)
+    )
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(max(1, size_mb * (1 << 20) // len(block))):
+            file.write(block)
+
+
+def benchmark_scanner(size_mb=500, pattern_count=200):
+    """
+    Compare scanning a log once per pattern with one combined scan.
+
+    Args:
+        size_mb (int): Size of the synthetic log (default 500 MB)
+        pattern_count (int): Number of patterns (default 200)
+    """
+    import tempfile
+
+    patterns = _benchmark_patterns(pattern_count)
+    compiled = [re.compile(pattern) for pattern in patterns.values()]
+    scanner = MultiPatternScanner(patterns)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "orders.log")
+        write_synthetic_log(path, size_mb)
+        megabytes = os.path.getsize(path) / (1 << 20)
+        print(f"⏱️ {pattern_count} patterns over a {megabytes:,.0f} MB log:")
+
+        start = time.perf_counter()
+        separate = 0
+        with open(path, encoding="utf-8") as file:
+            while lines := file.readlines(1 << 20):
+                text = "".join(lines)
+                separate += sum(sum(1 for _ in regex.finditer(text)) for regex in compiled)
+        separate_seconds = time.perf_counter() - start
+        print(f"   🐢 One scan per pattern: {separate_seconds:.2f}s ({separate:,} matches)")
+
+        start = time.perf_counter()
+        combined = collections.Counter(
+            scanner.name_match(match.string, match.start())[0]
+            for _, match in finditer_file(path, scanner, max_match=64)
+        ).total()
+        combined_seconds = time.perf_counter() - start
+        print(f"   🚀 Combined scanner:     {combined_seconds:.2f}s ({combined:,} matches)")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the cache and scanners, or run the benchmark with --benchmark [size_mb].
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    import tempfile
+
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        rest = argv[argv.index("--benchmark") + 1:]
+        benchmark_scanner(int(rest[0]) if rest else 500)
+        return
+
+    print("🔍 REGULAR EXPRESSIONS - Scanning Text Fast")
+    print("=" * 40)
+
+    cache = PatternCache(maxsize=2)
+    for pattern in (r"\d+", r"pizza", r"\d+", r"pasta", r"pizza"):
+        cache.compile(pattern)
+    print(f"🗄️ Pattern cache: {len(cache)} kept, {cache.hits} hits, {cache.misses} misses")
+
+    scanner = MultiPatternScanner({
+        "price": r"\$\d+\.\d{2}",
+        "order_id": r"ORD-\d{4}",
+        "allergy": r"\b(?:nuts|gluten|dairy)\b",
+    })
+    note = "ORD-0042: pizza $18.99, no nuts please. ORD-0043: salad $8.50, dairy free"
+    print(f"📝 Order note: {note}")
+    for name, match in scanner.finditer(note):
+        print(f"   ✅ {name}: {match.group()}")
+    print(f"📊 Counts: {dict(scanner.counts(note))}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "notes.log")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(note)
+        # Tiny chunks force matches to cross chunk boundaries
+        found = [(offset + match.start(), scanner.name_match(match.string, match.start())[0])
+                 for offset, match in finditer_file(path, scanner, chunk_size=7, max_match=16)]
+        print(f"📂 Found in file (7-character chunks): {found}")
+
+        # Matches found chunk by chunk must be exactly the ones re.finditer finds
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("12 pizzas\nxx 3 pasta\n\nxxx salad 45\n")
+        same = all(
+            [(offset + match.start(), match.group())
+             for offset, match in finditer_file(path, pattern, chunk_size=4, max_match=2)]
+            == [(match.start(), match.group())
+                for match in re.finditer(pattern, "12 pizzas\nxx 3 pasta\n\nxxx salad 45\n")]
+            for pattern in (r"(?m)^", r"(?m)$", r"\b", r"x*", r"\d*", r"\w+")
+        )
+        print(f"🧪 Same matches as re.finditer in 4-character chunks: {same}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+STRING OPERATIONS IN PYTHON - Building and Cleaning Text in Bulk
+================================================================
+
+Strings never change once made: every + or .replace() builds a brand-new
+string. One dish name costs nothing, but ten million of them - each
+replaced, title-cased and glued together - add up to a lot of copies.
+
+ANALOGY: The menu printer
+- String concatenation = Retyping the whole menu for every new line
+- StringBuilder = A notepad you keep writing on, copied out once at the end
+- str.translate table = A stencil that fixes every letter in one sweep
+- Bulk normalizing = Running the whole stack of menus through the stencil at once
+- Interning = One laminated card per dish name, shared by every order
+
+WHAT THIS FILE COVERS:
+1. StringBuilder: a reusable io.StringIO-backed builder
+2. Bulk normalizers: display names and lookup keys for whole batches
+3. DishNameCache: one shared string (and its display form) per distinct name
+"""
+
+import io
+import sys
+import time
+
+# 03_loops.py prints dish.replace('_', ' ').title() for every dish
+DISPLAY_TABLE = str.maketrans("_", " ")
+# Lookup keys: spaces and hyphens become underscores ("Ice Cream" -> "ice_cream")
+KEY_TABLE = str.maketrans(" -", "__")
+
+_SEPARATOR = "\n"  # Joins a batch; it is not a letter, so title() treats it as a word break
+
+
+# ==========================================
+# 1. STRING BUILDER - One notepad, copied out once
+# ==========================================
+
+class StringBuilder:
+    """
+    Collect many small pieces of text and join them once at the end.
+
+    ANALOGY: Writing each menu line on one notepad instead of retyping
+    the whole menu every time a line is added.
+
+    Backed by io.StringIO, which grows a single buffer. clear() empties
+    it for reuse, so a loop can keep one builder instead of making a
+    new one per row.
+
+    Example:
+        >>> builder = StringBuilder()
+        >>> builder.append("penne", "_with_").join(["basil", "garlic"], "_").getvalue()
+        'penne_with_basil_garlic'
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._write = self._buffer.write
+
+    def append(self, *parts):
+        """Add pieces of text to the end; returns the builder for chaining."""
+        write = self._write
+        for part in parts:
+            write(part)
+        return self
+
+    def join(self, parts, separator=""):
+        """Add parts with separator between them, like separator.join(parts)."""
+        write = self._write
+        first = True
+        for part in parts:
+            if not first:
+                write(separator)
+            write(part)
+            first = False
+        return self
+
+    def getvalue(self):
+        """The text built so far."""
+        return self._buffer.getvalue()
+
+    def clear(self):
+        """Empty the builder so it can be reused."""
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return self
+
+    def __len__(self):
+        return self._buffer.tell()
+
+    def __str__(self):
+        return self.getvalue()
+
+
+def write_dish_names(dishes, builder=None, end="\n"):
+    """
+    Write "pasta_with_sauce_and_veg1_veg2" lines, like assemble_pasta().
+
+    ANALOGY: Printing the day's whole order list on one roll of paper
+    instead of keeping a separate slip per dish.
+
+    Every line goes into one builder. Compare text += line on an
+    object's attribute or a dict value: CPython can only grow a string
+    in place when nothing else refers to it, so there each += copies
+    the whole text so far and building it gets slower with every line.
+
+    Args:
+        dishes (iterable): (pasta_type, sauce, vegetables) tuples
+        builder (StringBuilder): Builder to write into (default: a new one)
+        end (str): Written after each name (default newline)
+
+    Returns:
+        StringBuilder: The builder, for more writing or getvalue()
+    """
+    builder = StringBuilder() if builder is None else builder
+    write = builder._write
+    for pasta_type, sauce, vegetables in dishes:
+        write(f"{pasta_type}_with_{sauce}_and_{'_'.join(vegetables)}{end}")
+    return builder
+
+
+# ==========================================
+# 2. BULK NORMALIZERS - The whole stack through the stencil
+# ==========================================
+
+def _bulk(names, transform):
+    """
+    Apply transform to every name, doing the work once per distinct name.
+
+    The distinct names are joined into one string, transformed with one
+    call each to translate()/title()/casefold() and split again; then
+    every name is looked up in the result. Batches of repeated dish
+    names only pay for the few distinct ones.
+
+    Names containing the separator would split wrongly, so those
+    batches fall back to one name at a time.
+    """
+    names = names if isinstance(names, list) else list(names)
+    distinct = list(dict.fromkeys(names))
+    joined = _SEPARATOR.join(distinct)
+    if joined.count(_SEPARATOR) != max(len(distinct) - 1, 0):
+        converted = [transform(name) for name in distinct]
+    else:
+        converted = transform(joined).split(_SEPARATOR) if distinct else []
+    if len(distinct) == len(names):
+        return converted
+    return list(map(dict(zip(distinct, converted)).__getitem__, names))
+
+
+def display_names(names):
+    """
+    Turn "ice_cream" into "Ice Cream" for a whole batch of dish names.
+
+    ANALOGY: 03_loops.py runs each dish through .replace() then
+    .title(). This stencils each distinct dish once and reuses it.
+
+    Returns:
+        list: Display names, in the same order
+    """
+    return _bulk(names, lambda text: text.translate(DISPLAY_TABLE).title())
+
+
+def key_names(names):
+    """
+    Turn "Ice Cream" or "ice-cream" into "ice_cream" for a whole batch.
+
+    casefold() is a stronger lower() that also handles letters like
+    the German "ß", so keys match however a name was typed.
+
+    Returns:
+        list: Lookup keys, in the same order
+    """
+    return _bulk(names, lambda text: text.casefold().translate(KEY_TABLE))
+
+
+# ==========================================
+# 3. INTERNING CACHE - One card per dish name
+# ==========================================
+
+class DishNameCache:
+    """
+    Hand out one shared string per distinct dish name.
+
+    ANALOGY: Instead of writing "spaghetti carbonara" on every order
+    slip, the kitchen keeps one laminated card per dish and clips it to
+    each slip.
+
+    Names read from files or the network are new string objects every
+    time, even when the text repeats. Passing them through the cache
+    keeps one copy per distinct name, so ten million orders of forty
+    dishes hold forty strings, not ten million. display() also caches
+    each name's display form.
+
+    Unlike sys.intern(), the cache can be cleared, and it is limited to
+    maxsize names (it is emptied when full).
+
+    Args:
+        maxsize (int): Most distinct names kept (default 100,000)
+    """
+
+    def __init__(self, maxsize=100_000):
+        self.maxsize = maxsize
+        self._names = {}
+        self._display = {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def _make_room(self, table):
+        if len(table) >= self.maxsize:
+            table.clear()
+
+    def intern(self, name):
+        """Return the shared copy of name."""
+        shared = self._names.get(name)
+        if shared is None:
+            self._make_room(self._names)
+            shared = self._names.setdefault(name, name)
+        return shared
+
+    def intern_many(self, names):
+        """
+        Return the shared copy of every name in a batch.
+
+        Returns:
+            list: Shared names, in the same order
+        """
+        names = names if isinstance(names, list) else list(names)
+        if len(self._names) + len(names) <= self.maxsize:
+            # Even if every name is new the cache stays in bounds
+            return list(map(self._names.setdefault, names, names))
+        return list(map(self.intern, names))
+
+    def display(self, name):
+        """The display form of name ("ice_cream" -> "Ice Cream"), made once per name."""
+        shown = self._display.get(name)
+        if shown is None:
+            self._make_room(self._display)
+            shown = self._display[name] = name.translate(DISPLAY_TABLE).title()
+        return shown
+
+    def display_many(self, names):
+        """Display forms for a batch; only names not seen before are converted."""
+        names = names if isinstance(names, list) else list(names)
+        cached = self._display
+        new = [name for name in dict.fromkeys(names) if name not in cached]
+        if len(cached) + len(new) > self.maxsize:
+            cached.clear()
+            new = list(dict.fromkeys(names))  # Names seen before were cleared too
+        fresh = dict(zip(new, display_names(new)))
+        if len(cached) + len(fresh) <= self.maxsize:
+            cached.update(fresh)
+            fresh = cached
+        # else: more distinct names than the cache holds, so none are kept
+        return list(map(fresh.__getitem__, names))
+
+    def clear(self):
+        """Forget every name."""
+        self._names.clear()
+        self._display.clear()
+
+
+# ==========================================
+# BENCHMARK - 10 million dish names
+# ==========================================
+
+def benchmark_strings(count=10_000_000):
+    """
+    Time and measure display names and interning on count dish names.
+
+    The names are decoded from bytes, as they would be when read from
+    a file, so each one is its own string object.
+
+    Args:
+        count (int): Number of dish names (default 10M)
+    """
+    import tracemalloc
+
+    menu = ["soup", "salad", "breadsticks", "pasta", "steak", "fish", "cake", "ice_cream",
+            "fruit", "garlic_bread", "spaghetti_carbonara", "penne_arrabbiata"]
+    raw = "\n".join(menu[n % len(menu)] for n in range(count)).encode()
+
+    def read_names():
+        return raw.decode().split("\n")
+
+    def timed(label, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        print(f"   🔤 {label:<30}: {time.perf_counter() - start:6.2f}s")
+        return result
+
+    print(f"⏱️ {count:,} dish names ({len(menu)} distinct):")
+    names = read_names()
+    per_dish = timed("replace().title() per dish", lambda: [n.replace("_", " ").title() for n in names])
+    bulk = timed("display_names (bulk)", display_names, names)
+    cache = DishNameCache()
+    cached = timed("DishNameCache.display_many", cache.display_many, names)
+    assert per_dish == bulk == cached
+    del per_dish, bulk, cached
+
+    pieces = [(name, "tomato", ("basil", "garlic")) for name in names[:1_000_000]]
+    timed("write_dish_names (1M lines)", lambda: write_dish_names(pieces).getvalue())
+
+    class Receipt:
+        text = ""
+
+    def append_to_attribute(rows):
+        receipt = Receipt()
+        for pasta_type, sauce, vegetables in rows:
+            receipt.text += f"{pasta_type}_with_{sauce}_and_{'_'.join(vegetables)}\n"
+        return receipt.text
+
+    for size in (10_000, 40_000):
+        timed(f"text += on an attribute ({size // 1000}k)", append_to_attribute, pieces[:size])
+    del pieces
+
+    def text_held(make):
+        """Bytes allocated by the strings that make() returns, beyond the list."""
+        tracemalloc.start()
+        result = make()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, current - sys.getsizeof(result)
+
+    del names
+    names, plain_bytes = text_held(read_names)
+    del names
+    interned, interned_bytes = text_held(lambda: DishNameCache().intern_many(read_names()))
+    print(f"   💾 names as read:     {plain_bytes / 1e6:8.1f} MB of strings")
+    print(f"   💾 interned names:    {interned_bytes / 1e6:8.1f} MB of strings "
+          f"({len(set(map(id, interned)))} distinct objects)")
+    print()
+
+
+def main(argv=None):
+    """
+    Demo the string tools, or run the benchmark with --benchmark [count].
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "--benchmark" in argv:
+        rest = argv[argv.index("--benchmark") + 1:]
+        benchmark_strings(int(rest[0]) if rest else 10_000_000)
+        return
+
+    print("🔤 STRING OPERATIONS - Building and Cleaning Text in Bulk")
+    print("=" * 40)
+    builder = StringBuilder()
+    builder.append("🍝 ", "penne").append("_with_", "tomato_sauce", "_and_").join(["basil", "garlic"], "_")
+    print(f"📝 Built: {builder} ({len(builder)} characters)")
+    orders = [("fusilli", "pesto", ["pine_nuts", "basil"]), ("penne", "tomato", ["olives"])]
+    print(f"🍽️ Order list: {write_dish_names(orders, end='; ').getvalue()}")
+
+    dishes = ["ice_cream", "garlic_bread", "spaghetti_carbonara", "ice_cream"]
+    print(f"📋 Display names: {display_names(dishes)}")
+    print(f"🔑 Lookup keys:   {key_names(['Ice Cream', 'GARLIC-BREAD', 'Straße Salad'])}")
+
+    cache = DishNameCache()
+    orders = [bytes(name, "utf-8").decode() for name in dishes]  # Fresh objects, as if read from a file
+    shared = cache.intern_many(orders)
+    print(f"🏷️ {len(orders)} orders, {len(set(map(id, orders)))} string objects -> "
+          f"{len(set(map(id, shared)))} after interning")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+TASK MANAGER - The Week 1 Capstone CLI
+======================================
+
+A command line to-do list that remembers tasks between runs and stays
+fast with hundreds of thousands of tasks.
+
+ANALOGY: A restaurant order book
+- Append-only log = Writing every change on a new line, never erasing
+- Index = A bookmark list: "order #42 is on page 7"
+- Compaction = Copying the open orders into a fresh book
+- Snapshot = A photo of the bookmark list, so nobody re-reads the whole book
+
+HOW IT IS STORED:
+- tasks.jsonl       one JSON record per line: add, done, delete (or next,
+                    the highest id so far, at the top of a compacted log)
+- tasks.jsonl.idx   snapshot of the in-memory index (written on close)
+
+Adding, completing and deleting a task each append one line, so they cost
+the same whether there are ten tasks or a million. On start the index is
+loaded from the snapshot and only the lines written after it are replayed.
+
+USAGE:
+    python week1_cli/task_manager.py add "Buy flour"
+    python week1_cli/task_manager.py list
+    python week1_cli/task_manager.py done 1
+    python week1_cli/task_manager.py delete 1
+    python week1_cli/task_manager.py compact
+    python week1_cli/task_manager.py --benchmark
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from datetime import datetime
+
+DEFAULT_TASK_FILE = "tasks.jsonl"
+
+_DELETED = -1  # Offset stored for a task that no longer exists
+_SNAPSHOT_HEADER = array("q", [0, 0])  # (log size covered, number of ids)
+
+
+class TaskStore:
+    """
+    Tasks kept in an append-only JSON-lines log with an in-memory index.
+
+    ANALOGY: The order book plus the waiter's bookmark list. Finding
+    order #42 means jumping straight to its page, not reading the book.
+
+    Task ids are 1, 2, 3, ... and are never reused. The index is two
+    compact arrays: the byte offset of each task's line in the log, and
+    a done flag per task - about 9 bytes per task instead of a dict.
+
+    Args:
+        path (str): Log file to use (created if missing)
+        compact_ratio (int): Compact once the log has this many lines
+            per live task (default 2)
+        compact_min (int): Never auto-compact smaller logs (default 1000)
+    """
+
+    def __init__(self, path=DEFAULT_TASK_FILE, compact_ratio=2, compact_min=1000):
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self._offsets = array("q")
+        self._done = bytearray()
+        self._live = 0
+        self._records = 0
+        self._load()
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._size = self._writer.tell()
+
+    # ------------------------------------------
+    # Loading: snapshot first, then replay the rest of the log
+    # ------------------------------------------
+
+    @property
+    def _snapshot_path(self):
+        return self.path + ".idx"
+
+    def _load(self):
+        start = self._load_snapshot()
+        if not os.path.exists(self.path):
+            return
+        torn = False
+        with open(self.path, "rb") as log:
+            log.seek(start)
+            offset = start
+            for line in log:
+                if not line.endswith(b"\n"):
+                    torn = True  # A crash cut the last write short
+                    break
+                self._apply(json.loads(line), offset)
+                offset += len(line)
+        if torn:
+            # Drop the half-written record, so the next append starts on a fresh line
+            with open(self.path, "r+b") as log:
+                log.truncate(offset)
+
+    def _load_snapshot(self):
+        """Load the index snapshot and return the log offset it covers (0 if none)."""
+        try:
+            with open(self._snapshot_path, "rb") as snapshot:
+                header = array("q")
+                header.fromfile(snapshot, len(_SNAPSHOT_HEADER))
+                covered, count = header
+                offsets = array("q")
+                offsets.fromfile(snapshot, count)
+                done = bytearray(snapshot.read(count))
+                stats = array("q")
+                stats.fromfile(snapshot, 2)
+        except (OSError, EOFError):
+            return 0
+        # A snapshot for a log that has since shrunk (or vanished) is stale
+        if len(done) != count or not os.path.exists(self.path) or os.path.getsize(self.path) < covered:
+            return 0
+        self._offsets, self._done = offsets, done
+        self._live, self._records = stats
+        return covered
+
+    def _apply(self, record, offset):
+        """Update the index for one log record found at offset."""
+        self._records += 1
+        task_id = record["id"]
+        op = record["op"]
+        if op == "add":
+            # ids only grow, so an add always extends the index by one
+            while len(self._offsets) < task_id:
+                self._offsets.append(_DELETED)
+                self._done.append(0)
+            self._offsets[task_id - 1] = offset
+            self._done[task_id - 1] = record.get("done", False)
+            self._live += 1
+        elif op == "done":
+            self._done[task_id - 1] = 1
+        elif op == "delete":
+            self._offsets[task_id - 1] = _DELETED
+            self._live -= 1
+        elif op == "next":
+            # Written by compact(): every id up to here was handed out already
+            while len(self._offsets) < task_id:
+                self._offsets.append(_DELETED)
+                self._done.append(0)
+
+    def _write_snapshot(self):
+        self._writer.flush()
+        header = array("q", [self._size, len(self._offsets)])
+        temporary = self._snapshot_path + ".tmp"
+        with open(temporary, "wb") as snapshot:
+            header.tofile(snapshot)
+            self._offsets.tofile(snapshot)
+            snapshot.write(self._done)
+            array("q", [self._live, self._records]).tofile(snapshot)
+        os.replace(temporary, self._snapshot_path)
+
+    # ------------------------------------------
+    # Writing: every change is one appended line
+    # ------------------------------------------
+
+    def _append(self, record):
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        offset = self._size
+        self._writer.write(line)
+        self._size += len(line)
+        self._records += 1
+        return offset
+
+    def _check(self, task_id):
+        if not 1 <= task_id <= len(self._offsets) or self._offsets[task_id - 1] == _DELETED:
+            raise KeyError(task_id)
+
+    def add(self, title):
+        """
+        Add a new task.
+
+        Returns:
+            int: The new task's id
+        """
+        task_id = len(self._offsets) + 1
+        created = datetime.now().isoformat(timespec="seconds")
+        offset = self._append({"op": "add", "id": task_id, "title": title, "created": created})
+        self._offsets.append(offset)
+        self._done.append(0)
+        self._live += 1
+        return task_id
+
+    def complete(self, task_id):
+        """
+        Mark a task as done.
+
+        Raises:
+            KeyError: If there is no task with this id
+        """
+        self._check(task_id)
+        if not self._done[task_id - 1]:
+            self._append({"op": "done", "id": task_id})
+            self._done[task_id - 1] = 1
+            self._maybe_compact()
+
+    def delete(self, task_id):
+        """
+        Delete a task.
+
+        Raises:
+            KeyError: If there is no task with this id
+        """
+        self._check(task_id)
+        self._append({"op": "delete", "id": task_id})
+        self._offsets[task_id - 1] = _DELETED
+        self._live -= 1
+        self._maybe_compact()
+
+    # ------------------------------------------
+    # Reading
+    # ------------------------------------------
+
+    def __len__(self):
+        return self._live
+
+    def __contains__(self, task_id):
+        return 1 <= task_id <= len(self._offsets) and self._offsets[task_id - 1] != _DELETED
+
+    def get(self, task_id):
+        """
+        Read one task.
+
+        Returns:
+            dict: id, title, created and done
+
+        Raises:
+            KeyError: If there is no task with this id
+        """
+        self._check(task_id)
+        self._writer.flush()
+        self._reader.seek(self._offsets[task_id - 1])
+        record = json.loads(self._reader.readline())
+        return {"id": task_id, "title": record["title"], "created": record["created"],
+                "done": bool(self._done[task_id - 1])}
+
+    def tasks(self, include_done=True):
+        """Yield every live task in id order, one at a time."""
+        for task_id in range(1, len(self._offsets) + 1):
+            if self._offsets[task_id - 1] == _DELETED:
+                continue
+            if include_done or not self._done[task_id - 1]:
+                yield self.get(task_id)
+
+    # ------------------------------------------
+    # Compaction and closing
+    # ------------------------------------------
+
+    def _maybe_compact(self):
+        if self._records >= self.compact_min and self._records > self.compact_ratio * self._live:
+            self.compact()
+
+    def compact(self):
+        """
+        Rewrite the log with one line per live task.
+
+        ANALOGY: Copying the open orders into a fresh order book and
+        throwing away the old one full of crossed-out lines.
+
+        The fresh log starts with a "next" record holding the highest id
+        handed out so far, so ids of deleted tasks are not reused even
+        when the log is replayed without a snapshot.
+        """
+        self._writer.flush()
+        temporary = self.path + ".tmp"
+        offsets = array("q", [_DELETED]) * len(self._offsets)
+        size = 0
+        records = self._live
+        with open(temporary, "wb") as fresh:
+            if self._offsets:
+                line = json.dumps({"op": "next", "id": len(self._offsets)},
+                                  separators=(",", ":")).encode("utf-8") + b"\n"
+                fresh.write(line)
+                size += len(line)
+                records += 1
+            for task in self.tasks():
+                record = {"op": "add", "id": task["id"], "title": task["title"],
+                          "created": task["created"], "done": task["done"]}
+                line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                offsets[task["id"] - 1] = size
+                fresh.write(line)
+                size += len(line)
+        self._writer.close()
+        self._reader.close()
+        # Remove the old snapshot first: it describes the log being replaced
+        if os.path.exists(self._snapshot_path):
+            os.remove(self._snapshot_path)
+        os.replace(temporary, self.path)
+        self._offsets, self._size, self._records = offsets, size, records
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._write_snapshot()
+
+    def close(self):
+        """Flush the log and save the index snapshot for a fast next start."""
+        if self._writer.closed:
+            return
+        self._write_snapshot()
+        self._writer.close()
+        self._reader.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ==========================================
+# BENCHMARK - Does startup stay flat?
+# ==========================================
+
+def benchmark_task_store(counts=(10_000, 100_000, 1_000_000)):
+    """
+    Time adding tasks, then reopening the store with and without a snapshot.
+
+    Args:
+        counts (tuple): Task counts to test
+    """
+    import tempfile
+    import tracemalloc
+
+    print("⏱️ TaskStore startup:")
+    with tempfile.TemporaryDirectory() as folder:
+        for count in counts:
+            path = os.path.join(folder, f"tasks_{count}.jsonl")
+            start = time.perf_counter()
+            with TaskStore(path) as store:
+                for n in range(count):
+                    store.add(f"Task number {n}")
+            add_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            tracemalloc.start()
+            with TaskStore(path) as store:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                snapshot_seconds = time.perf_counter() - start
+                store.complete(count // 2)
+                store.delete(1)
+
+            os.remove(path + ".idx")
+            start = time.perf_counter()
+            TaskStore(path).close()
+            replay_seconds = time.perf_counter() - start
+
+            print(f"   📋 {count:>9,} tasks: add {add_seconds:.2f}s, "
+                  f"open {snapshot_seconds * 1000:.1f} ms ({peak / 1e6:.1f} MB), "
+                  f"open without snapshot {replay_seconds:.2f}s")
+    print()
+
+
+# ==========================================
+# COMMAND LINE
+# ==========================================
+
+def main(argv=None):
+    """
+    Run the task manager command line.
+
+    Args:
+        argv (list): Command line arguments (default sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="📝 Week 1 task manager")
+    parser.add_argument("--file", default=DEFAULT_TASK_FILE, help="task log file")
+    parser.add_argument("--benchmark", action="store_true", help="time startup at 10k-1M tasks")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("add", help="add a task").add_argument("title")
+    listing = commands.add_parser("list", help="show tasks")
+    listing.add_argument("--all", action="store_true", help="include finished tasks")
+    commands.add_parser("done", help="mark a task as done").add_argument("id", type=int)
+    commands.add_parser("delete", help="delete a task").add_argument("id", type=int)
+    commands.add_parser("compact", help="rewrite the log without old lines")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_task_store()
+        return
+    if args.command is None:
+        parser.print_help()
+        return
+
+    with TaskStore(args.file) as store:
+        try:
+            if args.command == "add":
+                print(f"✅ Added task {store.add(args.title)}")
+            elif args.command == "list":
+                for task in store.tasks(include_done=args.all):
+                    mark = "✅" if task["done"] else "⬜"
+                    print(f"{mark} {task['id']:>5}  {task['title']}")
+                print(f"📊 {len(store)} tasks")
+            elif args.command == "done":
+                store.complete(args.id)
+                print(f"✅ Task {args.id} done")
+            elif args.command == "delete":
+                store.delete(args.id)
+                print(f"🗑️ Task {args.id} deleted")
+            elif args.command == "compact":
+                store.compact()
+                print(f"🧹 Log compacted to {len(store)} tasks")
+        except KeyError:
+            print(f"❌ No task with id {args.id}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()